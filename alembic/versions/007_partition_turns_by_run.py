@@ -0,0 +1,61 @@
+"""Hash-partition turns by run_id.
+
+Every turn query filters on a single run_id, so with hash partitioning the
+planner prunes to one partition and its (much smaller) indexes.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: None = None
+depends_on: None = None
+
+NUM_PARTITIONS = 16
+
+
+def upgrade() -> None:
+    # 1. Partitioned copy of turns (same columns, defaults incl. the id sequence)
+    op.execute(
+        "CREATE TABLE turns_partitioned (LIKE turns INCLUDING DEFAULTS) PARTITION BY HASH (run_id)"
+    )
+    for remainder in range(NUM_PARTITIONS):
+        op.execute(
+            f"CREATE TABLE turns_p{remainder} PARTITION OF turns_partitioned "
+            f"FOR VALUES WITH (MODULUS {NUM_PARTITIONS}, REMAINDER {remainder})"
+        )
+
+    # 2. Move existing rows, keep the id sequence alive, swap tables
+    op.execute("INSERT INTO turns_partitioned SELECT * FROM turns")
+    op.execute("ALTER SEQUENCE turns_id_seq OWNED BY turns_partitioned.id")
+    op.execute("DROP TABLE turns")
+    op.execute("ALTER TABLE turns_partitioned RENAME TO turns")
+
+    # 3. Constraints and indexes (the partition key must be part of the PK)
+    op.execute("ALTER TABLE turns ADD CONSTRAINT turns_pkey PRIMARY KEY (id, run_id)")
+    op.execute(
+        "ALTER TABLE turns ADD CONSTRAINT turns_run_id_fkey "
+        "FOREIGN KEY (run_id) REFERENCES runs (run_id)"
+    )
+    op.create_index("idx_turns_run", "turns", ["run_id", "turn_number"])
+    op.create_index("idx_turns_run_turn", "turns", ["run_id", "turn_number"], unique=True)
+
+
+def downgrade() -> None:
+    op.execute("CREATE TABLE turns_unpartitioned (LIKE turns INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO turns_unpartitioned SELECT * FROM turns")
+    op.execute("ALTER SEQUENCE turns_id_seq OWNED BY turns_unpartitioned.id")
+    op.execute("DROP TABLE turns")  # drops all partitions
+    op.execute("ALTER TABLE turns_unpartitioned RENAME TO turns")
+
+    op.execute("ALTER TABLE turns ADD CONSTRAINT turns_pkey PRIMARY KEY (id)")
+    op.execute(
+        "ALTER TABLE turns ADD CONSTRAINT turns_run_id_fkey "
+        "FOREIGN KEY (run_id) REFERENCES runs (run_id)"
+    )
+    op.create_index("idx_turns_run", "turns", ["run_id", "turn_number"])
+    op.create_index("idx_turns_run_turn", "turns", ["run_id", "turn_number"], unique=True)
@@ -0,0 +1,27 @@
+"""Backfill runs.total_agent_turns from turns.
+
+save_turn now increments runs.total_agent_turns and count_turns reads it,
+so existing rows must match the real turn count.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: None = None
+depends_on: None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE runs SET total_agent_turns = "
+        "(SELECT COUNT(*) FROM turns WHERE turns.run_id = runs.run_id)"
+    )
+
+
+def downgrade() -> None:
+    pass
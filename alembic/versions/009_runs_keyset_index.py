@@ -0,0 +1,27 @@
+"""Extend idx_runs_started with id for keyset pagination.
+
+list_runs pages on (started_at, id), so the index covers both columns.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: None = None
+depends_on: None = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_runs_started", table_name="runs")
+    op.create_index("idx_runs_started", "runs", [sa.text("started_at DESC"), sa.text("id DESC")])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_runs_started", table_name="runs")
+    op.create_index("idx_runs_started", "runs", [sa.text("started_at DESC")])
@@ -0,0 +1,46 @@
+"""Materialized view for the model leaderboard.
+
+/leaderboard used to aggregate every run (plus peak stats from turns) per
+request. The view is refreshed concurrently when runs finish; the unique
+index on model is required for REFRESH ... CONCURRENTLY.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: None = None
+depends_on: None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW model_leaderboard AS
+        SELECT r.model,
+               MAX(GREATEST(r.final_score, COALESCE(p.peak_score, 0))) AS best_score,
+               ROUND(AVG(GREATEST(r.final_score, COALESCE(p.peak_score, 0))))::integer
+                   AS avg_score,
+               MAX(GREATEST(r.final_depth, COALESCE(p.peak_depth, 0))) AS best_depth,
+               COUNT(*) AS run_count
+        FROM runs r
+        LEFT JOIN (
+            SELECT run_id,
+                   MAX(score) AS peak_score,
+                   MAX(GREATEST(depth, dungeon_level)) AS peak_depth
+            FROM turns
+            GROUP BY run_id
+        ) p ON p.run_id = r.run_id
+        WHERE r.status != 'running' AND r.model != ''
+        GROUP BY r.model
+        """
+    )
+    op.execute("CREATE UNIQUE INDEX idx_model_leaderboard_model ON model_leaderboard (model)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS model_leaderboard")
@@ -35,7 +35,7 @@ export const api = {
   listRuns: (params: ListRunsParams = {}) =>
     fetchJson<RunRecord[]>(ENDPOINTS.runs, {
       limit: params.limit ?? 50,
-      offset: params.offset ?? 0,
+      ...(params.cursor ? { cursor: params.cursor } : {}),
       ...(params.sort_by ? { sort_by: params.sort_by } : {}),
       ...(params.model ? { model: params.model } : {}),
       ...(params.user_id !== undefined ? { user_id: params.user_id } : {}),
@@ -101,7 +101,7 @@ export interface ModelInfo {
 
 export interface ListRunsParams {
   limit?: number;
-  offset?: number;
+  cursor?: string; // X-Next-Cursor header from the previous page; only valid with the same sort_by
   sort_by?: "recent" | "score" | "depth";
   model?: string;
   user_id?: number;
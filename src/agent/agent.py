@@ -6,12 +6,13 @@ to play NetHack autonomously.
 """
 
 import asyncio
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
+import orjson
+
 from .llm_client import get_agent_tools, LLMClient, LLMResponse
 from .parser import ActionType, AgentDecision, DecisionParser
 from .prompts import PromptManager
@@ -446,10 +447,10 @@ class NetHackAgent:
         })
         if response.tool_call:
             # Store the full tool call as assistant message
-            tool_content = json.dumps({
+            tool_content = orjson.dumps({
                 "tool": response.tool_call.name,
                 "arguments": response.tool_call.arguments
-            })
+            }).decode()
             assistant_msg: dict[str, Any] = {"role": "assistant", "content": tool_content}
             # Preserve reasoning_details for re-feeding to subsequent requests
             if response.reasoning_details:
@@ -577,17 +578,24 @@ class NetHackAgent:
         if not content:
             return None
 
-        # Compact tool call arguments if requested
+        # Compact tool call arguments if requested. Once a message is old
+        # enough to compact it stays compacted, so the result is memoized on
+        # the history entry instead of re-parsed every turn.
         if compact_arguments:
-            try:
-                tool_data = json.loads(content)
-                if isinstance(tool_data, dict) and "tool" in tool_data:
-                    # Replace arguments with compacted marker
-                    compacted = {"tool": tool_data["tool"], "arguments": "[compacted]"}
-                    content = json.dumps(compacted)
-            except (json.JSONDecodeError, TypeError):
-                # Not a tool call JSON, keep as-is
-                pass
+            compacted_content = msg.get("_compacted_content")
+            if compacted_content is None:
+                compacted_content = content
+                try:
+                    tool_data = orjson.loads(content)
+                    if isinstance(tool_data, dict) and "tool" in tool_data:
+                        # Replace arguments with compacted marker
+                        compacted = {"tool": tool_data["tool"], "arguments": "[compacted]"}
+                        compacted_content = orjson.dumps(compacted).decode()
+                except (orjson.JSONDecodeError, TypeError):
+                    # Not a tool call JSON, keep as-is
+                    pass
+                msg["_compacted_content"] = compacted_content
+            content = compacted_content
 
         # Preserve reasoning_details for multi-turn reasoning continuity
         result = {"role": "assistant", "content": content}
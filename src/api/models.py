@@ -153,21 +153,23 @@ class Direction(Enum):
     @property
     def delta(self) -> tuple[int, int]:
         """Get (dx, dy) for this direction."""
-        deltas = {
-            Direction.N: (0, -1),
-            Direction.S: (0, 1),
-            Direction.E: (1, 0),
-            Direction.W: (-1, 0),
-            Direction.NE: (1, -1),
-            Direction.NW: (-1, -1),
-            Direction.SE: (1, 1),
-            Direction.SW: (-1, 1),
-            Direction.UP: (0, 0),
-            Direction.DOWN: (0, 0),
-            Direction.SELF: (0, 0),
-        }
-        return deltas[self]
-
+        return DIRECTION_DELTAS[self]
+
+
+# (dx, dy) per direction, built once rather than on every Direction.delta access
+DIRECTION_DELTAS: dict[Direction, tuple[int, int]] = {
+    Direction.N: (0, -1),
+    Direction.S: (0, 1),
+    Direction.E: (1, 0),
+    Direction.W: (-1, 0),
+    Direction.NE: (1, -1),
+    Direction.NW: (-1, -1),
+    Direction.SE: (1, 1),
+    Direction.SW: (-1, 1),
+    Direction.UP: (0, 0),
+    Direction.DOWN: (0, 0),
+    Direction.SELF: (0, 0),
+}
 
 # Direction constants for iteration
 CARDINAL_DIRECTIONS = (Direction.N, Direction.S, Direction.E, Direction.W)
@@ -0,0 +1,49 @@
+"""Small bounded in-process TTL cache shared by the web and persistence layers."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Map whose entries expire ``ttl`` seconds after they are set.
+
+    Holds at most ``maxsize`` entries, evicting the least recently used.
+    Expiry uses ``time.monotonic()``. Not thread-safe; meant for the event
+    loop.
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Return the live value for ``key``, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -119,7 +119,7 @@ def cmd_serve(args: argparse.Namespace) -> int:
         cfg = load_cfg()
         engine = create_async_engine(
             cfg.database.url,
-            pool_size=cfg.database.pool_max_size,
+            **cfg.database.engine_options,
         )
 
         app = create_app(engine=engine)
@@ -158,17 +158,26 @@ def cmd_worker(args: argparse.Namespace) -> int:
         concurrency = args.concurrency or cfg.worker.concurrency
         queue = args.queue or cfg.worker.queue
 
-        app = configure(conninfo)
+        app = configure(
+            conninfo,
+            min_size=cfg.database.pool_min_size,
+            max_size=cfg.database.pool_max_size,
+        )
 
         print(f"Starting worker (concurrency={concurrency}, queue={queue})")
         print(f"Database: {cfg.database.host}:{cfg.database.port}/{cfg.database.database}")
         print()
 
-        async with app.open_async():
-            await app.run_worker_async(
-                queues=[queue],
-                concurrency=concurrency,
-            )
+        from src.worker.tasks import dispose_engine
+
+        try:
+            async with app.open_async():
+                await app.run_worker_async(
+                    queues=[queue],
+                    concurrency=concurrency,
+                )
+        finally:
+            await dispose_engine()
 
     try:
         asyncio.run(run_worker())
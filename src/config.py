@@ -117,6 +117,8 @@ class EnvironmentConfig:
     max_episode_steps: int = 1000000
     render_mode: Optional[str] = None
     character: str = "random"
+    # Ready-reset "random" environments kept for web/worker run starts (0 = off)
+    api_pool_size: int = 1
 
 
 @dataclass
@@ -161,8 +163,17 @@ class DatabaseConfig:
     database: str = "nethack_agent"
     user: str = "nethack"
     password: str = "nethack"
+    # Connections the web app opens at startup (PostgresRepository.warm_up)
     pool_min_size: int = 2
     pool_max_size: int = 10
+    # Extra connections allowed above pool_max_size during bursts
+    pool_max_overflow: int = 20
+    # Seconds to wait for a free connection before raising
+    pool_timeout: float = 30.0
+    # Recycle connections older than this many seconds (-1 = never)
+    pool_recycle: int = 1800
+    # Per-connection asyncpg prepared statement cache (SQLAlchemy default: 100)
+    statement_cache_size: int = 1024
 
     @property
     def url(self) -> str:
@@ -170,8 +181,20 @@ class DatabaseConfig:
         return (
             f"postgresql+asyncpg://{self.user}:{self.password}"
             f"@{self.host}:{self.port}/{self.database}"
+            f"?prepared_statement_cache_size={self.statement_cache_size}"
         )
 
+    @property
+    def engine_options(self) -> dict:
+        """Pool keyword arguments for create_async_engine."""
+        return {
+            "pool_size": self.pool_max_size,
+            "max_overflow": self.pool_max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": True,
+        }
+
     @property
     def conninfo(self) -> str:
         """Standard PostgreSQL connection string (libpq / psycopg format)."""
@@ -277,6 +300,10 @@ def load_config(config_path: Optional[str] = None) -> Config:
         config.database.user = os.environ["NETHACK_AGENT_DB_USER"]
     if os.environ.get("NETHACK_AGENT_DB_PASSWORD"):
         config.database.password = os.environ["NETHACK_AGENT_DB_PASSWORD"]
+    if os.environ.get("NETHACK_AGENT_DB_POOL_MIN"):
+        config.database.pool_min_size = int(os.environ["NETHACK_AGENT_DB_POOL_MIN"])
+    if os.environ.get("NETHACK_AGENT_DB_POOL_MAX"):
+        config.database.pool_max_size = int(os.environ["NETHACK_AGENT_DB_POOL_MAX"])
 
     # Auth overrides
     if os.environ.get("AUTH_SESSION_SECRET"):
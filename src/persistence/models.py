@@ -1,11 +1,17 @@
-"""Data models for agent turn and run persistence."""
+"""Data models for agent turn and run persistence.
+
+Records are slotted dataclasses: a page of turns is materialized per API
+request, so they skip the per-instance __dict__. ``to_dict`` leaves
+datetimes as ``datetime``; the JSON encoder (orjson, see
+``src.web.responses``) formats them.
+"""
 
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class UserRecord:
     """A registered user (via OpenRouter OAuth)."""
 
@@ -25,11 +31,11 @@ class UserRecord:
             "openrouter_id": self.openrouter_id,
             "display_name": self.display_name,
             "avatar_url": self.avatar_url,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnRecord:
     """Complete record of a single agent turn.
 
@@ -95,7 +101,7 @@ class TurnRecord:
             "run_id": self.run_id,
             "turn_number": self.turn_number,
             "game_turn": self.game_turn,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp,
             "game_screen": self.game_screen,
             "game_screen_colors": self.game_screen_colors,
             "player_x": self.player_x,
@@ -127,7 +133,7 @@ class TurnRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RunRecord:
     """Metadata for a complete agent run (episode)."""
 
@@ -147,6 +153,9 @@ class RunRecord:
     final_game_turns: int = 0
     final_depth: int = 0
     final_xp_level: int = 0
+    # Saved turns, including the synthetic game-over turn. Read-only from
+    # the record's side: save_turn/save_turns_batch bump it in the database,
+    # and update_run/upsert_run never write it.
     total_agent_turns: int = 0
     total_llm_tokens: int = 0
 
@@ -167,8 +176,8 @@ class RunRecord:
         return {
             "id": self.id,
             "run_id": self.run_id,
-            "started_at": self.started_at.isoformat(),
-            "ended_at": self.ended_at.isoformat() if self.ended_at else None,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
             "model": self.model,
             "provider": self.provider,
             "config_snapshot": self.config_snapshot,
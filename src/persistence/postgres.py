@@ -1,16 +1,66 @@
 """Async PostgreSQL repository using SQLAlchemy Core + asyncpg."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from datetime import datetime
 
-from sqlalchemy import desc, distinct, func, insert, select, update
+from sqlalchemy import desc, distinct, func, insert, null, select, text, true, tuple_, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from src.cache import TTLCache
+
 from .models import RunRecord, TurnRecord, UserRecord
-from .tables import runs, turns, users
+from .tables import model_leaderboard, runs, turns, users
 
 logger = logging.getLogger(__name__)
 
+# Columns needed to render run listings. Excludes config_snapshot, a JSON
+# blob only the run detail view (get_run) needs.
+_RUN_SUMMARY_COLUMNS = (
+    runs.c.id,
+    runs.c.run_id,
+    runs.c.started_at,
+    runs.c.ended_at,
+    runs.c.model,
+    runs.c.provider,
+    runs.c.end_reason,
+    runs.c.final_score,
+    runs.c.final_game_turns,
+    runs.c.final_depth,
+    runs.c.final_xp_level,
+    runs.c.total_agent_turns,
+    runs.c.total_llm_tokens,
+    runs.c.status,
+    runs.c.user_id,
+    runs.c.visibility,
+)
+
+
+# Run lifecycle statuses and their NOTIFY channels
+TERMINAL_RUN_STATUSES = frozenset({"stopped", "error", "completed"})
+ACTIVE_RUN_STATUSES = ("starting", "running")
+# NOTIFY channel announcing runs that reached a terminal status. The payload
+# is "<run_id>:<status>"; it is sent in the same transaction as the update.
+RUN_STATUS_CHANNEL = "run_status"
+# save_turn announces "<run_id>:<turn_number>" here for live streams
+TURN_CHANNEL = "turn_inserted"
+
+# Cache and streaming tuning
+# get_run_cached: short-lived LRU for hot read paths (run detail polling)
+RUN_CACHE_TTL = 2.0
+RUN_CACHE_MAX = 512
+# Turns per query in stream_turns_page
+TURN_STREAM_CHUNK = 50
+# Seconds to wait after a run finishes before refreshing model_leaderboard
+LEADERBOARD_REFRESH_DELAY = 5.0
+
+# Built once: the hot per-turn write reuses one construct (and its cached
+# compilation), and the asyncpg dialect reuses the server-side prepared
+# statement on each pooled connection. Only bind parameters vary per call.
+_INSERT_TURN = insert(turns).returning(turns.c.id)
+
 
 class PostgresRepository:
     """Async repository backed by PostgreSQL.
@@ -21,6 +71,8 @@ class PostgresRepository:
 
     def __init__(self, engine: AsyncEngine):
         self._engine = engine
+        self._run_cache: TTLCache[str, RunRecord] = TTLCache(RUN_CACHE_TTL, RUN_CACHE_MAX)
+        self._leaderboard_refresh: asyncio.Task | None = None
 
     # === User management ===
 
@@ -73,30 +125,18 @@ class PostgresRepository:
     async def create_run(self, run: RunRecord) -> RunRecord:
         async with self._engine.begin() as conn:
             result = await conn.execute(
-                insert(runs)
-                .values(
-                    run_id=run.run_id,
-                    started_at=run.started_at,
-                    model=run.model,
-                    provider=run.provider,
-                    config_snapshot=run.config_snapshot,
-                    end_reason=run.end_reason,
-                    final_score=run.final_score,
-                    final_game_turns=run.final_game_turns,
-                    final_depth=run.final_depth,
-                    final_xp_level=run.final_xp_level,
-                    total_agent_turns=run.total_agent_turns,
-                    total_llm_tokens=run.total_llm_tokens,
-                    status=run.status,
-                    user_id=run.user_id,
-                    visibility=run.visibility,
-                )
-                .returning(runs.c.id)
+                insert(runs).values(**self._run_to_params(run)).returning(runs.c.id)
             )
             run.id = result.scalar_one()
         return run
 
     async def update_run(self, run: RunRecord) -> None:
+        """Write a run's mutable fields.
+
+        ``total_agent_turns`` is not written: ``save_turn`` and
+        ``save_turns_batch`` maintain it, so any value set on ``run`` is ignored.
+        Terminal statuses are also announced on ``RUN_STATUS_CHANNEL``.
+        """
         async with self._engine.begin() as conn:
             await conn.execute(
                 update(runs)
@@ -111,11 +151,67 @@ class PostgresRepository:
                     final_game_turns=run.final_game_turns,
                     final_depth=run.final_depth,
                     final_xp_level=run.final_xp_level,
-                    total_agent_turns=run.total_agent_turns,
                     total_llm_tokens=run.total_llm_tokens,
                     status=run.status,
                 )
             )
+            if run.status in TERMINAL_RUN_STATUSES:
+                await conn.execute(
+                    select(func.pg_notify(RUN_STATUS_CHANNEL, f"{run.run_id}:{run.status}"))
+                )
+        self._run_cache.pop(run.run_id)
+
+    async def upsert_run(self, run: RunRecord) -> RunRecord:
+        """Insert a run, or update it in place if ``run_id`` already exists.
+
+        Lets the runner write its record in one round-trip whether or not a
+        placeholder row was created first (ProcrastinateBackend). Identity and
+        ownership columns (started_at, user_id, visibility) are only written on
+        insert, as is ``total_agent_turns`` (maintained by ``save_turn``);
+        ``ended_at`` and ``config_snapshot`` keep their stored value when the
+        incoming one is None. Returns the stored record.
+        """
+        stmt = pg_insert(runs).values(
+            run_id=run.run_id,
+            started_at=run.started_at,
+            ended_at=run.ended_at,
+            model=run.model,
+            provider=run.provider,
+            config_snapshot=run.config_snapshot if run.config_snapshot is not None else null(),
+            end_reason=run.end_reason,
+            final_score=run.final_score,
+            final_game_turns=run.final_game_turns,
+            final_depth=run.final_depth,
+            final_xp_level=run.final_xp_level,
+            total_agent_turns=run.total_agent_turns,
+            total_llm_tokens=run.total_llm_tokens,
+            status=run.status,
+            user_id=run.user_id,
+            visibility=run.visibility,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[runs.c.run_id],
+            set_={
+                "model": stmt.excluded.model,
+                "provider": stmt.excluded.provider,
+                "config_snapshot": func.coalesce(
+                    stmt.excluded.config_snapshot, runs.c.config_snapshot
+                ),
+                "ended_at": func.coalesce(stmt.excluded.ended_at, runs.c.ended_at),
+                "end_reason": stmt.excluded.end_reason,
+                "final_score": stmt.excluded.final_score,
+                "final_game_turns": stmt.excluded.final_game_turns,
+                "final_depth": stmt.excluded.final_depth,
+                "final_xp_level": stmt.excluded.final_xp_level,
+                "total_llm_tokens": stmt.excluded.total_llm_tokens,
+                "status": stmt.excluded.status,
+            },
+        ).returning(runs)
+        async with self._engine.begin() as conn:
+            result = await conn.execute(stmt)
+            row = result.mappings().one()
+        self._run_cache.pop(run.run_id)
+        return self._row_to_run(row)
 
     async def get_run(self, run_id: str) -> RunRecord | None:
         async with self._engine.connect() as conn:
@@ -125,25 +221,60 @@ class PostgresRepository:
             return None
         return self._row_to_run(row)
 
+    async def get_run_cached(self, run_id: str) -> RunRecord | None:
+        """``get_run`` through a small in-process LRU.
+
+        Entries live for ``RUN_CACHE_TTL`` seconds and are dropped when this
+        repository writes the run; writes from other processes show up once
+        the entry expires. Callers must not mutate the returned record.
+        """
+        run = self._run_cache.get(run_id)
+        if run is None:
+            run = await self.get_run(run_id)
+            if run:
+                self._run_cache.set(run_id, run)
+        return run
+
     async def list_runs(
         self,
         limit: int = 50,
-        offset: int = 0,
         sort_by: str = "recent",
         model_filter: str | None = None,
         user_id: int | None = None,
-    ) -> list[RunRecord]:
+        cursor_started_at: datetime | None = None,
+        cursor_value: int | None = None,
+        cursor_id: int | None = None,
+        as_dicts: bool = False,
+    ) -> list[RunRecord] | list[dict]:
         """List runs with optional filtering and sorting.
 
         All runs are public — no visibility filtering.
         Joins peak stats from turns so score/depth are accurate even when
-        run-level finalization failed to persist them.
+        run-level finalization failed to persist them. ``config_snapshot``
+        is not loaded (left as None); use ``get_run`` for the full record.
+
+        Pagination is keyset-based: pass the ``(started_at, id)`` of the last
+        run from the previous page to continue after it. This is an index
+        seek at any depth, unlike OFFSET. Score and depth orders page the
+        same way on ``(effective value, id)``.
 
         Args:
             sort_by: "recent" (default), "score", or "depth"
             model_filter: filter to runs using this model
             user_id: filter to runs by this user
+            cursor_started_at: started_at of the last run already seen
+                ("recent" order only)
+            cursor_value: score or depth of the last run already seen
+                ("score"/"depth" order only)
+            cursor_id: id of the last run already seen
+            as_dicts: return ``RunRecord.to_dict``-shaped dicts straight from
+                the rows, skipping record construction (for API responses)
         """
+        if cursor_started_at is not None and sort_by != "recent":
+            raise ValueError("cursor_started_at is only valid for sort_by='recent'")
+        if cursor_value is not None and sort_by == "recent":
+            raise ValueError("cursor_value is only valid for sort_by='score' or 'depth'")
+
         peak = (
             select(
                 turns.c.run_id,
@@ -162,7 +293,7 @@ class PostgresRepository:
 
         query = (
             select(
-                runs,
+                *_RUN_SUMMARY_COLUMNS,
                 users.c.display_name.label("username"),
                 effective_score.label("effective_score"),
                 effective_depth.label("effective_depth"),
@@ -170,32 +301,38 @@ class PostgresRepository:
             .outerjoin(users, runs.c.user_id == users.c.id)
             .outerjoin(peak, runs.c.run_id == peak.c.run_id)
             .limit(limit)
-            .offset(offset)
         )
 
+        sort_key = {"score": effective_score, "depth": effective_depth}.get(sort_by)
+        if cursor_started_at is not None:
+            query = query.where(
+                tuple_(runs.c.started_at, runs.c.id) < tuple_(cursor_started_at, cursor_id)
+            )
+        elif cursor_value is not None:
+            query = query.where(tuple_(sort_key, runs.c.id) < tuple_(cursor_value, cursor_id))
         if model_filter:
             query = query.where(runs.c.model == model_filter)
         if user_id is not None:
             query = query.where(runs.c.user_id == user_id)
 
-        if sort_by == "score":
-            query = query.order_by(desc(effective_score))
-        elif sort_by == "depth":
-            query = query.order_by(desc(effective_depth))
+        if sort_key is not None:
+            query = query.order_by(desc(sort_key), desc(runs.c.id))
         else:
-            query = query.order_by(desc(runs.c.started_at))
+            query = query.order_by(desc(runs.c.started_at), desc(runs.c.id))
 
         async with self._engine.connect() as conn:
             result = await conn.execute(query)
             rows = result.mappings().all()
 
-        records = []
+        dicts = []
         for row in rows:
-            run = self._row_to_run(row)
-            run.final_score = row["effective_score"] or run.final_score
-            run.final_depth = row["effective_depth"] or run.final_depth
-            records.append(run)
-        return records
+            run = self._row_to_run_dict(row)
+            run["final_score"] = row["effective_score"] or run["final_score"]
+            run["final_depth"] = row["effective_depth"] or run["final_depth"]
+            dicts.append(run)
+        if as_dicts:
+            return dicts
+        return [RunRecord(**run) for run in dicts]
 
     async def get_model_leaderboard(
         self,
@@ -206,57 +343,19 @@ class PostgresRepository:
 
         Only includes finished runs (not currently running) with a non-empty model.
         Uses peak stats from turns as fallback when run-level stats are 0.
+        Reads the ``model_leaderboard`` materialized view, which is only as
+        fresh as its last refresh (see ``schedule_leaderboard_refresh``).
         """
-        peak = (
-            select(
-                turns.c.run_id,
-                func.max(turns.c.score).label("peak_score"),
-                func.max(func.greatest(turns.c.depth, turns.c.dungeon_level)).label("peak_depth"),
-            )
-            .group_by(turns.c.run_id)
-            .subquery()
-        )
-
-        effective_score = func.greatest(
-            runs.c.final_score, func.coalesce(peak.c.peak_score, 0)
-        )
-        effective_depth = func.greatest(
-            runs.c.final_depth, func.coalesce(peak.c.peak_depth, 0)
-        )
-
-        # Per-run effective stats
-        per_run = (
-            select(
-                runs.c.model,
-                effective_score.label("eff_score"),
-                effective_depth.label("eff_depth"),
-            )
-            .outerjoin(peak, runs.c.run_id == peak.c.run_id)
-            .where(runs.c.status != "running")
-            .where(runs.c.model != "")
-            .subquery()
-        )
-
-        best_score = func.max(per_run.c.eff_score).label("best_score")
-        avg_score = func.round(func.avg(per_run.c.eff_score)).label("avg_score")
-        best_depth = func.max(per_run.c.eff_depth).label("best_depth")
-        run_count = func.count().label("run_count")
-
-        query = (
-            select(per_run.c.model, best_score, avg_score, best_depth, run_count)
-            .group_by(per_run.c.model)
-            .limit(limit)
-        )
-
+        lb = model_leaderboard
         if sort_by == "avg_score":
-            query = query.order_by(desc(avg_score), desc(best_score))
+            order = (desc(lb.c.avg_score), desc(lb.c.best_score))
         elif sort_by == "best_depth":
-            query = query.order_by(desc(best_depth), desc(best_score))
+            order = (desc(lb.c.best_depth), desc(lb.c.best_score))
         else:
-            query = query.order_by(desc(best_score), desc(best_depth))
+            order = (desc(lb.c.best_score), desc(lb.c.best_depth))
 
         async with self._engine.connect() as conn:
-            result = await conn.execute(query)
+            result = await conn.execute(select(lb).order_by(*order).limit(limit))
             rows = result.mappings().all()
 
         return [
@@ -270,14 +369,64 @@ class PostgresRepository:
             for row in rows
         ]
 
+    async def refresh_model_leaderboard(self) -> None:
+        """Recompute the ``model_leaderboard`` view without blocking readers."""
+        async with self._engine.begin() as conn:
+            await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY model_leaderboard"))
+
+    def schedule_leaderboard_refresh(self, delay: float = LEADERBOARD_REFRESH_DELAY) -> None:
+        """Refresh the leaderboard ``delay`` seconds from now.
+
+        Calls made while a refresh is pending coalesce into it, so a burst of
+        finishing runs costs one refresh. Must be called from the event loop.
+        """
+        if self._leaderboard_refresh is not None:
+            return
+        self._leaderboard_refresh = asyncio.get_running_loop().create_task(
+            self._refresh_leaderboard_later(delay)
+        )
+
+    async def _refresh_leaderboard_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        # Clear first: a run finishing during the refresh schedules another
+        self._leaderboard_refresh = None
+        try:
+            await self.refresh_model_leaderboard()
+        except Exception as e:
+            logger.warning(f"Leaderboard refresh failed: {e}")
+
     async def list_runs_by_status(self, statuses: list[str]) -> list[RunRecord]:
-        """List runs matching any of the given statuses."""
-        query = select(runs).where(runs.c.status.in_(statuses))
+        """List runs matching any of the given statuses.
+
+        Like ``list_runs``, ``config_snapshot`` is not loaded.
+        """
+        query = select(*_RUN_SUMMARY_COLUMNS).where(runs.c.status.in_(statuses))
         async with self._engine.connect() as conn:
             result = await conn.execute(query)
             rows = result.mappings().all()
         return [self._row_to_run(row) for row in rows]
 
+    async def count_active_runs(self, user_id: int) -> tuple[int, int]:
+        """(active runs owned by ``user_id``, active runs overall) in one scan."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(
+                select(
+                    func.count().filter(runs.c.user_id == user_id),
+                    func.count(),
+                ).where(runs.c.status.in_(ACTIVE_RUN_STATUSES))
+            )
+            user_count, total_count = result.one()
+        return user_count, total_count
+
+    async def get_run_statuses(self, run_ids: list[str]) -> dict[str, str]:
+        """Map each existing run_id in ``run_ids`` to its status, in one query."""
+        if not run_ids:
+            return {}
+        query = select(runs.c.run_id, runs.c.status).where(runs.c.run_id.in_(run_ids))
+        async with self._engine.connect() as conn:
+            result = await conn.execute(query)
+            return {row.run_id: row.status for row in result}
+
     async def list_distinct_models(self) -> list[str]:
         """Return distinct model names from all runs, sorted alphabetically."""
         query = select(distinct(runs.c.model)).where(runs.c.model != "").order_by(runs.c.model)
@@ -302,47 +451,52 @@ class PostgresRepository:
     # === Turn persistence ===
 
     async def save_turn(self, turn: TurnRecord) -> TurnRecord:
+        """Insert a turn and bump its run's ``total_agent_turns`` atomically.
+
+        The insert is announced on ``TURN_CHANNEL`` when the transaction
+        commits.
+        """
+        async with self._engine.begin() as conn:
+            result = await conn.execute(_INSERT_TURN, self._turn_to_params(turn))
+            turn.id = result.scalar_one()
+            await conn.execute(
+                update(runs)
+                .where(runs.c.run_id == turn.run_id)
+                .values(total_agent_turns=runs.c.total_agent_turns + 1)
+            )
+            await conn.execute(
+                select(func.pg_notify(TURN_CHANNEL, f"{turn.run_id}:{turn.turn_number}"))
+            )
+        return turn
+
+    async def save_turns_batch(self, batch: list[TurnRecord]) -> list[TurnRecord]:
+        """Insert several turns of one run in a single transaction.
+
+        One multi-row INSERT, one ``total_agent_turns`` bump and one
+        ``TURN_CHANNEL`` notification (for the last turn) replace the three
+        statements per turn that ``save_turn`` would issue.
+        """
+        if not batch:
+            return batch
+        run_id = batch[0].run_id
         async with self._engine.begin() as conn:
             result = await conn.execute(
                 insert(turns)
-                .values(
-                    run_id=turn.run_id,
-                    turn_number=turn.turn_number,
-                    game_turn=turn.game_turn,
-                    timestamp=turn.timestamp,
-                    game_screen=turn.game_screen,
-                    game_screen_colors=turn.game_screen_colors,
-                    player_x=turn.player_x,
-                    player_y=turn.player_y,
-                    hp=turn.hp,
-                    max_hp=turn.max_hp,
-                    dungeon_level=turn.dungeon_level,
-                    depth=turn.depth,
-                    xp_level=turn.xp_level,
-                    score=turn.score,
-                    hunger=turn.hunger,
-                    game_message=turn.game_message,
-                    llm_reasoning=turn.llm_reasoning,
-                    llm_model=turn.llm_model,
-                    llm_prompt_tokens=turn.llm_prompt_tokens,
-                    llm_completion_tokens=turn.llm_completion_tokens,
-                    llm_total_tokens=turn.llm_total_tokens,
-                    llm_finish_reason=turn.llm_finish_reason,
-                    action_type=turn.action_type,
-                    code=turn.code,
-                    skill_name=turn.skill_name,
-                    execution_success=turn.execution_success,
-                    execution_error=turn.execution_error,
-                    execution_time_ms=turn.execution_time_ms,
-                    game_messages=turn.game_messages or None,
-                    api_calls=turn.api_calls or None,
-                    inventory=turn.inventory or None,
-                    dungeon_overview=turn.dungeon_overview or None,
-                )
-                .returning(turns.c.id)
+                .values([self._turn_to_params(turn) for turn in batch])
+                .returning(turns.c.turn_number, turns.c.id)
             )
-            turn.id = result.scalar_one()
-        return turn
+            ids = dict(result.all())
+            await conn.execute(
+                update(runs)
+                .where(runs.c.run_id == run_id)
+                .values(total_agent_turns=runs.c.total_agent_turns + len(batch))
+            )
+            await conn.execute(
+                select(func.pg_notify(TURN_CHANNEL, f"{run_id}:{batch[-1].turn_number}"))
+            )
+        for turn in batch:
+            turn.id = ids[turn.turn_number]
+        return batch
 
     async def get_turns(
         self, run_id: str, after_turn: int = 0, limit: int = 100
@@ -357,6 +511,109 @@ class PostgresRepository:
             rows = result.mappings().all()
         return [self._row_to_turn(row) for row in rows]
 
+    async def get_turns_page(
+        self, run_id: str, after_turn: int = 0, limit: int = 100, as_dicts: bool = False
+    ) -> tuple[list[TurnRecord] | list[dict], int] | None:
+        """Like ``get_turns``, plus the run's total turn count in one query.
+
+        Returns None if the run does not exist, so callers need no separate
+        existence check. With ``as_dicts`` the turns come back in the
+        ``TurnRecord.to_dict`` shape without building records.
+        """
+        page = self._turns_after(run_id, after_turn, limit)
+        return await self._turns_of_run(run_id, page, as_dicts)
+
+    async def stream_turns_page(
+        self, run_id: str, after_turn: int = 0, limit: int = 100
+    ) -> tuple[AsyncIterator[dict], int] | None:
+        """``get_turns_page(as_dicts=True)`` fetched ``TURN_STREAM_CHUNK`` turns at a time.
+
+        The first chunk comes with the run lookup and total; the returned
+        iterator fetches the rest by keyset as it is consumed, so a large page
+        is never held in memory whole. Each chunk uses its own short-lived
+        connection, so nothing stays checked out between chunks, however slow
+        the consumer. Returns None if the run does not exist.
+        """
+        chunk = min(limit, TURN_STREAM_CHUNK)
+        first = await self._turns_of_run(
+            run_id, self._turns_after(run_id, after_turn, chunk), as_dicts=True
+        )
+        if first is None:
+            return None
+        first_turns, total = first
+
+        async def turn_dicts() -> AsyncIterator[dict]:
+            page, remaining = first_turns, limit
+            while True:
+                for turn in page:
+                    yield turn
+                remaining -= len(page)
+                if len(page) < chunk or remaining <= 0:
+                    return
+                query = self._turns_after(
+                    run_id, page[-1]["turn_number"], min(remaining, TURN_STREAM_CHUNK)
+                )
+                async with self._engine.connect() as conn:
+                    rows = (await conn.execute(query)).mappings().all()
+                page = [self._row_to_turn_dict(row) for row in rows]
+
+        return turn_dicts(), total
+
+    @staticmethod
+    def _turns_after(run_id: str, after_turn: int, limit: int):
+        return (
+            select(turns)
+            .where(turns.c.run_id == run_id, turns.c.turn_number > after_turn)
+            .order_by(turns.c.turn_number)
+            .limit(limit)
+        )
+
+    async def get_turn_of_run(
+        self, run_id: str, turn_number: int | None = None
+    ) -> tuple[bool, TurnRecord | None]:
+        """Fetch one turn (the latest if ``turn_number`` is None) in one query.
+
+        Returns ``(run_exists, turn)`` so a missing run and a missing turn
+        can be told apart without a separate existence check.
+        """
+        page = select(turns).where(turns.c.run_id == run_id)
+        if turn_number is None:
+            page = page.order_by(desc(turns.c.turn_number)).limit(1)
+        else:
+            page = page.where(turns.c.turn_number == turn_number)
+        found = await self._turns_of_run(run_id, page)
+        if found is None:
+            return False, None
+        return True, (found[0][0] if found[0] else None)
+
+    async def _turns_of_run(
+        self, run_id: str, page, as_dicts: bool = False
+    ) -> tuple[list[TurnRecord] | list[dict], int] | None:
+        """Run a turn query as a LATERAL subquery left-joined onto the run row.
+
+        The run row comes back even when ``page`` is empty, carrying the
+        run's total turn count; no row at all means no such run.
+        """
+        query = self._turns_of_run_query(run_id, page)
+        async with self._engine.connect() as conn:
+            result = await conn.execute(query)
+            rows = result.mappings().all()
+        if not rows:
+            return None
+        total = rows[0]["total"] or 0
+        to_turn = self._row_to_turn_dict if as_dicts else self._row_to_turn
+        return [to_turn(row) for row in rows if row["id"] is not None], total
+
+    @staticmethod
+    def _turns_of_run_query(run_id: str, page):
+        page = page.lateral("page")
+        return (
+            select(runs.c.total_agent_turns.label("total"), page)
+            .select_from(runs.outerjoin(page, true()))
+            .where(runs.c.run_id == run_id)
+            .order_by(page.c.turn_number)
+        )
+
     async def get_turn(self, run_id: str, turn_number: int) -> TurnRecord | None:
         async with self._engine.connect() as conn:
             result = await conn.execute(
@@ -406,38 +663,141 @@ class PostgresRepository:
         }
 
     async def count_turns(self, run_id: str) -> int:
+        """Number of saved turns, read from the counter kept by ``save_turn``."""
         async with self._engine.connect() as conn:
             result = await conn.execute(
-                select(func.count()).select_from(turns).where(turns.c.run_id == run_id)
+                select(runs.c.total_agent_turns).where(runs.c.run_id == run_id)
+            )
+            return result.scalar_one_or_none() or 0
+
+    async def warm_up(self, connections: int) -> None:
+        """Open ``connections`` pooled connections up front.
+
+        Each connection is held until all are open, so the pool really grows
+        to that size rather than reusing the first one; the first requests
+        after startup then skip the connect and auth round trips. Capped at
+        the pool size, since overflow connections are closed on return.
+        A failed connect is logged and releases the others; the pool then
+        just starts smaller.
+        """
+        size = getattr(self._engine.sync_engine.pool, "size", None)
+        if size is not None:
+            connections = min(connections, size())
+        if connections <= 0:
+            return
+        opened = 0
+        all_open = asyncio.Event()
+
+        async def _open() -> None:
+            nonlocal opened
+            try:
+                async with self._engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                    opened += 1
+                    if opened == connections:
+                        all_open.set()
+                    await all_open.wait()
+            finally:
+                # Don't leave the others waiting for a connection that failed
+                all_open.set()
+
+        results = await asyncio.gather(
+            *(_open() for _ in range(connections)), return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, Exception)]
+        if failures:
+            logger.warning(
+                f"Pool warm-up opened {connections - len(failures)}/{connections} "
+                f"connections: {failures[0]}"
             )
-            return result.scalar_one()
 
     async def close(self) -> None:
+        if self._leaderboard_refresh is not None:
+            self._leaderboard_refresh.cancel()
         await self._engine.dispose()
 
     # === Row mapping ===
 
+    def _run_to_params(self, run: RunRecord) -> dict:
+        return {
+            "run_id": run.run_id,
+            "started_at": run.started_at,
+            "model": run.model,
+            "provider": run.provider,
+            "config_snapshot": run.config_snapshot,
+            "end_reason": run.end_reason,
+            "final_score": run.final_score,
+            "final_game_turns": run.final_game_turns,
+            "final_depth": run.final_depth,
+            "final_xp_level": run.final_xp_level,
+            "total_agent_turns": run.total_agent_turns,
+            "total_llm_tokens": run.total_llm_tokens,
+            "status": run.status,
+            "user_id": run.user_id,
+            "visibility": run.visibility,
+        }
+
+    def _turn_to_params(self, turn: TurnRecord) -> dict:
+        return {
+            "run_id": turn.run_id,
+            "turn_number": turn.turn_number,
+            "game_turn": turn.game_turn,
+            "timestamp": turn.timestamp,
+            "game_screen": turn.game_screen,
+            "game_screen_colors": turn.game_screen_colors,
+            "player_x": turn.player_x,
+            "player_y": turn.player_y,
+            "hp": turn.hp,
+            "max_hp": turn.max_hp,
+            "dungeon_level": turn.dungeon_level,
+            "depth": turn.depth,
+            "xp_level": turn.xp_level,
+            "score": turn.score,
+            "hunger": turn.hunger,
+            "game_message": turn.game_message,
+            "llm_reasoning": turn.llm_reasoning,
+            "llm_model": turn.llm_model,
+            "llm_prompt_tokens": turn.llm_prompt_tokens,
+            "llm_completion_tokens": turn.llm_completion_tokens,
+            "llm_total_tokens": turn.llm_total_tokens,
+            "llm_finish_reason": turn.llm_finish_reason,
+            "action_type": turn.action_type,
+            "code": turn.code,
+            "skill_name": turn.skill_name,
+            "execution_success": turn.execution_success,
+            "execution_error": turn.execution_error,
+            "execution_time_ms": turn.execution_time_ms,
+            "game_messages": turn.game_messages or None,
+            "api_calls": turn.api_calls or None,
+            "inventory": turn.inventory or None,
+            "dungeon_overview": turn.dungeon_overview or None,
+        }
+
     def _row_to_run(self, row) -> RunRecord:
-        return RunRecord(
-            id=row["id"],
-            run_id=row["run_id"],
-            started_at=row["started_at"],
-            ended_at=row["ended_at"],
-            model=row["model"],
-            provider=row["provider"],
-            config_snapshot=row["config_snapshot"],
-            end_reason=row["end_reason"] or "",
-            final_score=row["final_score"],
-            final_game_turns=row["final_game_turns"],
-            final_depth=row["final_depth"],
-            final_xp_level=row["final_xp_level"],
-            total_agent_turns=row["total_agent_turns"],
-            total_llm_tokens=row["total_llm_tokens"],
-            status=row["status"] or "running",
-            user_id=row["user_id"],
-            visibility=row["visibility"] or "public",
-            username=row.get("username", "") or "",
-        )
+        return RunRecord(**self._row_to_run_dict(row))
+
+    def _row_to_run_dict(self, row) -> dict:
+        """Map a runs row to the ``RunRecord.to_dict`` shape."""
+        return {
+            "id": row["id"],
+            "run_id": row["run_id"],
+            "started_at": row["started_at"],
+            "ended_at": row["ended_at"],
+            "model": row["model"],
+            "provider": row["provider"],
+            "config_snapshot": row.get("config_snapshot"),
+            "end_reason": row["end_reason"] or "",
+            "final_score": row["final_score"],
+            "final_game_turns": row["final_game_turns"],
+            "final_depth": row["final_depth"],
+            "final_xp_level": row["final_xp_level"],
+            "total_agent_turns": row["total_agent_turns"],
+            "total_llm_tokens": row["total_llm_tokens"],
+            "status": row["status"] or "running",
+            "user_id": row["user_id"],
+            "visibility": row["visibility"] or "public",
+            "username": row.get("username", "") or "",
+        }
 
     def _row_to_user(self, row) -> UserRecord:
         return UserRecord(
@@ -452,38 +812,42 @@ class PostgresRepository:
         )
 
     def _row_to_turn(self, row) -> TurnRecord:
-        return TurnRecord(
-            id=row["id"],
-            run_id=row["run_id"],
-            turn_number=row["turn_number"],
-            game_turn=row["game_turn"],
-            timestamp=row["timestamp"],
-            game_screen=row["game_screen"],
-            game_screen_colors=row.get("game_screen_colors"),
-            player_x=row["player_x"],
-            player_y=row["player_y"],
-            hp=row["hp"],
-            max_hp=row["max_hp"],
-            dungeon_level=row["dungeon_level"],
-            depth=row["depth"],
-            xp_level=row["xp_level"],
-            score=row["score"],
-            hunger=row["hunger"] or "Not Hungry",
-            game_message=row["game_message"] or "",
-            llm_reasoning=row["llm_reasoning"] or "",
-            llm_model=row["llm_model"] or "",
-            llm_prompt_tokens=row["llm_prompt_tokens"],
-            llm_completion_tokens=row["llm_completion_tokens"],
-            llm_total_tokens=row["llm_total_tokens"],
-            llm_finish_reason=row["llm_finish_reason"],
-            action_type=row["action_type"],
-            code=row["code"],
-            skill_name=row["skill_name"],
-            execution_success=row["execution_success"],
-            execution_error=row["execution_error"],
-            execution_time_ms=row["execution_time_ms"],
-            game_messages=row["game_messages"] or [],
-            api_calls=row["api_calls"] or [],
-            inventory=row["inventory"],
-            dungeon_overview=row["dungeon_overview"],
-        )
+        return TurnRecord(**self._row_to_turn_dict(row))
+
+    def _row_to_turn_dict(self, row) -> dict:
+        """Map a turns row to the ``TurnRecord.to_dict`` shape."""
+        return {
+            "id": row["id"],
+            "run_id": row["run_id"],
+            "turn_number": row["turn_number"],
+            "game_turn": row["game_turn"],
+            "timestamp": row["timestamp"],
+            "game_screen": row["game_screen"],
+            "game_screen_colors": row.get("game_screen_colors"),
+            "player_x": row["player_x"],
+            "player_y": row["player_y"],
+            "hp": row["hp"],
+            "max_hp": row["max_hp"],
+            "dungeon_level": row["dungeon_level"],
+            "depth": row["depth"],
+            "xp_level": row["xp_level"],
+            "score": row["score"],
+            "hunger": row["hunger"] or "Not Hungry",
+            "game_message": row["game_message"] or "",
+            "llm_reasoning": row["llm_reasoning"] or "",
+            "llm_model": row["llm_model"] or "",
+            "llm_prompt_tokens": row["llm_prompt_tokens"],
+            "llm_completion_tokens": row["llm_completion_tokens"],
+            "llm_total_tokens": row["llm_total_tokens"],
+            "llm_finish_reason": row["llm_finish_reason"],
+            "action_type": row["action_type"],
+            "code": row["code"],
+            "skill_name": row["skill_name"],
+            "execution_success": row["execution_success"],
+            "execution_error": row["execution_error"],
+            "execution_time_ms": row["execution_time_ms"],
+            "game_messages": row["game_messages"] or [],
+            "api_calls": row["api_calls"] or [],
+            "inventory": row["inventory"],
+            "dungeon_overview": row["dungeon_overview"],
+        }
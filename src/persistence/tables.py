@@ -54,15 +54,21 @@ runs = sa.Table(
     sa.Column("visibility", sa.String, server_default="public", nullable=False),
 )
 
-sa.Index("idx_runs_started", runs.c.started_at.desc())
+sa.Index("idx_runs_started", runs.c.started_at.desc(), runs.c.id.desc())
 sa.Index("idx_runs_status", runs.c.status)
 sa.Index("idx_runs_user", runs.c.user_id)
 
+# Number of hash partitions for the turns table (see migration 007).
+TURNS_PARTITIONS = 16
+
+# Hash-partitioned by run_id: every per-run query prunes to one partition, so
+# its indexes stay small even as total turns grow. Postgres requires the
+# partition key in the primary key, hence (id, run_id).
 turns = sa.Table(
     "turns",
     metadata,
     sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
-    sa.Column("run_id", sa.String, sa.ForeignKey("runs.run_id"), nullable=False),
+    sa.Column("run_id", sa.String, sa.ForeignKey("runs.run_id"), primary_key=True, nullable=False),
     sa.Column("turn_number", sa.Integer, nullable=False),
     sa.Column("game_turn", sa.Integer, nullable=False),
     sa.Column("timestamp", sa.DateTime(timezone=True), nullable=False),
@@ -99,7 +105,70 @@ turns = sa.Table(
     # Extended game state
     sa.Column("inventory", sa.JSON, nullable=True),
     sa.Column("dungeon_overview", sa.Text, nullable=True),
+    postgresql_partition_by="HASH (run_id)",
 )
 
 sa.Index("idx_turns_run", turns.c.run_id, turns.c.turn_number)
 sa.Index("idx_turns_run_turn", turns.c.run_id, turns.c.turn_number, unique=True)
+
+
+@sa.event.listens_for(turns, "after_create")
+def _create_turn_partitions(target, connection, **kw):
+    """Create the hash partitions whenever the parent table is created."""
+    for remainder in range(TURNS_PARTITIONS):
+        connection.execute(
+            sa.text(
+                f"CREATE TABLE turns_p{remainder} PARTITION OF turns "
+                f"FOR VALUES WITH (MODULUS {TURNS_PARTITIONS}, REMAINDER {remainder})"
+            )
+        )
+
+
+# Per-model leaderboard, precomputed so /leaderboard reads O(models) rows
+# instead of aggregating every run (and its turns) per request. Effective
+# score/depth fall back to the peak seen in turns, since finalization can
+# fail to persist run-level stats. Refreshed when runs finish
+# (PostgresRepository.schedule_leaderboard_refresh); the unique index on
+# model is what allows REFRESH ... CONCURRENTLY.
+MODEL_LEADERBOARD_SQL = """
+SELECT r.model,
+       MAX(GREATEST(r.final_score, COALESCE(p.peak_score, 0))) AS best_score,
+       ROUND(AVG(GREATEST(r.final_score, COALESCE(p.peak_score, 0))))::integer AS avg_score,
+       MAX(GREATEST(r.final_depth, COALESCE(p.peak_depth, 0))) AS best_depth,
+       COUNT(*) AS run_count
+FROM runs r
+LEFT JOIN (
+    SELECT run_id,
+           MAX(score) AS peak_score,
+           MAX(GREATEST(depth, dungeon_level)) AS peak_depth
+    FROM turns
+    GROUP BY run_id
+) p ON p.run_id = r.run_id
+WHERE r.status != 'running' AND r.model != ''
+GROUP BY r.model
+"""
+
+model_leaderboard = sa.table(
+    "model_leaderboard",
+    sa.column("model", sa.String),
+    sa.column("best_score", sa.Integer),
+    sa.column("avg_score", sa.Integer),
+    sa.column("best_depth", sa.Integer),
+    sa.column("run_count", sa.Integer),
+)
+
+
+@sa.event.listens_for(metadata, "after_create")
+def _create_model_leaderboard(target, connection, **kw):
+    connection.execute(
+        sa.text(f"CREATE MATERIALIZED VIEW model_leaderboard AS {MODEL_LEADERBOARD_SQL}")
+    )
+    connection.execute(
+        sa.text("CREATE UNIQUE INDEX idx_model_leaderboard_model ON model_leaderboard (model)")
+    )
+
+
+@sa.event.listens_for(metadata, "before_drop")
+def _drop_model_leaderboard(target, connection, **kw):
+    # The view depends on runs and turns, so it must go first
+    connection.execute(sa.text("DROP MATERIALIZED VIEW IF EXISTS model_leaderboard"))
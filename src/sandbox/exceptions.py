@@ -4,17 +4,35 @@ Exceptions for the skill execution sandbox.
 
 
 class SkillExecutionError(Exception):
-    """Base exception for skill execution errors."""
+    """Base exception for skill execution errors.
+
+    Attributes live in ``__slots__`` so raising one does not materialize an
+    instance ``__dict__``.
+    """
+
+    __slots__ = ("skill_name", "details")
 
     def __init__(self, message: str, skill_name: str = "", details: str = ""):
         self.skill_name = skill_name
         self.details = details
         super().__init__(message)
 
+    def __reduce__(self):
+        # BaseException only pickles args and __dict__; carry slot values too.
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if hasattr(self, name)
+        }
+        return type(self), self.args, state
+
 
 class SkillSyntaxError(SkillExecutionError):
     """Raised when skill code has invalid Python syntax."""
 
+    __slots__ = ("line", "column")
+
     def __init__(self, message: str, skill_name: str = "", line: int = 0, column: int = 0):
         self.line = line
         self.column = column
@@ -24,6 +42,8 @@ class SkillSyntaxError(SkillExecutionError):
 class SkillSecurityError(SkillExecutionError):
     """Raised when skill code contains forbidden operations."""
 
+    __slots__ = ("violation",)
+
     def __init__(self, message: str, skill_name: str = "", violation: str = ""):
         self.violation = violation
         super().__init__(message, skill_name)
@@ -32,6 +52,8 @@ class SkillSecurityError(SkillExecutionError):
 class SkillTimeoutError(SkillExecutionError):
     """Raised when skill execution exceeds time limit."""
 
+    __slots__ = ("timeout_seconds",)
+
     def __init__(self, message: str, skill_name: str = "", timeout_seconds: float = 0):
         self.timeout_seconds = timeout_seconds
         super().__init__(message, skill_name)
@@ -40,6 +62,8 @@ class SkillTimeoutError(SkillExecutionError):
 class SkillValidationError(SkillExecutionError):
     """Raised when skill code fails validation checks."""
 
+    __slots__ = ("errors",)
+
     def __init__(self, message: str, skill_name: str = "", errors: list[str] | None = None):
         self.errors = errors or []
         super().__init__(message, skill_name)
@@ -48,4 +72,4 @@ class SkillValidationError(SkillExecutionError):
 class SandboxError(Exception):
     """Base exception for sandbox infrastructure errors."""
 
-    pass
+    __slots__ = ()
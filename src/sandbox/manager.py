@@ -5,22 +5,31 @@ Manages secure execution of agent-generated skill code
 using a restricted Python execution environment.
 """
 
+import ast
 import asyncio
-import json
+import functools
+import io
 import logging
-import os
-import tempfile
+import random
+import re
+import signal
+import sys
+import threading
 import time
-from dataclasses import dataclass, field
-from pathlib import Path
+from collections.abc import Coroutine
+from dataclasses import dataclass
+from types import CodeType
 from typing import Any, Optional
 
+from src.api.models import Direction, HungerState, Position, SkillResult
+from src.api.pathfinding import PathResult, PathStopReason, TargetResult
+
 from .exceptions import (
     SandboxError,
     SkillExecutionError,
     SkillTimeoutError,
 )
-from .validation import validate_skill, validate_adhoc_code
+from .validation import ValidationResult, validate_adhoc_code, validate_skill
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +56,38 @@ ACTION_METHODS = {
 }
 
 
+# Technical error substrings mapped to actionable guidance for the agent.
+# Translations are format strings; {method} is the failing API method.
+ERROR_TRANSLATIONS: tuple[tuple[str, str], ...] = (
+    (
+        "ord() expected a character",
+        "Invalid item letter for {method}(). Use single char like 'a', not a string. "
+        "For eating from ground, use nh.eat() with no arguments.",
+    ),
+    (
+        "expected str of length 1",
+        "Invalid argument to {method}(). Expected single character (e.g., 'a'), got string.",
+    ),
+    (
+        "No path through explored territory",
+        "Path goes through unexplored areas. Explore corridors/rooms between you and target first.",
+    ),
+    (
+        "Hostile monsters in view",
+        "Cannot pathfind while hostiles visible. Fight or flee first. (Note: move_to() ignores this check)",
+    ),
+    ("is not walkable", "Target position is blocked (wall, boulder, closed door, or monster)."),
+    (
+        "item_letter must be a single character",
+        "Use a single inventory letter like 'a', not a full name. "
+        "For eating from ground, use nh.eat() with no arguments.",
+    ),
+)
+ERROR_TRANSLATION_BY_PATTERN = dict(ERROR_TRANSLATIONS)
+# All patterns as one alternation, so an error message is scanned once
+ERROR_PATTERN_RE = re.compile("|".join(re.escape(p) for p, _ in ERROR_TRANSLATIONS))
+
+
 class APICallTracker:
     """
     Wrapper that tracks ALL API action calls for feedback to the agent.
@@ -62,26 +103,10 @@ class APICallTracker:
 
     def _translate_error(self, error_msg: str, method: str) -> str:
         """Translate technical errors to actionable guidance for the agent."""
-        translations = {
-            "ord() expected a character":
-                f"Invalid item letter for {method}(). Use single char like 'a', not a string. "
-                f"For eating from ground, use nh.eat() with no arguments.",
-            "expected str of length 1":
-                f"Invalid argument to {method}(). Expected single character (e.g., 'a'), got string.",
-            "No path through explored territory":
-                "Path goes through unexplored areas. Explore corridors/rooms between you and target first.",
-            "Hostile monsters in view":
-                "Cannot pathfind while hostiles visible. Fight or flee first. (Note: move_to() ignores this check)",
-            "is not walkable":
-                "Target position is blocked (wall, boulder, closed door, or monster).",
-            "item_letter must be a single character":
-                f"Use a single inventory letter like 'a', not a full name. "
-                f"For eating from ground, use nh.eat() with no arguments.",
-        }
-        for pattern, translation in translations.items():
-            if pattern in error_msg:
-                return translation
-        return error_msg
+        match = ERROR_PATTERN_RE.search(error_msg)
+        if match is None:
+            return error_msg
+        return ERROR_TRANSLATION_BY_PATTERN[match.group()].format(method=method)
 
     def _format_args(self, name: str, args: tuple, kwargs: dict) -> str:
         """Format method arguments for display."""
@@ -120,13 +145,18 @@ class APICallTracker:
         return ""
 
     def __getattr__(self, name):
-        """Proxy attribute access to wrapped API, tracking action calls."""
+        """Proxy attribute access to wrapped API, tracking action calls.
+
+        Method wrappers are stored on the instance after the first lookup,
+        so repeated calls like ``nh.move`` resolve without reaching here.
+        """
         attr = getattr(self._api, name)
 
         # Only wrap callable methods
         if not callable(attr):
             return attr
 
+        @functools.wraps(attr)
         def wrapper(*args, **kwargs):
             result = attr(*args, **kwargs)
 
@@ -179,6 +209,7 @@ class APICallTracker:
             self._calls.append(call_info)
             return result
 
+        object.__setattr__(self, name, wrapper)
         return wrapper
 
     def get_calls(self) -> list[dict]:
@@ -202,6 +233,175 @@ class APICallTracker:
 # Default timeout for skill execution
 DEFAULT_TIMEOUT_SECONDS = 30.0
 
+# Import statements in skill source, replaced before compiling
+IMPORT_LINE_RE = re.compile(r"^(?:from\s+\S+\s+)?import\s+.+$", re.MULTILINE)
+
+# Game messages always kept in execute_code feedback, however old
+KILL_MESSAGE_RE = re.compile(r"kill|destroy", re.IGNORECASE)
+
+# Prompts shown mid-action that are stale (and confusing) once it completes
+TRANSIENT_PROMPTS = (
+    "What do you want to zap?",
+    "What do you want to read?",
+    "What do you want to drink?",
+    "What do you want to quaff?",
+    "What do you want to eat?",
+    "What do you want to wear?",
+    "What do you want to wield?",
+    "What do you want to take off?",
+    "What do you want to drop?",
+    "What do you want to throw?",
+    "What do you want to apply?",
+    "What do you want to invoke?",
+    "What do you want to dip?",
+    "What do you want to rub?",
+    "What do you want to write with?",
+    "In what direction?",
+)
+
+# Limited builtins for safety. Must stay a real dict: CPython rejects other
+# mappings as __builtins__ (e.g. SystemError on import). Each execution gets
+# its own copy (see _new_namespace), so code cannot alter the shared one.
+SAFE_BUILTINS: dict[str, Any] = {
+    "True": True,
+    "False": False,
+    "None": None,
+    "print": print,
+    "len": len,
+    "range": range,
+    "enumerate": enumerate,
+    "zip": zip,
+    "map": map,
+    "filter": filter,
+    "sorted": sorted,
+    "reversed": reversed,
+    "list": list,
+    "dict": dict,
+    "set": set,
+    "tuple": tuple,
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "sum": sum,
+    "any": any,
+    "all": all,
+    "round": round,
+    "isinstance": isinstance,
+    "hasattr": hasattr,
+    "getattr": getattr,
+    "Exception": Exception,
+    "ValueError": ValueError,
+    "TypeError": TypeError,
+    "KeyError": KeyError,
+    "IndexError": IndexError,
+    "StopIteration": StopIteration,
+    "RuntimeError": RuntimeError,
+    # Introspection (safe)
+    "dir": dir,
+    "type": type,
+    "repr": repr,
+    "id": id,
+    "callable": callable,
+    "hash": hash,
+    # Iteration
+    "iter": iter,
+    "next": next,
+    "slice": slice,
+    # Math
+    "pow": pow,
+    "divmod": divmod,
+    # String/Character
+    "format": format,
+    "ord": ord,
+    "chr": chr,
+    "ascii": ascii,
+    "hex": hex,
+    "oct": oct,
+    "bin": bin,
+    # Object
+    "object": object,
+}
+
+# Template for every execution namespace: restricted builtins plus classes
+# pre-injected so code doesn't need imports. Built once at import time and
+# copied per execution, which then only adds ``nh`` and friends.
+BASE_NAMESPACE: dict[str, Any] = {
+    "__builtins__": SAFE_BUILTINS,
+    "SkillResult": SkillResult,
+    "Direction": Direction,
+    "Position": Position,
+    "PathResult": PathResult,
+    "PathStopReason": PathStopReason,
+    "TargetResult": TargetResult,
+    "HungerState": HungerState,
+    "random": random,
+}
+
+
+def _new_namespace() -> dict[str, Any]:
+    """A fresh execution namespace with its own copy of the builtins."""
+    namespace = BASE_NAMESPACE.copy()
+    namespace["__builtins__"] = SAFE_BUILTINS.copy()
+    return namespace
+
+
+async def await_with_timeout(coro: Coroutine[Any, Any, Any], timeout: float) -> Any:
+    """Await a coroutine, raising asyncio.TimeoutError after ``timeout`` seconds.
+
+    On Python 3.11+ this uses asyncio.timeout(), which runs the coroutine in
+    the current task; asyncio.wait_for wraps it in a new Task per call.
+    """
+    if sys.version_info >= (3, 11):
+        async with asyncio.timeout(timeout):
+            return await coro
+    return await asyncio.wait_for(coro, timeout=timeout)
+
+
+@functools.lru_cache(maxsize=512)
+def validate_skill_cached(code: str, skill_name: str) -> ValidationResult:
+    """validate_skill, memoized so re-submitted skills skip the AST walk.
+
+    The returned result is shared between callers and must not be mutated.
+    """
+    return validate_skill(code, skill_name)
+
+
+@functools.lru_cache(maxsize=512)
+def validate_adhoc_code_cached(code: str) -> ValidationResult:
+    """validate_adhoc_code, memoized like validate_skill_cached."""
+    return validate_adhoc_code(code)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_cached(source: str, filename: str) -> CodeType:
+    """Compile source for exec, reusing the code object for repeated sources.
+
+    Code objects are immutable, so re-submitted snippets (retries, common
+    one-liners like ``nh.move(Direction.E)``) skip parsing and bytecode
+    generation. Sources that fail to compile are not cached.
+    """
+    return compile(source, filename, "exec")
+
+
+@functools.lru_cache(maxsize=256)
+def compile_adhoc(code: str) -> CodeType:
+    """Compile ad-hoc code as the body of ``async def __adhoc__()``.
+
+    The wrapper is applied to the parsed AST rather than to indented source,
+    so the code is parsed once, keeps its own line numbers, and multi-line
+    string literals are not re-indented. Cached like compile_cached().
+    """
+    tree = ast.parse(code, "<execute_code>")
+    func = ast.parse("async def __adhoc__():\n    pass").body[0]
+    if tree.body:
+        func.body = tree.body
+    tree.body = [func]
+    return compile(tree, "<execute_code>", "exec")
+
 
 @dataclass
 class ExecutionResult:
@@ -279,7 +479,7 @@ class SkillSandbox:
         timeout = timeout or self.config.timeout_seconds
 
         # Validate code first
-        validation = validate_skill(code, skill_name)
+        validation = validate_skill_cached(code, skill_name)
         if not validation.valid:
             return ExecutionResult(
                 success=False,
@@ -289,103 +489,18 @@ class SkillSandbox:
         start_time = time.time()
 
         try:
-            # Import types to inject into namespace
-            import random
-            import re
-            from src.api.models import SkillResult, Direction, Position, HungerState
-            from src.api.pathfinding import PathResult, PathStopReason, TargetResult
-
             # Strip import statements since we pre-inject needed classes
             # This allows skill files to have imports for IDE support while
             # still working in the restricted sandbox
-            processed_code = re.sub(
-                r'^(?:from\s+\S+\s+)?import\s+.+$',
-                '# import stripped by sandbox',
-                code,
-                flags=re.MULTILINE
-            )
+            processed_code = IMPORT_LINE_RE.sub("# import stripped by sandbox", code)
 
             # Compile the code
-            compiled = compile(processed_code, f"<skill:{skill_name}>", "exec")
+            compiled = compile_cached(processed_code, f"<skill:{skill_name}>")
 
             # Create execution namespace with API and models available
-            namespace = {
-                "nh": api,
-                "NetHackAPI": type(api),
-                # Pre-inject commonly needed classes so skills don't need imports
-                "SkillResult": SkillResult,
-                "Direction": Direction,
-                "Position": Position,
-                "PathResult": PathResult,
-                "PathStopReason": PathStopReason,
-                "TargetResult": TargetResult,
-                "HungerState": HungerState,
-                "random": random,
-                "__builtins__": {
-                    # Limited builtins for safety
-                    "True": True,
-                    "False": False,
-                    "None": None,
-                    "print": print,
-                    "len": len,
-                    "range": range,
-                    "enumerate": enumerate,
-                    "zip": zip,
-                    "map": map,
-                    "filter": filter,
-                    "sorted": sorted,
-                    "reversed": reversed,
-                    "list": list,
-                    "dict": dict,
-                    "set": set,
-                    "tuple": tuple,
-                    "str": str,
-                    "int": int,
-                    "float": float,
-                    "bool": bool,
-                    "abs": abs,
-                    "min": min,
-                    "max": max,
-                    "sum": sum,
-                    "any": any,
-                    "all": all,
-                    "round": round,
-                    "isinstance": isinstance,
-                    "hasattr": hasattr,
-                    "getattr": getattr,
-                    "Exception": Exception,
-                    "ValueError": ValueError,
-                    "TypeError": TypeError,
-                    "KeyError": KeyError,
-                    "IndexError": IndexError,
-                    "StopIteration": StopIteration,
-                    "RuntimeError": RuntimeError,
-                    # Introspection (safe)
-                    "dir": dir,
-                    "type": type,
-                    "repr": repr,
-                    "id": id,
-                    "callable": callable,
-                    "hash": hash,
-                    # Iteration
-                    "iter": iter,
-                    "next": next,
-                    "slice": slice,
-                    # Math
-                    "pow": pow,
-                    "divmod": divmod,
-                    # String/Character
-                    "format": format,
-                    "ord": ord,
-                    "chr": chr,
-                    "ascii": ascii,
-                    "hex": hex,
-                    "oct": oct,
-                    "bin": bin,
-                    # Object
-                    "object": object,
-                },
-            }
+            namespace = _new_namespace()
+            namespace["nh"] = api
+            namespace["NetHackAPI"] = type(api)
 
             # Execute the code to define the function
             exec(compiled, namespace)
@@ -401,24 +516,22 @@ class SkillSandbox:
             skill_func = namespace[func_name]
 
             # Execute with timeout
-            result = await asyncio.wait_for(
-                skill_func(api, **params),
-                timeout=timeout,
-            )
+            result = await await_with_timeout(skill_func(api, **params), timeout)
 
             execution_time = time.time() - start_time
 
-            # Convert SkillResult to dict
-            if hasattr(result, "__dict__"):
+            # Convert SkillResult to dict, reading its fields in one pass
+            fields = getattr(result, "__dict__", None)
+            if fields is not None:
                 # Start with the data dict so all custom fields are accessible
-                data = getattr(result, "data", {})
+                data = fields.get("data", {})
                 result_dict = {
                     **data,  # Flatten data fields into top level
-                    "stopped_reason": getattr(result, "stopped_reason", "unknown"),
-                    "success": getattr(result, "success", False),
+                    "stopped_reason": fields.get("stopped_reason", "unknown"),
+                    "success": fields.get("success", False),
                     "data": data,  # Also keep original data for compatibility
-                    "actions_taken": getattr(result, "actions_taken", 0),
-                    "turns_elapsed": getattr(result, "turns_elapsed", 0),
+                    "actions_taken": fields.get("actions_taken", 0),
+                    "turns_elapsed": fields.get("turns_elapsed", 0),
                 }
             else:
                 result_dict = {"result": result}
@@ -457,8 +570,9 @@ class SkillSandbox:
         The code runs directly with `nh` available in namespace.
         Example code: "nh.move(Direction.E); nh.pickup()"
 
-        Uses signal.SIGALRM for hard timeout on synchronous code (Unix only).
-        This catches infinite loops that asyncio.wait_for can't interrupt.
+        Uses signal.SIGALRM for hard timeout on synchronous code (Unix only,
+        and only when called from the main thread).
+        This catches infinite loops that the asyncio timeout can't interrupt.
 
         Args:
             code: Python source code to execute
@@ -467,26 +581,14 @@ class SkillSandbox:
 
         Returns:
             ExecutionResult with success/failure status and results
-        """
-        import signal
-        import textwrap
 
+        Raises:
+            SkillTimeoutError: If either timeout fires
+        """
         timeout = timeout or self.config.timeout_seconds
 
-        # Set up signal-based timeout for synchronous code (Unix only)
-        # asyncio.wait_for won't work for tight loops without await points
-        old_handler = None
-        use_signal_timeout = hasattr(signal, 'SIGALRM')
-
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"Code execution timed out after {timeout} seconds (possible infinite loop)")
-
-        if use_signal_timeout:
-            old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(int(timeout) + 1)  # +1 to let asyncio timeout fire first if possible
-
         # Validate code (security checks but no async def requirement)
-        validation = validate_adhoc_code(code)
+        validation = validate_adhoc_code_cached(code)
         if not validation.valid:
             return ExecutionResult(
                 success=False,
@@ -496,8 +598,6 @@ class SkillSandbox:
         start_time = time.time()
 
         # Capture stdout
-        import io
-        import sys
         captured_output = io.StringIO()
 
         # Wrap API to track failed calls
@@ -508,108 +608,40 @@ class SkillSandbox:
         # This ensures we correctly slice new messages even after long autoexplore runs
         messages_before = len(api._message_history) if hasattr(api, '_message_history') else 0
 
+        # Set up signal-based timeout for synchronous code (Unix only)
+        # The asyncio timeout won't work for tight loops without await points.
+        # Signal handlers can only be installed from the main thread.
+        old_handler = None
+        use_signal_timeout = (
+            hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread()
+        )
+
+        def timeout_handler(signum, frame):
+            raise TimeoutError(
+                f"Code execution timed out after {timeout} seconds (possible infinite loop)"
+            )
+
+        if use_signal_timeout:
+            old_handler = signal.signal(signal.SIGALRM, timeout_handler)
+            # +0.5s grace to let the asyncio timeout fire first if possible
+            signal.setitimer(signal.ITIMER_REAL, timeout + 0.5)
+
         try:
-            # Import models to inject into namespace
-            import random
-            from src.api.models import Direction, Position, HungerState
-            from src.api.pathfinding import PathResult, PathStopReason, TargetResult
-
-            # Wrap code in async function for asyncio execution
-            # Indent the code properly
-            indented_code = textwrap.indent(code, "    ")
-            wrapped = f"async def __adhoc__():\n{indented_code}"
-
-            # Compile the wrapped code
-            compiled = compile(wrapped, "<execute_code>", "exec")
-
-            # Custom print function that captures output
-            def captured_print(*args, **kwargs):
-                print(*args, file=captured_output, **kwargs)
-
-            # Create execution namespace
-            namespace = {
-                "nh": tracked_api,
-                "Direction": Direction,
-                "Position": Position,
-                "PathResult": PathResult,
-                "PathStopReason": PathStopReason,
-                "TargetResult": TargetResult,
-                "HungerState": HungerState,
-                "random": random,
-                "__builtins__": {
-                    # Limited builtins for safety
-                    "True": True,
-                    "False": False,
-                    "None": None,
-                    "print": captured_print,
-                    "len": len,
-                    "range": range,
-                    "enumerate": enumerate,
-                    "zip": zip,
-                    "map": map,
-                    "filter": filter,
-                    "sorted": sorted,
-                    "reversed": reversed,
-                    "list": list,
-                    "dict": dict,
-                    "set": set,
-                    "tuple": tuple,
-                    "str": str,
-                    "int": int,
-                    "float": float,
-                    "bool": bool,
-                    "abs": abs,
-                    "min": min,
-                    "max": max,
-                    "sum": sum,
-                    "any": any,
-                    "all": all,
-                    "round": round,
-                    "isinstance": isinstance,
-                    "hasattr": hasattr,
-                    "getattr": getattr,
-                    "Exception": Exception,
-                    "ValueError": ValueError,
-                    "TypeError": TypeError,
-                    "KeyError": KeyError,
-                    "IndexError": IndexError,
-                    "StopIteration": StopIteration,
-                    "RuntimeError": RuntimeError,
-                    # Introspection (safe)
-                    "dir": dir,
-                    "type": type,
-                    "repr": repr,
-                    "id": id,
-                    "callable": callable,
-                    "hash": hash,
-                    # Iteration
-                    "iter": iter,
-                    "next": next,
-                    "slice": slice,
-                    # Math
-                    "pow": pow,
-                    "divmod": divmod,
-                    # String/Character
-                    "format": format,
-                    "ord": ord,
-                    "chr": chr,
-                    "ascii": ascii,
-                    "hex": hex,
-                    "oct": oct,
-                    "bin": bin,
-                    # Object
-                    "object": object,
-                },
-            }
+            # Compile the code wrapped in an async function for asyncio execution
+            compiled = compile_adhoc(code)
+
+            # Create execution namespace. The module-level print shadows the
+            # builtin and writes straight to the capture buffer (no Python
+            # frame per call, and sys.stdout of other tasks is left alone).
+            namespace = _new_namespace()
+            namespace["nh"] = tracked_api
+            namespace["print"] = functools.partial(print, file=captured_output)
 
             # Execute the wrapped code to define the function
             exec(compiled, namespace)
 
             # Execute the async function with timeout
-            result = await asyncio.wait_for(
-                namespace["__adhoc__"](),
-                timeout=timeout,
-            )
+            result = await await_with_timeout(namespace["__adhoc__"](), timeout)
 
             execution_time = time.time() - start_time
 
@@ -621,42 +653,23 @@ class SkillSandbox:
             # Limit to last 200 messages to avoid context bloat, but keep ALL kill messages
             game_messages = []
             if hasattr(api, '_message_history'):
-                new_messages = api._message_history[messages_before:]
-                # Keep all kill messages regardless of position
-                kill_messages = [m for m in new_messages if 'kill' in m.lower() or 'destroy' in m.lower()]
-                # Take last 200 other messages
-                if len(new_messages) > 200:
-                    game_messages = kill_messages + new_messages[-200:]
-                    # Deduplicate while preserving order
-                    seen = set()
-                    game_messages = [m for m in game_messages if not (m in seen or seen.add(m))]
-                else:
-                    game_messages = new_messages
+                # Slice the history directly: at most the last 200 new messages,
+                # plus any earlier kill messages (deduplicated, in order) so kills
+                # are never dropped. No intermediate copy of all new messages.
+                history = api._message_history
+                tail_start = max(messages_before, len(history) - 200)
+                game_messages = history[tail_start:]
+                if tail_start > messages_before:
+                    kill_messages = [
+                        m for m in history[messages_before:tail_start] if KILL_MESSAGE_RE.search(m)
+                    ]
+                    game_messages = list(dict.fromkeys(kill_messages + game_messages))
 
                 # Filter out transient prompt messages that are no longer relevant
                 # These appear during multi-key sequences (zap, read, quaff, etc.)
                 # but confuse the LLM if shown after the action completes
-                transient_prompts = [
-                    "What do you want to zap?",
-                    "What do you want to read?",
-                    "What do you want to drink?",
-                    "What do you want to quaff?",
-                    "What do you want to eat?",
-                    "What do you want to wear?",
-                    "What do you want to wield?",
-                    "What do you want to take off?",
-                    "What do you want to drop?",
-                    "What do you want to throw?",
-                    "What do you want to apply?",
-                    "What do you want to invoke?",
-                    "What do you want to dip?",
-                    "What do you want to rub?",
-                    "What do you want to write with?",
-                    "In what direction?",
-                ]
                 game_messages = [
-                    m for m in game_messages
-                    if not any(m.strip().startswith(prompt) for prompt in transient_prompts)
+                    m for m in game_messages if not m.strip().startswith(TRANSIENT_PROMPTS)
                 ]
 
             # Also capture current message after execution completes
@@ -694,20 +707,14 @@ class SkillSandbox:
                 stdout=stdout,
             )
 
-        except asyncio.TimeoutError:
+        except (asyncio.TimeoutError, TimeoutError):
+            # Either the coroutine timeout or the signal timer (synchronous
+            # infinite loops); one class on 3.11+, listed twice for 3.10
             raise SkillTimeoutError(
                 f"Code execution exceeded timeout of {timeout}s",
                 skill_name="<adhoc>",
                 timeout_seconds=timeout,
             )
-        except TimeoutError as e:
-            # Signal-based timeout (catches synchronous infinite loops)
-            logger.warning(f"Signal timeout triggered: {e}")
-            return ExecutionResult(
-                success=False,
-                error=str(e),
-                execution_time=time.time() - start_time,
-            )
         except Exception as e:
             logger.exception(f"Code execution failed: {e}")
             return ExecutionResult(
@@ -718,6 +725,6 @@ class SkillSandbox:
         finally:
             # Always cancel the alarm and restore old handler
             if use_signal_timeout:
-                signal.alarm(0)  # Cancel alarm
+                signal.setitimer(signal.ITIMER_REAL, 0)  # Cancel timer
                 if old_handler is not None:
                     signal.signal(signal.SIGALRM, old_handler)
@@ -137,6 +137,22 @@ class SkillLibrary:
             file_path=str(file_path),
         )
 
+    def copy(self) -> "SkillLibrary":
+        """
+        Return an independent index over the same loaded skills.
+
+        Skill objects are shared; adding or deleting skills on the copy
+        does not affect this library.
+
+        Returns:
+            New SkillLibrary with copied name and category indexes
+        """
+        clone = SkillLibrary.__new__(SkillLibrary)
+        clone.skills_dir = self.skills_dir
+        clone._skills = dict(self._skills)
+        clone._by_category = {cat: list(names) for cat, names in self._by_category.items()}
+        return clone
+
     def _add_skill(self, skill: Skill) -> None:
         """Add a skill to the library index."""
         self._skills[skill.name] = skill
@@ -7,14 +7,22 @@ from textual.message import Message
 
 from src.agent.parser import AgentDecision
 
+# Longest code listing the TUI renders; the full source stays on the decision.
+CODE_PREVIEW_CHARS = 2000
+
 
 @dataclass
 class DecisionMade(Message):
-    """Emitted when the agent makes a decision."""
+    """Emitted when the agent makes a decision.
+
+    ``code_preview`` is truncated here, once, by the producer so widgets
+    never slice or re-measure the full generated code.
+    """
 
     decision: AgentDecision
     turn: int
     timestamp: float
+    code_preview: str
 
     def __init__(
         self,
@@ -26,6 +34,10 @@ class DecisionMade(Message):
         self.decision = decision
         self.turn = turn
         self.timestamp = timestamp
+        code = decision.code or ""
+        if len(code) > CODE_PREVIEW_CHARS:
+            code = code[:CODE_PREVIEW_CHARS] + "\n# ... (truncated)"
+        self.code_preview = code
 
 
 @dataclass
@@ -23,23 +23,25 @@ class GameScreenWidget(Static):
     }
     """
 
+    # Blank 24x80 screen shown until the first game state arrives
+    EMPTY_SCREEN = "\n".join([" " * 80] * 24)
+
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         # Initialize with empty screen
         self._screen = self._empty_screen()
 
     def _empty_screen(self) -> str:
-        """Generate an empty 24x80 screen."""
-        lines = []
-        for _ in range(24):
-            lines.append(" " * 80)
-        return "\n".join(lines)
+        """Return an empty 24x80 screen."""
+        return self.EMPTY_SCREEN
 
     def on_mount(self) -> None:
         """Initialize display when mounted."""
         self.update(self._screen)
 
     def on_game_state_updated(self, event: GameStateUpdated) -> None:
-        """Update the game screen display."""
+        """Update the game screen display, skipping unchanged frames."""
+        if event.screen == self._screen:
+            return
         self._screen = event.screen
         self.update(self._screen)
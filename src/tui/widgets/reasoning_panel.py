@@ -100,14 +100,10 @@ class ReasoningPanel(VerticalScroll):
         code_label = self.query_one("#code-label", Static)
         code_widget = self.query_one("#code-content", Static)
 
-        if decision.code:
+        if event.code_preview:
             code_label.update(Text("Generated Code:", style="yellow bold"))
-            # Truncate very long code
-            code_preview = decision.code[:2000]
-            if len(decision.code) > 2000:
-                code_preview += "\n# ... (truncated)"
             syntax = Syntax(
-                code_preview,
+                event.code_preview,
                 "python",
                 theme="monokai",
                 line_numbers=True,
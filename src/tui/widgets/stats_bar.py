@@ -7,6 +7,25 @@ from ..events import GameStateUpdated
 from src.scoring import Progress
 
 
+# Hunger status (lowercased, underscored) -> display style
+HUNGER_STYLES = {
+    "satiated": "cyan",
+    "not_hungry": "green",
+    "hungry": "yellow",
+    "weak": "red",
+    "fainting": "red bold",
+    "fainted": "red bold",
+}
+
+# Fixed label segments, shared by every render
+_HP_LABEL = ("HP: ", "bold")
+_TURN_LABEL = (" | Turn: ", "dim")
+_DL_LABEL = (" | DL:", "dim")
+_XL_LABEL = (" | XL:", "dim")
+_BALROG_LABEL = (" | BALROG: ", "dim")
+_SEPARATOR = (" | ", "dim")
+
+
 class StatsBar(Static):
     """
     Horizontal status bar showing key stats.
@@ -34,6 +53,7 @@ class StatsBar(Static):
         self._hunger = "Not Hungry"
         self._message = ""
         self._progress = Progress()  # BALROG progress tracker
+        self._rendered: tuple | None = None  # values behind the current display
 
     def on_mount(self) -> None:
         """Initialize display when mounted."""
@@ -54,8 +74,21 @@ class StatsBar(Static):
         self._refresh_display()
 
     def _refresh_display(self) -> None:
-        """Rebuild the stats display."""
-        text = Text()
+        """Rebuild the stats display if any displayed value changed."""
+        balrog_pct = self._progress.progression_percent
+        rendered = (
+            self._hp,
+            self._max_hp,
+            self._turn,
+            self._level,
+            self._xp_level,
+            balrog_pct,
+            self._hunger,
+            self._message,
+        )
+        if rendered == self._rendered:
+            return
+        self._rendered = rendered
 
         # HP with color coding
         hp_ratio = self._hp / self._max_hp if self._max_hp > 0 else 0
@@ -66,21 +99,7 @@ class StatsBar(Static):
         else:
             hp_color = "red bold"
 
-        text.append("HP: ", style="bold")
-        text.append(f"{self._hp}/{self._max_hp}", style=hp_color)
-
-        text.append(" | Turn: ", style="dim")
-        text.append(f"{self._turn}")
-
-        text.append(" | DL:", style="dim")
-        text.append(f"{self._level}")
-
-        text.append(" | XL:", style="dim")
-        text.append(f"{self._xp_level}")
-
         # BALROG progress (win probability)
-        balrog_pct = self._progress.progression_percent
-        text.append(" | BALROG: ", style="dim")
         if balrog_pct >= 50:
             balrog_style = "green bold"
         elif balrog_pct >= 10:
@@ -89,24 +108,27 @@ class StatsBar(Static):
             balrog_style = "yellow"
         else:
             balrog_style = "white"
-        text.append(f"{balrog_pct:.2f}%", style=balrog_style)
 
         # Hunger status with color
-        hunger_colors = {
-            "satiated": "cyan",
-            "not_hungry": "green",
-            "hungry": "yellow",
-            "weak": "red",
-            "fainting": "red bold",
-            "fainted": "red bold",
-        }
-        text.append(" | ", style="dim")
-        hunger_style = hunger_colors.get(self._hunger.lower().replace(" ", "_"), "white")
-        text.append(self._hunger, style=hunger_style)
+        hunger_style = HUNGER_STYLES.get(self._hunger.lower().replace(" ", "_"), "white")
+
+        text = Text.assemble(
+            _HP_LABEL,
+            (f"{self._hp}/{self._max_hp}", hp_color),
+            _TURN_LABEL,
+            str(self._turn),
+            _DL_LABEL,
+            str(self._level),
+            _XL_LABEL,
+            str(self._xp_level),
+            _BALROG_LABEL,
+            (f"{balrog_pct:.2f}%", balrog_style),
+            _SEPARATOR,
+            (self._hunger, hunger_style),
+        )
 
         # Current message on second line
         if self._message:
-            msg_display = self._message[:76] if len(self._message) > 76 else self._message
-            text.append(f"\n{msg_display}", style="italic")
+            text.append(f"\n{self._message[:76]}", style="italic")
 
         self.update(text)
@@ -5,18 +5,110 @@ run configuration and API key. Mirrors create_watched_agent() from
 src/tui/runner.py but parameterized for multi-user runs.
 """
 
+import asyncio
+import functools
 import logging
+import threading
 
 from src.agent import NetHackAgent
 from src.agent.llm_client import LLMClient
 from src.api import NetHackAPI
-from src.config import AgentConfig, load_config
+from src.config import AgentConfig, Config, load_config
 from src.skills import SkillExecutor, SkillLibrary
 
 logger = logging.getLogger(__name__)
 
+# Config is read-only here; parse the YAML once per process, not per run.
+_cached_config = functools.lru_cache(maxsize=1)(load_config)
 
-def create_agent_for_run(
+# Skills loaded from disk once and shared; each run gets its own index copy
+_SHARED_LIBRARY: SkillLibrary | None = None
+_LIBRARY_LOCK = threading.Lock()
+
+
+def _get_shared_library(library_path: str) -> SkillLibrary:
+    """Load the on-disk skill library once per process."""
+    global _SHARED_LIBRARY
+    with _LIBRARY_LOCK:
+        if _SHARED_LIBRARY is None:
+            library = SkillLibrary(library_path)
+            library.load_all()
+            _SHARED_LIBRARY = library
+        return _SHARED_LIBRARY
+
+
+# Ready-reset environments for POOLED_CHARACTER. Run start pops one instead of
+# building and resetting an NLE env inline; a background task tops it back up.
+# Only processes that called prewarm_api_pool (the web server) use the pool, so
+# worker processes never build spare environments nobody will close.
+POOLED_CHARACTER = "random"
+_API_POOL: asyncio.Queue[NetHackAPI] = asyncio.Queue()
+_pool_enabled = False
+_refill_task: asyncio.Task | None = None
+
+
+def _new_api(config: Config, character: str) -> NetHackAPI:
+    api = NetHackAPI(
+        env_name=config.environment.name,
+        max_episode_steps=config.environment.max_episode_steps,
+        character=character,
+    )
+    api.reset()
+    return api
+
+
+async def prewarm_api_pool() -> None:
+    """Enable the environment pool and fill it to ``environment.api_pool_size``."""
+    global _pool_enabled
+    _pool_enabled = True
+    await _fill_api_pool()
+
+
+async def _fill_api_pool() -> None:
+    config = _cached_config()
+    while _API_POOL.qsize() < config.environment.api_pool_size:
+        _API_POOL.put_nowait(await asyncio.to_thread(_new_api, config, POOLED_CHARACTER))
+
+
+async def close_api_pool() -> None:
+    """Stop refilling and close any pooled environments (call at shutdown)."""
+    global _pool_enabled, _refill_task
+    _pool_enabled = False
+    if _refill_task is not None:
+        _refill_task.cancel()
+        try:
+            await _refill_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        _refill_task = None
+    while not _API_POOL.empty():
+        _API_POOL.get_nowait().close()
+
+
+def _schedule_refill() -> None:
+    global _refill_task
+    if _refill_task is None or _refill_task.done():
+        _refill_task = asyncio.create_task(_fill_api_pool())
+        _refill_task.add_done_callback(_log_refill_error)
+
+
+def _log_refill_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception():
+        logger.warning(f"Failed to refill NetHackAPI pool: {task.exception()}")
+
+
+def _take_pooled_api(config: Config, character: str) -> NetHackAPI | None:
+    """Pop a ready environment for ``character`` if the pool has one."""
+    if not _pool_enabled or character != POOLED_CHARACTER or config.environment.api_pool_size <= 0:
+        return None
+    _schedule_refill()
+    try:
+        return _API_POOL.get_nowait()
+    except asyncio.QueueEmpty:
+        return None
+
+
+async def create_agent_for_run(
     api_key: str,
     model: str,
     character: str = "random",
@@ -26,6 +118,10 @@ def create_agent_for_run(
 ) -> tuple[NetHackAgent, NetHackAPI]:
     """Create a fresh agent + API for a user-initiated run.
 
+    The blocking setup (environment construction on a pool miss, skill
+    loading, LLM client creation) runs in a worker thread so the event
+    loop keeps serving other requests meanwhile.
+
     Args:
         api_key: User's OpenRouter API key (decrypted).
         model: OpenRouter model ID (e.g. "anthropic/claude-sonnet-4").
@@ -37,15 +133,34 @@ def create_agent_for_run(
     Returns:
         Tuple of (NetHackAgent, NetHackAPI) ready to run.
     """
-    config = load_config()
-
-    # Create game environment
-    api = NetHackAPI(
-        env_name=config.environment.name,
-        max_episode_steps=config.environment.max_episode_steps,
+    api = _take_pooled_api(_cached_config(), character)
+    return await asyncio.to_thread(
+        _create_agent_for_run_sync,
+        api_key=api_key,
+        model=model,
         character=character,
+        temperature=temperature,
+        reasoning=reasoning,
+        max_turns=max_turns,
+        api=api,
     )
-    api.reset()
+
+
+def _create_agent_for_run_sync(
+    api_key: str,
+    model: str,
+    character: str,
+    temperature: float,
+    reasoning: str,
+    max_turns: int,
+    api: NetHackAPI | None = None,
+) -> tuple[NetHackAgent, NetHackAPI]:
+    """Blocking body of create_agent_for_run; ``api`` is a pooled env or None."""
+    config = _cached_config()
+
+    # Create game environment unless a pooled one was handed in
+    if api is None:
+        api = _new_api(config, character)
 
     # Create LLM client with user's API key
     llm = LLMClient(
@@ -57,9 +172,8 @@ def create_agent_for_run(
         reasoning=reasoning if reasoning != "none" else None,
     )
 
-    # Create skill system (fresh per run)
-    library = SkillLibrary(config.skills.library_path)
-    library.load_all()
+    # Create skill system (per-run copy of the shared, pre-parsed library)
+    library = _get_shared_library(config.skills.library_path).copy()
     executor = SkillExecutor(api=api, library=library)
 
     # Build agent config with user overrides
@@ -1,15 +1,19 @@
 """FastAPI application factory."""
 
+import hashlib
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import httpx
 from fastapi import FastAPI, Request, Response
+from fastapi.exception_handlers import http_exception_handler
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .auth import auth_router
+from .responses import OrjsonResponse
 from .routes import router
 from .ws import ws_router
 
@@ -33,11 +37,29 @@ async def lifespan(app: FastAPI):
     if not getattr(app.state, "engine", None):
         app.state.engine = create_async_engine(
             config.database.url,
-            pool_size=config.database.pool_max_size,
+            **config.database.engine_options,
         )
 
     if not getattr(app.state, "repo", None):
         app.state.repo = PostgresRepository(app.state.engine)
+    # Outside the guard: ``serve`` pre-sets the repo from the CLI
+    await app.state.repo.warm_up(config.database.pool_min_size)
+    # Pick up runs that finished while the server was down
+    app.state.repo.schedule_leaderboard_refresh(delay=0)
+
+    # Shared outbound HTTP client: keeps TLS connections to OpenRouter alive
+    if not getattr(app.state, "http_client", None):
+        app.state.http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+
+    # Push notifications for live turn streams (polls if LISTEN fails)
+    if not getattr(app.state, "notifier", None):
+        from src.web.notifier import RunNotifier
+
+        app.state.notifier = RunNotifier()
+        await app.state.notifier.start(config.database.conninfo)
 
     # Store auth config (may already be set by CLI)
     if not getattr(app.state, "auth_config", None):
@@ -49,23 +71,35 @@ async def lifespan(app: FastAPI):
             from src.web.procrastinate_backend import ProcrastinateBackend
             from src.worker.app import configure
 
-            proc_app = configure(config.database.conninfo)
+            proc_app = configure(
+                config.database.conninfo,
+                min_size=config.database.pool_min_size,
+                max_size=config.database.pool_max_size,
+            )
             await proc_app.connector.open_async()
             app.state.procrastinate_app = proc_app
 
             backend = ProcrastinateBackend(proc_app, app.state.repo)
-            await backend.start_monitoring(interval=config.worker.monitor_interval)
+            await backend.start_monitoring(
+                interval=config.worker.monitor_interval,
+                notifier=app.state.notifier,
+            )
             app.state.procrastinate_backend = backend
         else:
+            from src.web.agent_factory import prewarm_api_pool
+
             backend = InProcessBackend(
                 repo=app.state.repo,
                 auth_config=config.auth,
             )
+            await prewarm_api_pool()
 
         run_manager = RunManager(
             backend=backend,
             max_runs_per_user=5,
             max_total_runs=10,
+            # Workers are shared by every API process: count limits in the DB
+            repo=app.state.repo if config.worker.enabled else None,
         )
 
         # Wire up the on_finished callback so RunManager cleans up _user_runs
@@ -89,6 +123,18 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, "procrastinate_app"):
         await app.state.procrastinate_app.connector.close_async()
 
+    # Close prewarmed environments (only used by the in-process backend)
+    if not config.worker.enabled:
+        from src.web.agent_factory import close_api_pool
+
+        await close_api_pool()
+
+    if hasattr(app.state, "notifier"):
+        await app.state.notifier.stop()
+
+    if hasattr(app.state, "http_client"):
+        await app.state.http_client.aclose()
+
     if hasattr(app.state, "engine") and app.state.engine:
         await app.state.engine.dispose()
 
@@ -104,6 +150,7 @@ def create_app(engine=None) -> FastAPI:
         description="REST + WebSocket API for watching and replaying Glyphbox agent runs",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=OrjsonResponse,
     )
 
     app.add_middleware(
@@ -112,6 +159,7 @@ def create_app(engine=None) -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
     # Pre-set engine if provided (lifespan will use it instead of creating one)
@@ -124,14 +172,20 @@ def create_app(engine=None) -> FastAPI:
 
     # Serve built frontend in production (when dist/ exists)
     if FRONTEND_DIST.exists():
+        # index.html only changes between deploys: read and hash it once
+        index_html = (FRONTEND_DIST / "index.html").read_bytes()
+        index_etag = f'"{hashlib.md5(index_html, usedforsecurity=False).hexdigest()}"'
 
-        @app.middleware("http")
-        async def spa_fallback(request: Request, call_next) -> Response:
-            response = await call_next(request)
+        @app.exception_handler(StarletteHTTPException)
+        async def spa_fallback(request: Request, exc: StarletteHTTPException) -> Response:
+            # Only misses reach here, so API requests pay nothing for the SPA
             path = request.url.path
-            if response.status_code == 404 and not path.startswith(("/api", "/ws")):
-                return FileResponse(FRONTEND_DIST / "index.html")
-            return response
+            if exc.status_code == 404 and not path.startswith(("/api", "/ws")):
+                headers = {"ETag": index_etag}
+                if request.headers.get("if-none-match") == index_etag:
+                    return Response(status_code=304, headers=headers)
+                return Response(index_html, media_type="text/html", headers=headers)
+            return await http_exception_handler(request, exc)
 
         app.mount(
             "/",
@@ -10,20 +10,25 @@ Flow:
 """
 
 import base64
+import functools
 import hashlib
 import logging
 import os
 import re
-from datetime import datetime, timedelta, timezone
+import time
 
 import httpx
 import jwt
+import orjson
 from cryptography.fernet import Fernet
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import RedirectResponse, Response
 
+from src.cache import TTLCache
 from src.config import AuthConfig
+from src.persistence.models import UserRecord
 from src.persistence.postgres import PostgresRepository
+from src.web.responses import OrjsonResponse
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +42,9 @@ auth_router = APIRouter(prefix="/api/auth", tags=["auth"])
 
 def generate_pkce_pair() -> tuple[str, str]:
     """Generate a PKCE code_verifier and code_challenge (S256)."""
-    verifier = base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=").decode("ascii")
-    challenge = (
-        base64.urlsafe_b64encode(hashlib.sha256(verifier.encode("ascii")).digest())
-        .rstrip(b"=")
-        .decode("ascii")
-    )
-    return verifier, challenge
+    verifier = base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=")
+    challenge = base64.urlsafe_b64encode(hashlib.sha256(verifier).digest()).rstrip(b"=")
+    return verifier.decode("ascii"), challenge.decode("ascii")
 
 
 # ---------------------------------------------------------------------------
@@ -53,20 +54,52 @@ def generate_pkce_pair() -> tuple[str, str]:
 
 def create_jwt(user_id: int, secret: str, expiry_days: int = 7) -> str:
     """Create an HS256 JWT with the user's database ID."""
-    payload = {
-        "sub": str(user_id),
-        "iat": datetime.now(timezone.utc),
-        "exp": datetime.now(timezone.utc) + timedelta(days=expiry_days),
-    }
+    now = int(time.time())
+    payload = {"sub": str(user_id), "iat": now, "exp": now + expiry_days * 86400}
     return jwt.encode(payload, secret, algorithm="HS256")
 
 
+# header.payload.signature in canonical unpadded base64url. An HS256
+# signature is 32 bytes: 43 characters, the last carrying 2 zero bits.
+# PyJWT's decoder skips stray characters and ignores those bits, so
+# non-canonical spellings of a valid token are rejected here first.
+_HS256_JWT_RE = re.compile(r"[\w-]+\.[\w-]+\.[\w-]{42}[AEIMQUYcgkosw048]", re.ASCII)
+
+# Decoded session tokens, (token, secret) -> payload. PyJWT's full
+# validation runs once per token per TTL; a hit only re-checks ``exp``.
+DECODED_JWT_TTL = 60.0
+DECODED_JWT_MAX = 10_000
+_decoded_jwts: TTLCache[tuple[str, str], dict] = TTLCache(DECODED_JWT_TTL, DECODED_JWT_MAX)
+
+
 def decode_jwt(token: str, secret: str) -> dict | None:
-    """Decode and validate a JWT. Returns payload or None on failure."""
+    """Decode and validate an HS256 session JWT. Returns payload or None on failure.
+
+    ``exp`` and ``sub`` are required, and ``sub`` must be a numeric user ID.
+    Valid payloads are cached (never past their ``exp``); callers must not
+    mutate them.
+    """
+    cache_key = (token, secret)
+    payload = _decoded_jwts.get(cache_key)
+    if payload is not None:
+        if payload["exp"] > time.time():
+            return payload
+        _decoded_jwts.pop(cache_key)
+        return None
+
+    if not _HS256_JWT_RE.fullmatch(token):
+        return None
     try:
-        return jwt.decode(token, secret, algorithms=["HS256"])
+        payload = jwt.decode(
+            token, secret, algorithms=["HS256"], options={"require": ["exp", "sub"]}
+        )
     except jwt.PyJWTError:
         return None
+    sub = payload["sub"]
+    if not isinstance(sub, str) or not (sub.isascii() and sub.isdigit()):
+        return None
+    _decoded_jwts.set(cache_key, payload)
+    return payload
 
 
 # ---------------------------------------------------------------------------
@@ -74,16 +107,36 @@ def decode_jwt(token: str, secret: str) -> dict | None:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=4)
+def _fernet(encryption_key: str) -> Fernet:
+    """Parse a Fernet key once; the instance is reused across calls."""
+    return Fernet(encryption_key.encode("utf-8"))
+
+
 def encrypt_key(api_key: str, encryption_key: str) -> str:
     """Encrypt an API key using Fernet symmetric encryption."""
-    f = Fernet(encryption_key.encode("utf-8"))
-    return f.encrypt(api_key.encode("utf-8")).decode("utf-8")
+    return _fernet(encryption_key).encrypt(api_key.encode("utf-8")).decode("utf-8")
+
+
+DECRYPTED_KEY_TTL = 60.0
+DECRYPTED_KEY_MAX = 1024
+# (ciphertext, encryption_key) -> plaintext. Keyed by the ciphertext, so a
+# user storing a new key never hits the old entry.
+_decrypted_keys: TTLCache[tuple[str, str], str] = TTLCache(DECRYPTED_KEY_TTL, DECRYPTED_KEY_MAX)
 
 
 def decrypt_key(encrypted: str, encryption_key: str) -> str:
-    """Decrypt an API key."""
-    f = Fernet(encryption_key.encode("utf-8"))
-    return f.decrypt(encrypted.encode("utf-8")).decode("utf-8")
+    """Decrypt an API key.
+
+    Results are cached for ``DECRYPTED_KEY_TTL`` seconds, sparing the
+    HMAC + AES work on repeated run starts and model lookups.
+    """
+    cache_key = (encrypted, encryption_key)
+    api_key = _decrypted_keys.get(cache_key)
+    if api_key is None:
+        api_key = _fernet(encryption_key).decrypt(encrypted.encode("utf-8")).decode("utf-8")
+        _decrypted_keys.set(cache_key, api_key)
+    return api_key
 
 
 # ---------------------------------------------------------------------------
@@ -102,6 +155,81 @@ def _get_repo(request: Request) -> PostgresRepository:
     return request.app.state.repo
 
 
+def _get_http_client(request: Request) -> httpx.AsyncClient:
+    return request.app.state.http_client
+
+
+# ---------------------------------------------------------------------------
+# Error responses
+# ---------------------------------------------------------------------------
+
+_ERROR_MESSAGES = (
+    "Authentication is not configured",
+    "Missing 'code' parameter",
+    "Missing PKCE verifier cookie. Please try logging in again.",
+    "Failed to exchange code with OpenRouter",
+    "No API key returned from OpenRouter",
+    "Not authenticated",
+    "Invalid or expired session",
+    "User not found",
+    "Username must be 3-30 characters, alphanumeric, hyphens, or underscores",
+    "Username already taken",
+)
+# Bodies are encoded once; each call still gets its own Response, since
+# middleware (e.g. CORS) appends to a response's header list.
+_ERROR_BODIES = {message: orjson.dumps({"error": message}) for message in _ERROR_MESSAGES}
+_OK_BODY = orjson.dumps({"ok": True})
+
+
+def _error(message: str, status_code: int) -> Response:
+    body = _ERROR_BODIES.get(message) or orjson.dumps({"error": message})
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+# ---------------------------------------------------------------------------
+# Session resolution (JWT cookie -> UserRecord)
+# ---------------------------------------------------------------------------
+
+# Session token -> user. Bounds user lookups to one per session per TTL
+# instead of one per request.
+SESSION_USER_TTL = 30.0
+SESSION_USER_MAX = 10_000
+_session_users: TTLCache[str, UserRecord] = TTLCache(SESSION_USER_TTL, SESSION_USER_MAX)
+
+
+def session_payload(request: Request, auth_config: AuthConfig) -> dict | None:
+    """Decode the session cookie's JWT, at most once per request."""
+    if not hasattr(request.state, "session_payload"):
+        token = request.cookies.get("session")
+        request.state.session_payload = (
+            decode_jwt(token, auth_config.session_secret) if token else None
+        )
+    return request.state.session_payload
+
+
+async def session_user(request: Request, auth_config: AuthConfig) -> UserRecord | None:
+    """Return the user behind the session cookie, or None.
+
+    Memoized on ``request.state`` for the rest of the request, and across
+    requests in a short TTL cache keyed by the session token.
+    """
+    if hasattr(request.state, "user"):
+        return request.state.user
+
+    user = None
+    payload = session_payload(request, auth_config)
+    if payload:
+        token = request.cookies["session"]
+        user = _session_users.get(token)
+        if user is None:
+            user = await _get_repo(request).get_user(int(payload["sub"]))
+            if user:
+                _session_users.set(token, user)
+
+    request.state.user = user
+    return user
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -112,7 +240,7 @@ async def login(request: Request):
     """Start the OAuth flow. Redirect user to OpenRouter."""
     auth_config = _get_auth_config(request)
     if not auth_config:
-        return JSONResponse({"error": "Authentication is not configured"}, status_code=501)
+        return _error("Authentication is not configured", 501)
 
     verifier, challenge = generate_pkce_pair()
 
@@ -142,43 +270,37 @@ async def callback(request: Request):
     """Handle the OpenRouter OAuth callback."""
     auth_config = _get_auth_config(request)
     if not auth_config:
-        return JSONResponse({"error": "Authentication is not configured"}, status_code=501)
+        return _error("Authentication is not configured", 501)
 
     code = request.query_params.get("code")
     if not code:
-        return JSONResponse({"error": "Missing 'code' parameter"}, status_code=400)
+        return _error("Missing 'code' parameter", 400)
 
     verifier = request.cookies.get("pkce_verifier")
     if not verifier:
-        return JSONResponse(
-            {"error": "Missing PKCE verifier cookie. Please try logging in again."},
-            status_code=400,
-        )
+        return _error("Missing PKCE verifier cookie. Please try logging in again.", 400)
 
     # Exchange code for API key
-    async with httpx.AsyncClient() as client:
-        exchange_resp = await client.post(
-            auth_config.openrouter_keys_url,
-            json={
-                "code": code,
-                "code_verifier": verifier,
-                "code_challenge_method": "S256",
-            },
-        )
+    client = _get_http_client(request)
+    exchange_resp = await client.post(
+        auth_config.openrouter_keys_url,
+        json={
+            "code": code,
+            "code_verifier": verifier,
+            "code_challenge_method": "S256",
+        },
+    )
 
     if exchange_resp.status_code != 200:
         logger.error(f"OpenRouter key exchange failed: {exchange_resp.text}")
-        return JSONResponse(
-            {"error": "Failed to exchange code with OpenRouter"},
-            status_code=502,
-        )
+        return _error("Failed to exchange code with OpenRouter", 502)
 
     data = exchange_resp.json()
     api_key = data.get("key")
     openrouter_user_id = data.get("user_id", "")
 
     if not api_key:
-        return JSONResponse({"error": "No API key returned from OpenRouter"}, status_code=502)
+        return _error("No API key returned from OpenRouter", 502)
 
     # Encrypt the API key for storage
     encrypted = encrypt_key(api_key, auth_config.encryption_key)
@@ -216,29 +338,26 @@ async def get_me(request: Request):
     """Return the current authenticated user, or 401."""
     auth_config = _get_auth_config(request)
     if not auth_config:
-        return JSONResponse({"error": "Authentication is not configured"}, status_code=501)
+        return _error("Authentication is not configured", 501)
 
-    token = request.cookies.get("session")
-    if not token:
-        return JSONResponse({"error": "Not authenticated"}, status_code=401)
+    if not request.cookies.get("session"):
+        return _error("Not authenticated", 401)
 
-    payload = decode_jwt(token, auth_config.session_secret)
-    if not payload:
-        return JSONResponse({"error": "Invalid or expired session"}, status_code=401)
+    if not session_payload(request, auth_config):
+        return _error("Invalid or expired session", 401)
 
-    repo = _get_repo(request)
-    user = await repo.get_user(int(payload["sub"]))
+    user = await session_user(request, auth_config)
     if not user:
-        return JSONResponse({"error": "User not found"}, status_code=401)
+        return _error("User not found", 401)
 
-    return user.to_public_dict()
+    return OrjsonResponse(user.to_public_dict())
 
 
 @auth_router.post("/logout")
 async def logout(request: Request):
     """Clear the session cookie."""
     auth_config = _get_auth_config(request)
-    response = JSONResponse({"ok": True})
+    response = Response(_OK_BODY, media_type="application/json")
     response.delete_cookie(
         "session",
         domain=(auth_config.cookie_domain if auth_config else None) or None,
@@ -246,7 +365,7 @@ async def logout(request: Request):
     return response
 
 
-USERNAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{3,30}$")
+USERNAME_PATTERN = re.compile(r"[a-zA-Z0-9_-]{3,30}")  # use with fullmatch
 
 
 @auth_router.patch("/me")
@@ -254,23 +373,22 @@ async def update_me(request: Request):
     """Update the current user's profile (display_name)."""
     auth_config = _get_auth_config(request)
     if not auth_config:
-        return JSONResponse({"error": "Authentication is not configured"}, status_code=501)
+        return _error("Authentication is not configured", 501)
 
     token = request.cookies.get("session")
     if not token:
-        return JSONResponse({"error": "Not authenticated"}, status_code=401)
+        return _error("Not authenticated", 401)
 
-    payload = decode_jwt(token, auth_config.session_secret)
+    payload = session_payload(request, auth_config)
     if not payload:
-        return JSONResponse({"error": "Invalid or expired session"}, status_code=401)
+        return _error("Invalid or expired session", 401)
 
     body = await request.json()
     display_name = body.get("display_name", "").strip()
 
-    if not USERNAME_PATTERN.match(display_name):
-        return JSONResponse(
-            {"error": "Username must be 3-30 characters, alphanumeric, hyphens, or underscores"},
-            status_code=400,
+    if not (3 <= len(display_name) <= 30 and USERNAME_PATTERN.fullmatch(display_name)):
+        return _error(
+            "Username must be 3-30 characters, alphanumeric, hyphens, or underscores", 400
         )
 
     repo = _get_repo(request)
@@ -280,7 +398,10 @@ async def update_me(request: Request):
         user = await repo.update_user_display_name(user_id, display_name)
     except Exception as e:
         if "unique" in str(e).lower() or "duplicate" in str(e).lower():
-            return JSONResponse({"error": "Username already taken"}, status_code=409)
+            return _error("Username already taken", 409)
         raise
 
-    return user.to_public_dict()
+    # Drop the cached copy so the new name is visible on the next request
+    _session_users.pop(token)
+    request.state.user = user
+    return OrjsonResponse(user.to_public_dict())
@@ -1,19 +1,36 @@
-"""FastAPI dependency injection."""
+"""FastAPI dependency injection.
 
+Dependencies are ``async def`` even when their bodies never await:
+FastAPI runs sync dependencies in the threadpool, which costs a thread
+hop per dependency per request.
+"""
+
+import httpx
 from fastapi import HTTPException, Request
 
 from src.config import AuthConfig
 from src.persistence.models import UserRecord
 from src.persistence.postgres import PostgresRepository
-from src.web.auth import decode_jwt
+from src.web.auth import session_payload, session_user
+from src.web.notifier import RunNotifier
 
 
-def get_repo(request: Request) -> PostgresRepository:
+async def get_repo(request: Request) -> PostgresRepository:
     """Provide the PostgresRepository from app state."""
     return request.app.state.repo
 
 
-def get_auth_config(request: Request) -> AuthConfig | None:
+async def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Provide the shared outbound httpx client from app state."""
+    return request.app.state.http_client
+
+
+async def get_notifier(request: Request) -> RunNotifier | None:
+    """Provide the live-stream RunNotifier, if the lifespan started one."""
+    return getattr(request.app.state, "notifier", None)
+
+
+async def get_auth_config(request: Request) -> AuthConfig | None:
     """Return AuthConfig if auth is enabled, else None."""
     config = getattr(request.app.state, "auth_config", None)
     if config and config.enabled:
@@ -23,29 +40,26 @@ def get_auth_config(request: Request) -> AuthConfig | None:
 
 async def get_current_user(request: Request) -> UserRecord:
     """Require an authenticated user. Raises 401 if not logged in."""
-    auth_config = get_auth_config(request)
+    auth_config = await get_auth_config(request)
     if not auth_config:
         raise HTTPException(401, "Authentication is not configured")
 
-    token = request.cookies.get("session")
-    if not token:
+    if not request.cookies.get("session"):
         raise HTTPException(401, "Not authenticated")
 
-    payload = decode_jwt(token, auth_config.session_secret)
-    if not payload:
+    if not session_payload(request, auth_config):
         raise HTTPException(401, "Invalid or expired session")
 
-    repo = get_repo(request)
-    user = await repo.get_user(int(payload["sub"]))
+    user = await session_user(request, auth_config)
     if not user:
         raise HTTPException(401, "User not found")
 
     return user
 
 
-def get_auth_enabled(request: Request) -> bool:
+async def get_auth_enabled(request: Request) -> bool:
     """Return True if auth is configured on this server."""
-    return get_auth_config(request) is not None
+    return await get_auth_config(request) is not None
 
 
 async def get_optional_user(request: Request) -> UserRecord | None:
@@ -53,17 +67,8 @@ async def get_optional_user(request: Request) -> UserRecord | None:
 
     Never raises — anonymous access is allowed.
     """
-    auth_config = get_auth_config(request)
+    auth_config = await get_auth_config(request)
     if not auth_config:
         return None
 
-    token = request.cookies.get("session")
-    if not token:
-        return None
-
-    payload = decode_jwt(token, auth_config.session_secret)
-    if not payload:
-        return None
-
-    repo = get_repo(request)
-    return await repo.get_user(int(payload["sub"]))
+    return await session_user(request, auth_config)
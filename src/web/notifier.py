@@ -0,0 +1,219 @@
+"""Fan-out of Postgres turn/status notifications to live stream clients.
+
+One dedicated asyncpg connection per process LISTENs on ``TURN_CHANNEL``
+(sent by ``save_turn``) and ``RUN_STATUS_CHANNEL`` (sent by ``update_run``
+for terminal statuses), and hands each notification to the queues
+subscribed to that run and to process-wide status listeners (the
+ProcrastinateBackend monitor). Streaming endpoints wait on their queue
+instead of polling. A dropped connection is re-established in the
+background.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+
+import asyncpg
+
+from src.persistence.postgres import (
+    RUN_STATUS_CHANNEL,
+    TERMINAL_RUN_STATUSES,
+    TURN_CHANNEL,
+    PostgresRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds between keepalives; also how often a stream re-checks the DB
+# in case a notification was missed.
+STREAM_KEEPALIVE = 15.0
+# Re-check interval when no LISTEN connection is available
+STREAM_POLL_INTERVAL = 1.0
+STREAM_BATCH = 100
+
+# Reconnect backoff for the LISTEN connection: doubles up to the maximum
+RECONNECT_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+
+class RunNotifier:
+    """Per-run subscriptions over a single LISTEN connection.
+
+    Queues receive ``("turn", turn_number)`` and ``("status", status)``
+    tuples, plus ``("reconnected", "")`` after the connection comes back.
+    Notifications can be coalesced or lost (e.g. while the connection is
+    down), so subscribers should treat them as a wake-up and re-read from
+    the repository rather than trust them as a complete log.
+    """
+
+    def __init__(self):
+        self._dsn: str | None = None
+        self._conn: asyncpg.Connection | None = None
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._status_listeners: list[Callable[[str, str], None]] = []
+        self._reconnect_task: asyncio.Task | None = None
+        self._stopping = False
+
+    @property
+    def listening(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    async def start(self, dsn: str) -> None:
+        """Open the LISTEN connection. On failure, poll until a retry succeeds."""
+        self._dsn = dsn
+        self._stopping = False
+        if not await self._connect():
+            logger.warning("Streams will poll until run notifications reconnect")
+            self._schedule_reconnect()
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            try:
+                await self._reconnect_task
+            except asyncio.CancelledError:
+                pass
+            self._reconnect_task = None
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            try:
+                await conn.close()
+            except Exception:
+                logger.warning("Error closing run notification listener", exc_info=True)
+
+    async def _connect(self) -> bool:
+        conn = None
+        try:
+            conn = await asyncpg.connect(self._dsn)
+            await conn.add_listener(TURN_CHANNEL, self._on_turn)
+            await conn.add_listener(RUN_STATUS_CHANNEL, self._on_status)
+            conn.add_termination_listener(self._on_terminated)
+        except Exception:
+            logger.exception("Failed to LISTEN for run notifications")
+            if conn is not None:
+                conn.terminate()
+            return False
+        self._conn = conn
+        return True
+
+    def _on_terminated(self, connection) -> None:
+        if self._stopping or connection is not self._conn:
+            return
+        logger.warning("Run notification connection lost; reconnecting")
+        self._conn = None
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self) -> None:
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+
+    async def _reconnect_loop(self) -> None:
+        delay = RECONNECT_DELAY
+        while not self._stopping:
+            await asyncio.sleep(delay)
+            if await self._connect():
+                logger.info("Run notification connection re-established")
+                # Anything sent while down was missed: have streams re-read
+                for run_id in list(self._subscribers):
+                    self._publish(run_id, ("reconnected", ""))
+                return
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    def add_status_listener(self, callback: Callable[[str, str], None]) -> None:
+        """Call ``callback(run_id, status)`` for every run status notification."""
+        self._status_listeners.append(callback)
+
+    def remove_status_listener(self, callback: Callable[[str, str], None]) -> None:
+        if callback in self._status_listeners:
+            self._status_listeners.remove(callback)
+
+    def subscribe(self, run_id: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(run_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, run_id: str, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(run_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[run_id]
+
+    def _publish(self, run_id: str, event: tuple[str, int | str]) -> None:
+        for queue in self._subscribers.get(run_id, ()):
+            queue.put_nowait(event)
+
+    def _on_turn(self, connection, pid: int, channel: str, payload: str) -> None:
+        """Handle a ``<run_id>:<turn_number>`` notification from save_turn."""
+        run_id, _, turn_number = payload.rpartition(":")
+        if run_id in self._subscribers:
+            self._publish(run_id, ("turn", int(turn_number)))
+
+    def _on_status(self, connection, pid: int, channel: str, payload: str) -> None:
+        """Handle a ``<run_id>:<status>`` notification from update_run."""
+        run_id, _, status = payload.rpartition(":")
+        if run_id in self._subscribers:
+            self._publish(run_id, ("status", status))
+        for callback in self._status_listeners:
+            callback(run_id, status)
+
+
+async def follow_run(
+    run_id: str,
+    after: int,
+    repo: PostgresRepository,
+    notifier: RunNotifier | None,
+    ended: bool,
+) -> AsyncIterator[tuple[str, dict | None]]:
+    """Yield a run's events for turns after ``after`` until the run ends.
+
+    Events are ``("turn", turn_dict)``, ``("keepalive", None)`` after
+    ``STREAM_KEEPALIVE`` quiet seconds, and a final ``("run_ended",
+    run_dict)``. Notifications only wake the stream; turns are always
+    re-read from the repository after the last one sent, so coalesced or
+    missed notifications cannot drop turns.
+    """
+    # Subscribed even while the connection is down, so the stream switches
+    # back to push as soon as the notifier reconnects
+    queue = notifier.subscribe(run_id) if notifier is not None else None
+    last_seen = after
+    try:
+        while True:
+            page = await repo.get_turns_page(
+                run_id, after_turn=last_seen, limit=STREAM_BATCH, as_dicts=True
+            )
+            turns = page[0] if page else []
+            for turn in turns:
+                yield "turn", turn
+                last_seen = turn["turn_number"]
+            if len(turns) == STREAM_BATCH:
+                continue  # still catching up
+
+            if ended:
+                run = await repo.get_run(run_id)
+                yield "run_ended", run.to_dict() if run else {"run_id": run_id}
+                return
+
+            if queue is not None and notifier.listening:
+                try:
+                    events = [await asyncio.wait_for(queue.get(), STREAM_KEEPALIVE)]
+                except asyncio.TimeoutError:
+                    yield "keepalive", None
+                else:
+                    while not queue.empty():
+                        events.append(queue.get_nowait())
+                    ended = any(
+                        kind == "status" and value in TERMINAL_RUN_STATUSES
+                        for kind, value in events
+                    )
+                    continue
+            else:
+                await asyncio.sleep(STREAM_POLL_INTERVAL)
+
+            # Nothing pushed (or no LISTEN connection): check the status directly
+            statuses = await repo.get_run_statuses([run_id])
+            ended = statuses.get(run_id, "stopped") in TERMINAL_RUN_STATUSES
+    finally:
+        if queue is not None:
+            notifier.unsubscribe(run_id, queue)
@@ -2,24 +2,32 @@
 
 Jobs are enqueued into PostgreSQL via Procrastinate; worker processes pick
 them up and run the full agent loop. The web server tracks active jobs and
-monitors completion by periodically checking the runs table.
+learns of completion via PostgreSQL LISTEN/NOTIFY, with a slow poll of the
+runs table as a safety net.
 """
 
 import asyncio
 import logging
+from datetime import datetime
 
 from src.persistence.models import RunRecord
+from src.persistence.postgres import TERMINAL_RUN_STATUSES
+from src.web.notifier import RunNotifier
 from src.web.run_config import RunConfig
 
 logger = logging.getLogger(__name__)
 
+# Poll interval once notifications are flowing (only catches missed ones)
+NOTIFY_POLL_INTERVAL = 60.0
+
 
 class ProcrastinateBackend:
     """Dispatches agent runs to Procrastinate worker processes.
 
     The web server enqueues jobs and tracks them. Workers (separate processes)
-    execute the actual agent loop. Completion is detected by monitoring
-    the ``runs`` table in PostgreSQL.
+    execute the actual agent loop. Completion is detected from run status
+    notifications (via the process's RunNotifier) and by periodically
+    checking the ``runs`` table.
     """
 
     def __init__(self, procrastinate_app, repo):
@@ -28,6 +36,8 @@ class ProcrastinateBackend:
         self._active_runs: set[str] = set()  # run_ids we believe are running
         self._monitor_task: asyncio.Task | None = None
         self._monitor_interval: float = 10.0
+        self._notifier: RunNotifier | None = None
+        self._has_runs = asyncio.Event()  # set while _active_runs may be non-empty
         self._on_finished_callback = None
 
     def set_on_finished_callback(self, callback):
@@ -36,35 +46,43 @@ class ProcrastinateBackend:
 
     async def start_run(self, run_id: str, config: RunConfig) -> None:
         """Create a placeholder RunRecord and enqueue a Procrastinate job."""
-        from datetime import datetime
-
         from src.worker.tasks import run_agent_task
 
         # Create placeholder run record so REST/WebSocket find it immediately
-        placeholder = RunRecord(
+        await self._repo.create_run(self._placeholder(run_id, config, datetime.now()))
+
+        # Enqueue the job for a worker to pick up
+        await run_agent_task.configure(queue="agent_runs").defer_async(
+            **self._job_kwargs(run_id, config)
+        )
+
+        self._active_runs.add(run_id)
+        self._has_runs.set()
+        logger.info(f"Enqueued job for run {run_id}")
+
+    @staticmethod
+    def _placeholder(run_id: str, config: RunConfig, started_at) -> RunRecord:
+        return RunRecord(
             run_id=run_id,
-            started_at=datetime.now(),
+            started_at=started_at,
             model=config.model,
             provider="openrouter",
             status="starting",
             user_id=config.user_id,
             visibility="public",
         )
-        await self._repo.create_run(placeholder)
 
-        # Enqueue the job for a worker to pick up
-        await run_agent_task.configure(queue="agent_runs").defer_async(
-            run_id=run_id,
-            user_id=config.user_id,
-            model=config.model,
-            character=config.character,
-            temperature=config.temperature,
-            reasoning=config.reasoning,
-            max_turns=config.max_turns,
-        )
-
-        self._active_runs.add(run_id)
-        logger.info(f"Enqueued job for run {run_id}")
+    @staticmethod
+    def _job_kwargs(run_id: str, config: RunConfig) -> dict:
+        return {
+            "run_id": run_id,
+            "user_id": config.user_id,
+            "model": config.model,
+            "character": config.character,
+            "temperature": config.temperature,
+            "reasoning": config.reasoning,
+            "max_turns": config.max_turns,
+        }
 
     async def stop_run(self, run_id: str) -> None:
         """Stop a run and finalize its record.
@@ -72,12 +90,10 @@ class ProcrastinateBackend:
         Sets the DB status directly to "stopped" so the record is fully
         resolved regardless of whether a worker is processing it.
         """
-        from datetime import datetime
-
         self._active_runs.discard(run_id)
 
         run = await self._repo.get_run(run_id)
-        if run and run.status not in ("stopped", "error", "completed"):
+        if run and run.status not in TERMINAL_RUN_STATUSES:
             # Populate final stats from peak turn values
             try:
                 peak = await self._repo.get_run_peak_stats(run_id)
@@ -93,6 +109,9 @@ class ProcrastinateBackend:
             run.end_reason = "stopped by user"
             run.ended_at = datetime.now()
             await self._repo.update_run(run)
+            # Untracked above, so the NOTIFY from update_run will not reach
+            # _mark_finished; refresh here instead.
+            self._repo.schedule_leaderboard_refresh()
 
         logger.info(f"Stopped run {run_id}")
 
@@ -102,9 +121,25 @@ class ProcrastinateBackend:
     def get_active_run_ids(self) -> list[str]:
         return list(self._active_runs)
 
-    async def start_monitoring(self, interval: float = 10.0) -> None:
-        """Start background task that detects completed runs."""
+    @property
+    def active_count(self) -> int:
+        return len(self._active_runs)
+
+    async def start_monitoring(
+        self, interval: float = 10.0, notifier: RunNotifier | None = None
+    ) -> None:
+        """Start background task that detects completed runs.
+
+        Args:
+            interval: Seconds between polls of the runs table.
+            notifier: Shared LISTEN connection. When given, terminal status
+                notifications finish runs immediately, and while it is
+                connected the poll relaxes to ``NOTIFY_POLL_INTERVAL``.
+        """
         self._monitor_interval = interval
+        if notifier is not None:
+            self._notifier = notifier
+            notifier.add_status_listener(self._on_run_status)
         self._monitor_task = asyncio.create_task(self._monitor_loop())
 
     async def stop_monitoring(self) -> None:
@@ -116,13 +151,43 @@ class ProcrastinateBackend:
             except asyncio.CancelledError:
                 pass
             self._monitor_task = None
+        if self._notifier is not None:
+            self._notifier.remove_status_listener(self._on_run_status)
+            self._notifier = None
+
+    def _poll_interval(self) -> float:
+        if self._notifier is not None and self._notifier.listening:
+            return max(self._monitor_interval, NOTIFY_POLL_INTERVAL)
+        return self._monitor_interval
+
+    def _on_run_status(self, run_id: str, status: str) -> None:
+        """Handle a run status notification relayed by the RunNotifier."""
+        if status in TERMINAL_RUN_STATUSES:
+            self._mark_finished(run_id, status)
+
+    def _mark_finished(self, run_id: str, status: str) -> None:
+        """Stop tracking a run and notify the RunManager, once."""
+        if run_id not in self._active_runs:
+            return
+        self._active_runs.discard(run_id)
+        self._repo.schedule_leaderboard_refresh()
+        if self._on_finished_callback:
+            self._on_finished_callback(run_id)
+        logger.info(f"Monitor: run {run_id} completed (status={status})")
 
     async def _monitor_loop(self) -> None:
-        """Periodically check runs table for completed runs."""
+        """Periodically check runs table for completed runs.
+
+        Idles on ``_has_runs`` while nothing is tracked, so an idle server
+        does not wake up every interval.
+        """
         while True:
             try:
-                await asyncio.sleep(self._monitor_interval)
+                await self._has_runs.wait()
+                await asyncio.sleep(self._poll_interval())
                 await self._check_completed_runs()
+                if not self._active_runs:
+                    self._has_runs.clear()
             except asyncio.CancelledError:
                 return
             except Exception:
@@ -133,22 +198,19 @@ class ProcrastinateBackend:
         if not self._active_runs:
             return
 
-        terminal_statuses = {"stopped", "error", "completed"}
-        for run_id in list(self._active_runs):
-            run = await self._repo.get_run(run_id)
-            if run and run.status in terminal_statuses:
-                self._active_runs.discard(run_id)
-                if self._on_finished_callback:
-                    self._on_finished_callback(run_id)
-                logger.info(f"Monitor: run {run_id} completed (status={run.status})")
+        statuses = await self._repo.get_run_statuses(list(self._active_runs))
+        for run_id, status in statuses.items():
+            if status in TERMINAL_RUN_STATUSES:
+                self._mark_finished(run_id, status)
 
     async def recover_state(self, active_runs: list[RunRecord]) -> None:
         """Rebuild tracking from a list of active RunRecords.
 
         Called on web server startup to re-populate the active runs set
-        from runs that are still in-progress in the database.
+        from runs that are still in-progress in the database. Purely
+        in-memory: the caller fetched ``active_runs`` in one query.
         """
-        self._active_runs.clear()
-        for run in active_runs:
-            self._active_runs.add(run.run_id)
+        self._active_runs = {run.run_id for run in active_runs}
+        if self._active_runs:
+            self._has_runs.set()
         logger.info(f"Recovered {len(self._active_runs)} active runs")
@@ -0,0 +1,37 @@
+"""orjson-backed JSON serialization for API responses.
+
+Records hand raw ``datetime`` values to the encoder (``to_dict`` does not
+pre-format them); orjson emits ISO 8601 natively in a single C pass.
+"""
+
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def dumps(content: Any) -> str:
+    """Serialize to a JSON string (for WebSocket text frames)."""
+    return orjson.dumps(content).decode("utf-8")
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Returning it directly from an endpoint also skips FastAPI's
+    ``jsonable_encoder`` pass over the payload.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+async def stream_json_array(items: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+    """Encode ``items`` as a JSON array, one chunk per element."""
+    yield b"["
+    sep = b""
+    async for item in items:
+        yield sep + orjson.dumps(item)
+        sep = b","
+    yield b"]"
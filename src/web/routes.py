@@ -1,17 +1,28 @@
 """REST API endpoints for runs, turns, and run management."""
 
+import asyncio
+import base64
+import hashlib
 import logging
+from collections.abc import AsyncIterator
+from datetime import datetime
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from src.cache import TTLCache
 from src.persistence.models import UserRecord
-from src.persistence.postgres import PostgresRepository
+from src.persistence.postgres import TERMINAL_RUN_STATUSES, PostgresRepository
 from src.web.auth import decrypt_key
+from src.web.notifier import RunNotifier, follow_run
+from src.web.responses import OrjsonResponse, stream_json_array
 from src.web.run_config import RunConfig
+from src.web.run_manager import RunManager
 
-from .deps import get_auth_config, get_current_user, get_repo
+from .deps import get_auth_config, get_current_user, get_http_client, get_notifier, get_repo
 
 logger = logging.getLogger(__name__)
 
@@ -37,9 +48,7 @@ async def start_run(
     repo: PostgresRepository = Depends(get_repo),
 ):
     """Start a new agent run. Requires authentication."""
-    from src.web.run_manager import RunManager
-
-    auth_config = get_auth_config(request)
+    auth_config = await get_auth_config(request)
     if not auth_config:
         raise HTTPException(500, "Auth not configured")
 
@@ -73,36 +82,73 @@ async def stop_run(
     user: UserRecord = Depends(get_current_user),
 ):
     """Stop a running agent run. Requires ownership."""
-    from src.web.run_manager import RunManager
-
     run_manager: RunManager = request.app.state.run_manager
     await run_manager.stop_run(run_id, user.id)
     return {"ok": True}
 
 
+MODELS_CACHE_TTL = 60.0
+
+# The OpenRouter model list is the same for every user, so one fetch per
+# TTL window serves everyone: (encoded body, etag) under a single key.
+_models_cache: TTLCache[str, tuple[bytes, str]] = TTLCache(MODELS_CACHE_TTL, 1)
+_models_lock = asyncio.Lock()
+
+
+def _models_response(request: Request, body: bytes, etag: str) -> Response:
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
 @router.get("/models")
 async def list_models(
     request: Request,
     user: UserRecord = Depends(get_current_user),
+    client: httpx.AsyncClient = Depends(get_http_client),
 ):
-    """List available OpenRouter models that support tool calling."""
-    auth_config = get_auth_config(request)
+    """List available OpenRouter models that support tool calling.
+
+    The list is cached in-process for ``MODELS_CACHE_TTL`` seconds and
+    served with an ETag, so repeat callers can get a 304.
+    """
+    auth_config = await get_auth_config(request)
     if not auth_config:
         raise HTTPException(500, "Auth not configured")
 
     if not user.encrypted_openrouter_key:
         raise HTTPException(400, "No OpenRouter API key stored")
 
-    api_key = decrypt_key(user.encrypted_openrouter_key, auth_config.encryption_key)
+    cached = _models_cache.get("models")
+    if cached:
+        return _models_response(request, *cached)
+
+    async with _models_lock:
+        # Another request may have refreshed the cache while we waited
+        cached = _models_cache.get("models")
+        if cached:
+            return _models_response(request, *cached)
+
+        models = await _fetch_models(client, user, auth_config.encryption_key)
+        body = orjson.dumps(models)
+        etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+        _models_cache.set("models", (body, etag))
+    return _models_response(request, body, etag)
+
+
+async def _fetch_models(
+    client: httpx.AsyncClient, user: UserRecord, encryption_key: str
+) -> list[dict]:
+    api_key = decrypt_key(user.encrypted_openrouter_key, encryption_key)
 
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                "https://openrouter.ai/api/v1/models",
-                params={"supported_parameters": "tools"},
-                headers={"Authorization": f"Bearer {api_key}"},
-                timeout=15.0,
-            )
+        resp = await client.get(
+            "https://openrouter.ai/api/v1/models",
+            params={"supported_parameters": "tools"},
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=15.0,
+        )
         if resp.status_code != 200:
             raise HTTPException(502, "Failed to fetch models from OpenRouter")
 
@@ -132,32 +178,87 @@ async def list_models(
 # === Run query endpoints (all public, no visibility filtering) ===
 
 
+def _encode_run_cursor(run: dict, sort_by: str) -> str:
+    """Opaque keyset cursor for the page after ``run`` in ``sort_by`` order."""
+    if sort_by == "score":
+        key = str(run["final_score"])
+    elif sort_by == "depth":
+        key = str(run["final_depth"])
+    else:
+        key = run["started_at"].isoformat()
+    raw = f"{key}|{run['id']}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_run_cursor(cursor: str, sort_by: str) -> tuple[datetime | int, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        key, run_pk = raw.rsplit("|", 1)
+        if sort_by == "recent":
+            return datetime.fromisoformat(key), int(run_pk)
+        return int(key), int(run_pk)
+    except (ValueError, UnicodeError):
+        raise HTTPException(400, "Invalid cursor")
+
+
 @router.get("/runs")
 async def list_runs(
     limit: int = Query(default=50, le=200),
-    offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description="X-Next-Cursor from the previous page"),
     sort_by: str = Query(default="recent", pattern="^(recent|score|depth)$"),
     model: str | None = Query(default=None),
     user_id: int | None = Query(default=None),
     repo: PostgresRepository = Depends(get_repo),
 ):
-    """List all runs with optional filtering and sorting."""
+    """List all runs with optional filtering and sorting.
+
+    A full page sets an ``X-Next-Cursor`` header; pass it back as ``cursor``
+    (with the same ``sort_by``) to fetch the next page.
+    """
+    cursor_started_at, cursor_value, cursor_id = None, None, None
+    if cursor:
+        key, cursor_id = _decode_run_cursor(cursor, sort_by)
+        if sort_by == "recent":
+            cursor_started_at = key
+        else:
+            cursor_value = key
+
     runs = await repo.list_runs(
         limit=limit,
-        offset=offset,
         sort_by=sort_by,
         model_filter=model,
         user_id=user_id,
+        cursor_started_at=cursor_started_at,
+        cursor_value=cursor_value,
+        cursor_id=cursor_id,
+        as_dicts=True,
     )
-    return [r.to_dict() for r in runs]
+    headers = None
+    if len(runs) == limit:
+        headers = {"X-Next-Cursor": _encode_run_cursor(runs[-1], sort_by)}
+    return OrjsonResponse(runs, headers=headers)
+
+
+RUN_MODELS_CACHE_TTL = 30.0
+
+# The set of models seen in runs changes rarely, so the DISTINCT scan is
+# shared across requests: the encoded body under a single key.
+_run_models_cache: TTLCache[str, bytes] = TTLCache(RUN_MODELS_CACHE_TTL, 1)
 
 
 @router.get("/runs/models")
 async def get_run_models(
     repo: PostgresRepository = Depends(get_repo),
 ):
-    """Get distinct model names from all runs."""
-    return await repo.list_distinct_models()
+    """Get distinct model names from all runs.
+
+    Cached in-process for ``RUN_MODELS_CACHE_TTL`` seconds.
+    """
+    body = _run_models_cache.get("models")
+    if body is None:
+        body = orjson.dumps(await repo.list_distinct_models())
+        _run_models_cache.set("models", body)
+    return Response(body, media_type="application/json")
 
 
 @router.get("/runs/{run_id}")
@@ -166,10 +267,10 @@ async def get_run(
     repo: PostgresRepository = Depends(get_repo),
 ):
     """Get a single run by ID."""
-    run = await repo.get_run(run_id)
+    run = await repo.get_run_cached(run_id)
     if not run:
         raise HTTPException(404, f"Run {run_id} not found")
-    return run.to_dict()
+    return OrjsonResponse(run.to_dict())
 
 
 # === Leaderboard ===
@@ -182,18 +283,22 @@ async def get_leaderboard(
     repo: PostgresRepository = Depends(get_repo),
 ):
     """Get model leaderboard with aggregated stats."""
-    return await repo.get_model_leaderboard(sort_by=sort_by, limit=limit)
+    return OrjsonResponse(await repo.get_model_leaderboard(sort_by=sort_by, limit=limit))
 
 
 # === Turn endpoints ===
 
 
-async def _check_run_exists(run_id: str, repo: PostgresRepository):
-    """Verify a run exists before returning its turns."""
-    run = await repo.get_run(run_id)
-    if not run:
-        raise HTTPException(404, f"Run {run_id} not found")
-    return run
+# Turn pages up to this size are built in memory; larger ones are streamed
+STREAM_TURNS_MIN_LIMIT = 50
+
+
+async def _turns_body(run_id: str, turns: AsyncIterator[dict], total: int) -> AsyncIterator[bytes]:
+    """The GET /runs/{run_id}/turns body, encoded as turns arrive."""
+    yield b'{"run_id":' + orjson.dumps(run_id) + b',"turns":'
+    async for chunk in stream_json_array(turns):
+        yield chunk
+    yield b',"total":' + orjson.dumps(total) + b"}"
 
 
 @router.get("/runs/{run_id}/turns")
@@ -203,15 +308,33 @@ async def get_turns(
     limit: int = Query(default=100, le=500),
     repo: PostgresRepository = Depends(get_repo),
 ):
-    """Get turns for a run. Use 'after' for pagination or live polling."""
-    await _check_run_exists(run_id, repo)
+    """Get turns for a run. Use 'after' for pagination or live polling.
+
+    The run lookup, page and total come from a single query. Pages larger
+    than ``STREAM_TURNS_MIN_LIMIT`` are instead streamed a chunk of turns at
+    a time rather than built in memory.
+    """
+    if limit > STREAM_TURNS_MIN_LIMIT:
+        streamed = await repo.stream_turns_page(run_id, after_turn=after, limit=limit)
+        if streamed is None:
+            raise HTTPException(404, f"Run {run_id} not found")
+        turns, total = streamed
+        return StreamingResponse(
+            _turns_body(run_id, turns, total),
+            media_type="application/json",
+        )
 
-    turns = await repo.get_turns(run_id, after_turn=after, limit=limit)
-    return {
-        "run_id": run_id,
-        "turns": [t.to_dict() for t in turns],
-        "total": await repo.count_turns(run_id),
-    }
+    page = await repo.get_turns_page(run_id, after_turn=after, limit=limit, as_dicts=True)
+    if page is None:
+        raise HTTPException(404, f"Run {run_id} not found")
+    turns, total = page
+    return OrjsonResponse(
+        {
+            "run_id": run_id,
+            "turns": turns,
+            "total": total,
+        }
+    )
 
 
 @router.get("/runs/{run_id}/turns/latest")
@@ -220,12 +343,56 @@ async def get_latest_turn(
     repo: PostgresRepository = Depends(get_repo),
 ):
     """Get the most recent turn for a run."""
-    await _check_run_exists(run_id, repo)
-
-    turn = await repo.get_latest_turn(run_id)
+    run_exists, turn = await repo.get_turn_of_run(run_id)
+    if not run_exists:
+        raise HTTPException(404, f"Run {run_id} not found")
     if not turn:
         raise HTTPException(404, f"No turns found for run {run_id}")
-    return turn.to_dict()
+    return OrjsonResponse(turn.to_dict())
+
+
+def _sse(event: str, data: dict) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _turn_event_stream(
+    run_id: str,
+    after: int,
+    repo: PostgresRepository,
+    notifier: RunNotifier | None,
+    ended: bool,
+) -> AsyncIterator[bytes]:
+    """SSE frames for ``follow_run``'s events, with comment keepalives."""
+    async for event, data in follow_run(run_id, after, repo, notifier, ended):
+        if event == "keepalive":
+            yield b": keepalive\n\n"
+        else:
+            yield _sse(event, data)
+
+
+@router.get("/runs/{run_id}/turns/stream")
+async def stream_turns(
+    run_id: str,
+    after: int = Query(default=0, ge=0, description="Stream turns after this turn_number"),
+    repo: PostgresRepository = Depends(get_repo),
+    notifier: RunNotifier | None = Depends(get_notifier),
+):
+    """Stream a run's turns as server-sent events.
+
+    Sends ``turn`` events (as in GET /runs/{run_id}/turns) as they are saved,
+    then one ``run_ended`` event with the final run record. New turns are
+    pushed via Postgres LISTEN/NOTIFY; the polling endpoint keeps working
+    for clients without EventSource.
+    """
+    statuses = await repo.get_run_statuses([run_id])
+    if run_id not in statuses:
+        raise HTTPException(404, f"Run {run_id} not found")
+    ended = statuses[run_id] in TERMINAL_RUN_STATUSES
+    return StreamingResponse(
+        _turn_event_stream(run_id, after, repo, notifier, ended),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/runs/{run_id}/turns/{turn_number}")
@@ -235,9 +402,9 @@ async def get_turn(
     repo: PostgresRepository = Depends(get_repo),
 ):
     """Get a specific turn."""
-    await _check_run_exists(run_id, repo)
-
-    turn = await repo.get_turn(run_id, turn_number)
+    run_exists, turn = await repo.get_turn_of_run(run_id, turn_number)
+    if not run_exists:
+        raise HTTPException(404, f"Run {run_id} not found")
     if not turn:
         raise HTTPException(404, f"Turn {turn_number} not found in run {run_id}")
-    return turn.to_dict()
+    return OrjsonResponse(turn.to_dict())
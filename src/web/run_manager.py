@@ -5,16 +5,21 @@ The RunBackend protocol allows swapping between in-process asyncio tasks
 without changing the RunManager.
 """
 
+import asyncio
 import logging
-import uuid
+import os
+from collections import defaultdict
 from typing import Protocol, runtime_checkable
 
 from fastapi import HTTPException
 
+from src.web.procrastinate_backend import ProcrastinateBackend
 from src.web.run_config import RunConfig
 
 logger = logging.getLogger(__name__)
 
+_NO_RUNS: frozenset[str] = frozenset()
+
 
 @runtime_checkable
 class RunBackend(Protocol):
@@ -40,6 +45,11 @@ class RunBackend(Protocol):
         """List all active run IDs."""
         ...
 
+    @property
+    def active_count(self) -> int:
+        """Number of active runs, without building the ID list."""
+        ...
+
 
 class InProcessBackend:
     """Runs agents as asyncio tasks in the web server process.
@@ -70,7 +80,7 @@ class InProcessBackend:
 
         api_key = decrypt_key(user.encrypted_openrouter_key, self._auth_config.encryption_key)
 
-        agent, api = create_agent_for_run(
+        agent, api = await create_agent_for_run(
             api_key=api_key,
             model=config.model,
             character=config.character,
@@ -101,9 +111,17 @@ class InProcessBackend:
     def get_active_run_ids(self) -> list[str]:
         return [rid for rid, r in self._runners.items() if r.is_running]
 
+    @property
+    def active_count(self) -> int:
+        # Runners leave _runners on stop_run() or via remove() when they
+        # finish, so its size is the active count.
+        return len(self._runners)
+
     def remove(self, run_id: str) -> None:
         """Remove a finished run from tracking (no stop)."""
         self._runners.pop(run_id, None)
+        if self._repo is not None:
+            self._repo.schedule_leaderboard_refresh()
 
 
 class RunManager:
@@ -114,6 +132,11 @@ class RunManager:
     - Global concurrency limits
     - Ownership tracking for authorization
     - Automatic cleanup when runs finish
+
+    Limits are counted in memory by default. When a repository is given
+    (worker mode, where several API processes can share one queue), they
+    are counted from the runs table instead, so every process enforces
+    the same totals.
     """
 
     def __init__(
@@ -121,22 +144,27 @@ class RunManager:
         backend: RunBackend,
         max_runs_per_user: int = 1,
         max_total_runs: int = 10,
+        repo=None,
     ):
         self._backend = backend
         self._max_per_user = max_runs_per_user
         self._max_total = max_total_runs
+        self._repo = repo
 
         # Ownership tracking (in-memory, reset on server restart)
         self._run_owners: dict[str, int] = {}  # run_id -> user_id
-        self._user_runs: dict[int, set[str]] = {}  # user_id -> {run_ids}
+        # user_id -> {run_ids}; a user's entry is dropped when it empties
+        self._user_runs: defaultdict[int, set[str]] = defaultdict(set)
+
+        # Admission: limits are checked and a slot reserved under the lock.
+        # _starting holds reserved runs (run_id -> user_id) that neither the
+        # backend nor the runs table reports yet.
+        self._admit_lock = asyncio.Lock()
+        self._starting: dict[str, int] = {}
 
     def _on_run_finished(self, run_id: str) -> None:
         """Callback invoked when a run ends (game over, error, etc.)."""
-        user_id = self._run_owners.pop(run_id, None)
-        if user_id is not None and user_id in self._user_runs:
-            self._user_runs[user_id].discard(run_id)
-            if not self._user_runs[user_id]:
-                del self._user_runs[user_id]
+        user_id = self._release(run_id)
 
         # Remove from backend tracking
         if isinstance(self._backend, InProcessBackend):
@@ -156,41 +184,74 @@ class RunManager:
         """Start a run with concurrency checks. Returns run_id.
 
         Generates a run_id, sets it on the config, and delegates to the backend.
+        The slot is reserved before the backend is awaited, so concurrent
+        requests cannot both pass the limit checks; it is released again if
+        the backend fails to start the run.
         """
-        # Check per-user limit
-        user_active = self._user_runs.get(user_id, set())
-        if len(user_active) >= self._max_per_user:
-            raise HTTPException(
-                429,
-                f"Concurrent run limit reached ({self._max_per_user} per user). "
-                "Stop your current run first.",
-            )
-
-        # Check global limit
-        active_count = len(self._backend.get_active_run_ids())
-        if active_count >= self._max_total:
-            raise HTTPException(
-                429,
-                f"Server run limit reached ({self._max_total} total). Try again later.",
-            )
-
-        # Generate run_id and stamp it on the config
-        run_id = f"run_{uuid.uuid4().hex[:12]}"
+        # 48 random bits, same shape as the old uuid4().hex[:12]. A collision
+        # fails ProcrastinateBackend's placeholder insert, but InProcessBackend's
+        # first write is upsert_run, which would overwrite the existing row;
+        # at 48 bits the odds are negligible for this table's size.
+        run_id = f"run_{os.urandom(6).hex()}"
+
+        async with self._admit_lock:
+            user_count, total_count = await self._active_counts(user_id)
+
+            # Check per-user limit
+            if user_count >= self._max_per_user:
+                raise HTTPException(
+                    429,
+                    f"Concurrent run limit reached ({self._max_per_user} per user). "
+                    "Stop your current run first.",
+                )
+
+            # Check global limit
+            if total_count >= self._max_total:
+                raise HTTPException(
+                    429,
+                    f"Server run limit reached ({self._max_total} total). Try again later.",
+                )
+
+            # Reserve ownership before starting
+            self._run_owners[run_id] = user_id
+            self._user_runs[user_id].add(run_id)
+            self._starting[run_id] = user_id
+
         config.run_id = run_id
         config.user_id = user_id
 
         # Start the run via backend
-        await self._backend.start_run(run_id, config)
-
-        # Track ownership
-        self._run_owners[run_id] = user_id
-        if user_id not in self._user_runs:
-            self._user_runs[user_id] = set()
-        self._user_runs[user_id].add(run_id)
+        try:
+            await self._backend.start_run(run_id, config)
+        except BaseException:
+            self._release(run_id)
+            raise
+        finally:
+            del self._starting[run_id]
 
         logger.info(f"Run {run_id} started for user {user_id}")
         return run_id
 
+    async def _active_counts(self, user_id: int) -> tuple[int, int]:
+        """(runs active for ``user_id``, runs active in total), incl. reservations."""
+        if self._repo is None:
+            user_count = len(self._user_runs.get(user_id, _NO_RUNS))
+            return user_count, self._backend.active_count + len(self._starting)
+
+        user_count, total_count = await self._repo.count_active_runs(user_id)
+        user_starting = sum(1 for uid in self._starting.values() if uid == user_id)
+        return user_count + user_starting, total_count + len(self._starting)
+
+    def _release(self, run_id: str) -> int | None:
+        """Drop ownership tracking for a run and return its owner."""
+        user_id = self._run_owners.pop(run_id, None)
+        user_active = self._user_runs.get(user_id)
+        if user_active is not None:
+            user_active.discard(run_id)
+            if not user_active:
+                del self._user_runs[user_id]
+        return user_id
+
     async def stop_run(self, run_id: str, user_id: int) -> None:
         """Stop a run. Raises 404 if not running, 403 if not owner."""
         if not self._backend.is_running(run_id):
@@ -204,9 +265,7 @@ class RunManager:
 
         # Clean up ownership (stop_run triggers finalize which calls _on_run_finished,
         # but do it here too for safety)
-        self._run_owners.pop(run_id, None)
-        if user_id in self._user_runs:
-            self._user_runs[user_id].discard(run_id)
+        self._release(run_id)
 
         logger.info(f"Run {run_id} stopped by user {user_id}")
 
@@ -225,18 +284,14 @@ class RunManager:
     async def recover_state(self, repo) -> None:
         """Rebuild ownership maps from the database after a restart.
 
-        Queries runs with status 'running' or 'starting' and
-        re-populates the in-memory tracking maps. For ProcrastinateBackend,
-        also rebuilds job ID tracking.
+        Queries runs with status 'running' or 'starting' in one round-trip
+        and re-populates the in-memory tracking maps. For
+        ProcrastinateBackend, also rebuilds its tracked-run columns.
         """
-        from src.web.procrastinate_backend import ProcrastinateBackend
-
         active_runs = await repo.list_runs_by_status(["running", "starting"])
         for run in active_runs:
             if run.user_id is not None:
                 self._run_owners[run.run_id] = run.user_id
-                if run.user_id not in self._user_runs:
-                    self._user_runs[run.user_id] = set()
                 self._user_runs[run.user_id].add(run.run_id)
 
         if isinstance(self._backend, ProcrastinateBackend):
@@ -254,8 +309,8 @@ class RunManager:
         return self._run_owners.get(run_id)
 
     def get_user_active_runs(self, user_id: int) -> list[str]:
-        return list(self._user_runs.get(user_id, set()))
+        return list(self._user_runs.get(user_id, _NO_RUNS))
 
     @property
     def active_count(self) -> int:
-        return len(self._backend.get_active_run_ids())
+        return self._backend.active_count
@@ -6,6 +6,7 @@ analogous to TUIAgentRunner emitting Textual events.
 
 import asyncio
 import logging
+import time
 from collections.abc import Callable
 from dataclasses import asdict
 from datetime import datetime
@@ -18,6 +19,16 @@ from src.persistence.postgres import PostgresRepository
 
 logger = logging.getLogger(__name__)
 
+# Buffered turns are written once this many accumulate, on the first step
+# ending more than this many seconds after the previous flush, or every this
+# many seconds while a long step (an LLM call) is still running.
+TURN_FLUSH_SIZE = 10
+TURN_FLUSH_INTERVAL = 0.5
+
+# 24-line game-over screen; the score and stats lines (pre-centered to 80
+# columns) are filled in with %.
+_GAME_OVER_TEMPLATE = "\n" * 8 + "GAME OVER".center(80) + "\n\n%s\n%s" + "\n" * 12
+
 
 class WebAgentRunner:
     """Wraps NetHackAgent to persist turns for the web interface.
@@ -47,6 +58,13 @@ class WebAgentRunner:
         self._running = False
         self._run_record: RunRecord | None = None
         self._turn_counter = 0
+        self._pending_turns: list[TurnRecord] = []
+        self._last_flush = time.monotonic()
+        # Serialized inventory keyed on (game turn, dungeon level), and the
+        # #overview text keyed on (dungeon level, depth): reused while the
+        # key is unchanged, since #overview runs a game command every call.
+        self._inv_cache: tuple[tuple[int, int], list[dict] | None] | None = None
+        self._overview_cache: tuple[tuple[int, int], str | None] | None = None
 
     @property
     def run_id(self) -> str | None:
@@ -77,17 +95,10 @@ class WebAgentRunner:
         episode_id = self.agent._result.episode_id
 
         # If a run_id was provided, a placeholder RunRecord may already exist
-        # (created by ProcrastinateBackend). Update it instead of inserting.
-        existing = await self.repo.get_run(episode_id) if run_id else None
-        if existing:
-            existing.model = self.agent.llm.model
-            existing.provider = self.agent.llm.provider
-            existing.config_snapshot = config_snapshot
-            existing.status = "running"
-            await self.repo.update_run(existing)
-            self._run_record = existing
-        else:
-            self._run_record = RunRecord(
+        # (created by ProcrastinateBackend). The upsert updates it in place,
+        # keeping its started_at/user_id, or inserts a fresh record.
+        self._run_record = await self.repo.upsert_run(
+            RunRecord(
                 run_id=episode_id,
                 started_at=datetime.now(),
                 model=self.agent.llm.model,
@@ -97,7 +108,7 @@ class WebAgentRunner:
                 user_id=self._user_id,
                 visibility="public",
             )
-            self._run_record = await self.repo.create_run(self._run_record)
+        )
         self._turn_counter = 0
 
         self._task = asyncio.create_task(self._run_loop())
@@ -123,15 +134,18 @@ class WebAgentRunner:
                 pre_state = self._capture_game_state()
 
                 try:
-                    decision = await self.agent.step()
+                    decision = await self._step()
                 except asyncio.CancelledError:
                     logger.info("Agent step cancelled")
                     raise
 
                 if decision and decision.is_valid:
-                    turn = self._build_turn_record(pre_state, decision)
-                    await self.repo.save_turn(turn)
-                    await self._update_run_stats()
+                    self._pending_turns.append(self._build_turn_record(pre_state, decision))
+                    if (
+                        len(self._pending_turns) >= TURN_FLUSH_SIZE
+                        or time.monotonic() - self._last_flush > TURN_FLUSH_INTERVAL
+                    ):
+                        await self._flush_turns()
 
                 await asyncio.sleep(0)  # Yield to event loop
 
@@ -151,6 +165,11 @@ class WebAgentRunner:
 
         finally:
             self._running = False
+            # Normally already flushed by _finalize_run; this is a safety net
+            try:
+                await self._flush_turns()
+            except Exception as e:
+                logger.warning(f"Failed to flush turns: {e}")
             # Clean up NLE environment
             try:
                 self.api.close()
@@ -179,22 +198,32 @@ class WebAgentRunner:
         try:
             stats = self.api.get_stats()
             # Serialize inventory items to dicts
-            inventory = None
-            try:
-                items = self.api.get_inventory()
-                if items:
-                    inventory = [
-                        {"slot": item.slot, "name": item.name, "quantity": item.quantity}
-                        for item in items
-                    ]
-            except Exception:
-                pass
+            inv_key = (stats.turn, stats.dungeon_level)
+            if self._inv_cache and self._inv_cache[0] == inv_key:
+                inventory = self._inv_cache[1]
+            else:
+                inventory = None
+                try:
+                    items = self.api.get_inventory()
+                    if items:
+                        inventory = [
+                            {"slot": item.slot, "name": item.name, "quantity": item.quantity}
+                            for item in items
+                        ]
+                    self._inv_cache = (inv_key, inventory)
+                except Exception:
+                    pass
             # Get dungeon overview (free action, no turn consumed)
-            dungeon_overview = None
-            try:
-                dungeon_overview = self.api.get_overview() or None
-            except Exception:
-                pass
+            overview_key = (stats.dungeon_level, stats.depth)
+            if self._overview_cache and self._overview_cache[0] == overview_key:
+                dungeon_overview = self._overview_cache[1]
+            else:
+                dungeon_overview = None
+                try:
+                    dungeon_overview = self.api.get_overview() or None
+                    self._overview_cache = (overview_key, dungeon_overview)
+                except Exception:
+                    pass
             return {
                 "screen": self.api.get_screen(),
                 "screen_colors": self.api.get_screen_colors(),
@@ -267,6 +296,7 @@ class WebAgentRunner:
         if not self._run_record:
             return
         try:
+            await self._flush_turns()
             # Pull peak stats from previously saved turns (NLE zeroes stats
             # after death, so the live observation is unreliable).
             peak = await self.repo.get_run_peak_stats(self._run_record.run_id)
@@ -276,14 +306,10 @@ class WebAgentRunner:
             game_turn = peak["game_turn"] if peak else 0
 
             # Build a simple game-over screen (80-col centered)
-            lines = [""] * 8
-            lines.append("GAME OVER".center(80))
-            lines.append("")
-            lines.append(f"Score: {score}".center(80))
-            lines.append(f"Depth: {depth}   XL: {xp_level}   Turns: {game_turn}".center(80))
-            lines.append("")
-            lines.extend([""] * (24 - len(lines)))
-            game_over_screen = "\n".join(lines)
+            game_over_screen = _GAME_OVER_TEMPLATE % (
+                f"Score: {score}".center(80),
+                f"Depth: {depth}   XL: {xp_level}   Turns: {game_turn}".center(80),
+            )
 
             self._turn_counter += 1
             final_turn = TurnRecord(
@@ -317,12 +343,41 @@ class WebAgentRunner:
         except Exception as e:
             logger.warning(f"Failed to save final turn: {e}")
 
-    async def _update_run_stats(self) -> None:
-        """Update running totals on the RunRecord."""
-        if not self._run_record:
+    async def _step(self):
+        """Run one agent step, flushing buffered turns while it is in flight.
+
+        Without this, turns buffered by quick steps stay invisible to
+        viewers for the whole of the next LLM call.
+        """
+        step = asyncio.ensure_future(self.agent.step())
+        try:
+            while not step.done():
+                await asyncio.wait({step}, timeout=TURN_FLUSH_INTERVAL)
+                if not step.done() and self._pending_turns:
+                    try:
+                        await self._flush_turns()
+                    except Exception as e:
+                        # Turns stay buffered; the next flush retries them
+                        logger.warning(f"Failed to flush turns: {e}")
+        except BaseException:
+            # Let the step finish unwinding before the caller closes the env
+            step.cancel()
+            await asyncio.gather(step, return_exceptions=True)
+            raise
+        return step.result()
+
+    async def _flush_turns(self) -> None:
+        """Write buffered turns in one batch.
+
+        The batch also bumps the run's ``total_agent_turns``, so no separate
+        run update is needed. The buffer is only cleared once the write
+        succeeds, so a failed flush is retried by the next one.
+        """
+        self._last_flush = time.monotonic()
+        if not self._pending_turns:
             return
-        self._run_record.total_agent_turns = self._turn_counter
-        await self.repo.update_run(self._run_record)
+        await self.repo.save_turns_batch(self._pending_turns)
+        self._pending_turns = []
 
     def _determine_end_reason(self) -> str:
         if not self._running:
@@ -338,12 +393,17 @@ class WebAgentRunner:
         if not self._run_record:
             return
 
+        # Peak stats below are read from the saved turns
+        try:
+            await self._flush_turns()
+        except Exception as e:
+            logger.warning(f"Failed to flush turns: {e}")
+
         try:
             result = self.agent.end_episode(end_reason)
             self._run_record.final_score = result.final_score
             self._run_record.final_game_turns = result.final_turns
             self._run_record.final_depth = result.final_depth
-            self._run_record.total_agent_turns = result.decisions_made
         except Exception as e:
             logger.warning(f"Failed to get final stats: {e}")
 
@@ -1,16 +1,34 @@
 """WebSocket handler for live turn streaming."""
 
-import asyncio
 import logging
+from collections import OrderedDict
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from src.persistence.postgres import PostgresRepository
+from src.persistence.postgres import TERMINAL_RUN_STATUSES, PostgresRepository
+from src.web.notifier import follow_run
+from src.web.responses import dumps
 
 logger = logging.getLogger(__name__)
 
 ws_router = APIRouter()
 
+# Encoded {"type": "turn"} frames keyed by (run_id, turn_number). Saved turns
+# never change, so every subscriber to a run reuses one encoding per turn.
+TURN_FRAME_CACHE_MAX = 1024
+_turn_frames: OrderedDict[tuple[str, int], str] = OrderedDict()
+
+
+def _turn_frame(run_id: str, turn: dict) -> str:
+    key = (run_id, turn["turn_number"])
+    frame = _turn_frames.get(key)
+    if frame is None:
+        frame = dumps({"type": "turn", "data": turn})
+        _turn_frames[key] = frame
+        if len(_turn_frames) > TURN_FRAME_CACHE_MAX:
+            _turn_frames.popitem(last=False)
+    return frame
+
 
 @ws_router.websocket("/ws/runs/{run_id}/live")
 async def live_stream(websocket: WebSocket, run_id: str):
@@ -19,45 +37,26 @@ async def live_stream(websocket: WebSocket, run_id: str):
     Protocol:
     - Server sends JSON messages: {"type": "turn", "data": {...}}
     - Server sends {"type": "run_ended", "data": {...}} when the run finishes
-    - Server polls the repository for new turns (decoupled from agent runner)
+    - New turns are pushed via the app's RunNotifier (Postgres LISTEN/NOTIFY);
+      without a LISTEN connection the stream falls back to polling
     """
     repo: PostgresRepository = websocket.app.state.repo
+    notifier = getattr(websocket.app.state, "notifier", None)
     await websocket.accept()
 
-    run = await repo.get_run(run_id)
-    if not run:
+    statuses = await repo.get_run_statuses([run_id])
+    if run_id not in statuses:
         await websocket.send_json({"type": "error", "message": f"Run {run_id} not found"})
         await websocket.close()
         return
-
-    last_seen_turn = 0
-    poll_interval = 0.3
+    ended = statuses[run_id] in TERMINAL_RUN_STATUSES
 
     try:
-        while True:
-            new_turns = await repo.get_turns(run_id, after_turn=last_seen_turn, limit=50)
-
-            for turn in new_turns:
-                await websocket.send_json(
-                    {
-                        "type": "turn",
-                        "data": turn.to_dict(),
-                    }
-                )
-                last_seen_turn = turn.turn_number
-
-            # Check if run has ended
-            run = await repo.get_run(run_id)
-            if run and run.status in ("stopped", "error", "completed"):
-                await websocket.send_json(
-                    {
-                        "type": "run_ended",
-                        "data": run.to_dict(),
-                    }
-                )
-                break
-
-            await asyncio.sleep(poll_interval)
+        async for event, data in follow_run(run_id, 0, repo, notifier, ended):
+            if event == "turn":
+                await websocket.send_text(_turn_frame(run_id, data))
+            elif event != "keepalive":
+                await websocket.send_text(dumps({"type": event, "data": data}))
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket client disconnected from run {run_id}")
@@ -1,7 +1,8 @@
 """Procrastinate task definitions for agent runs.
 
 Each task runs in a worker process, completely separate from the web server.
-The worker creates its own agent, API, and repository instances.
+Each job creates its own agent and API; jobs in one worker process share a
+single pooled engine and repository.
 
 Tasks are registered on the module-level App from ``src.worker.app``.
 The App must be configured (via ``configure(conninfo)``) before tasks are
@@ -19,6 +20,32 @@ logger = logging.getLogger(__name__)
 # so procrastinate imports this module when the worker starts.
 _app = get_app()
 
+# Shared by every job in this worker process; created on first use so the
+# pool is bound to the worker's event loop.
+_engine = None
+_repo = None
+
+
+def _get_repo(config):
+    """Return the process-wide repository, creating its engine on first use."""
+    global _engine, _repo
+    if _repo is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        from src.persistence.postgres import PostgresRepository
+
+        _engine = create_async_engine(config.database.url, **config.database.engine_options)
+        _repo = PostgresRepository(_engine)
+    return _repo
+
+
+async def dispose_engine() -> None:
+    """Close the shared engine's connections (on worker shutdown)."""
+    global _engine, _repo
+    if _engine is not None:
+        engine, _engine, _repo = _engine, None, None
+        await engine.dispose()
+
 
 async def _mark_run_error(repo, run_id: str, reason: str) -> None:
     """Mark a run as errored in the database."""
@@ -55,10 +82,7 @@ async def run_agent_task(
     asyncio.CancelledError when a job is aborted, and
     WebAgentRunner._run_loop already handles that correctly.
     """
-    from sqlalchemy.ext.asyncio import create_async_engine
-
     from src.config import load_config
-    from src.persistence.postgres import PostgresRepository
     from src.web.agent_factory import create_agent_for_run
     from src.web.auth import decrypt_key
     from src.web.runner import WebAgentRunner
@@ -66,14 +90,9 @@ async def run_agent_task(
     logger.info(f"Worker picked up job: run_id={run_id}, model={model}")
 
     config = load_config()
-    engine = create_async_engine(
-        config.database.url,
-        pool_size=config.database.pool_min_size,
-    )
+    repo = _get_repo(config)
 
     try:
-        repo = PostgresRepository(engine)
-
         # Fetch user and decrypt API key
         user = await repo.get_user(user_id)
         if not user:
@@ -95,7 +114,7 @@ async def run_agent_task(
 
         # Create agent and game environment
         try:
-            agent, api = create_agent_for_run(
+            agent, api = await create_agent_for_run(
                 api_key=api_key,
                 model=model,
                 character=character,
@@ -129,5 +148,3 @@ async def run_agent_task(
         except Exception:
             logger.exception("Failed to mark run as errored")
         raise
-    finally:
-        await engine.dispose()
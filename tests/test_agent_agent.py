@@ -455,3 +455,35 @@ class TestAgentConversation:
         with patch('src.agent.agent.EpisodeMemory'):
             self.agent.start_episode(mock_api)
             assert len(self.agent._conversation) == 0
+
+    def test_compress_assistant_message_compacts_tool_call(self):
+        """Test old tool calls keep the tool name but drop arguments."""
+        msg = {
+            "role": "assistant",
+            "content": '{"tool":"execute_code","arguments":{"code":"nh.move(Direction.E)"}}',
+            "reasoning_details": [{"type": "reasoning.text"}],
+        }
+        compressed = self.agent._compress_assistant_message(msg, compact_arguments=True)
+
+        assert compressed == {
+            "role": "assistant",
+            "content": '{"tool":"execute_code","arguments":"[compacted]"}',
+            "reasoning_details": [{"type": "reasoning.text"}],
+        }
+
+    def test_compress_assistant_message_keeps_plain_text(self):
+        """Test non-JSON assistant content passes through compaction."""
+        msg = {"role": "assistant", "content": "I will explore."}
+        compressed = self.agent._compress_assistant_message(msg, compact_arguments=True)
+        assert compressed == {"role": "assistant", "content": "I will explore."}
+
+    def test_compacted_content_is_memoized(self):
+        """Test a compacted tool call is parsed once, then reused."""
+        msg = {"role": "assistant", "content": '{"tool":"wait","arguments":{}}'}
+        self.agent._compress_assistant_message(msg, compact_arguments=True)
+        assert msg["_compacted_content"] == '{"tool":"wait","arguments":"[compacted]"}'
+
+        with patch("src.agent.agent.orjson.loads") as mock_loads:
+            compressed = self.agent._compress_assistant_message(msg, compact_arguments=True)
+        mock_loads.assert_not_called()
+        assert compressed == {"role": "assistant", "content": msg["_compacted_content"]}
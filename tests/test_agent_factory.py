@@ -0,0 +1,109 @@
+"""Tests for the per-run agent factory's environment pool."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.config import Config
+from src.web import agent_factory
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """Empty pool with environment construction replaced by mocks."""
+    config = Config()
+    config.environment.api_pool_size = 2
+    monkeypatch.setattr(agent_factory, "_cached_config", lambda: config)
+    monkeypatch.setattr(agent_factory, "_API_POOL", asyncio.Queue())
+    monkeypatch.setattr(agent_factory, "_refill_task", None)
+    monkeypatch.setattr(agent_factory, "_pool_enabled", False)
+    built = []
+
+    def fake_new_api(cfg, character):
+        api = MagicMock(name=f"api-{len(built)}")
+        api.character = character
+        built.append(api)
+        return api
+
+    monkeypatch.setattr(agent_factory, "_new_api", fake_new_api)
+    return config, built
+
+
+class TestApiPool:
+    async def test_prewarm_fills_to_size(self, pool):
+        _, built = pool
+        await agent_factory.prewarm_api_pool()
+        assert agent_factory._API_POOL.qsize() == 2
+        assert len(built) == 2
+
+    async def test_take_pops_pooled_env_and_refills(self, pool):
+        config, built = pool
+        await agent_factory.prewarm_api_pool()
+
+        api = agent_factory._take_pooled_api(config, agent_factory.POOLED_CHARACTER)
+        assert api is built[0]
+
+        await agent_factory._refill_task
+        assert agent_factory._API_POOL.qsize() == 2
+        assert len(built) == 3
+
+    async def test_take_returns_none_when_empty(self, pool):
+        config, _ = pool
+        await agent_factory.prewarm_api_pool()
+        agent_factory._API_POOL = asyncio.Queue()
+        assert agent_factory._take_pooled_api(config, agent_factory.POOLED_CHARACTER) is None
+        await agent_factory.close_api_pool()
+
+    async def test_no_refill_unless_prewarmed(self, pool):
+        config, built = pool
+        assert agent_factory._take_pooled_api(config, agent_factory.POOLED_CHARACTER) is None
+        assert agent_factory._refill_task is None
+        assert built == []
+
+    async def test_close_disables_pool(self, pool):
+        config, _ = pool
+        await agent_factory.prewarm_api_pool()
+        await agent_factory.close_api_pool()
+        assert agent_factory._take_pooled_api(config, agent_factory.POOLED_CHARACTER) is None
+        assert agent_factory._refill_task is None
+
+    async def test_other_characters_bypass_pool(self, pool):
+        config, built = pool
+        await agent_factory.prewarm_api_pool()
+
+        assert agent_factory._take_pooled_api(config, "val-hum-fem-law") is None
+        assert agent_factory._API_POOL.qsize() == 2
+        assert agent_factory._refill_task is None
+
+    async def test_close_closes_pooled_envs(self, pool):
+        _, built = pool
+        await agent_factory.prewarm_api_pool()
+        await agent_factory.close_api_pool()
+        assert agent_factory._API_POOL.empty()
+        for api in built:
+            api.close.assert_called_once()
+
+
+class TestCreateAgentForRun:
+    async def test_builds_off_the_event_loop(self, pool, monkeypatch):
+        loop_thread = threading.get_ident()
+        calls = []
+
+        def fake_sync(**kwargs):
+            calls.append((threading.get_ident(), kwargs))
+            return "agent", kwargs["api"]
+
+        monkeypatch.setattr(agent_factory, "_create_agent_for_run_sync", fake_sync)
+        await agent_factory.prewarm_api_pool()
+        pooled = agent_factory._API_POOL._queue[0]
+
+        agent, api = await agent_factory.create_agent_for_run(api_key="k", model="m")
+
+        assert agent == "agent"
+        assert api is pooled
+        thread_id, kwargs = calls[0]
+        assert thread_id != loop_thread
+        assert kwargs["model"] == "m"
+        await agent_factory.close_api_pool()
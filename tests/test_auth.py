@@ -1,12 +1,19 @@
 """Tests for authentication helpers and Phase 4 functionality."""
 
 import os
+import string
+import time
 from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
+import jwt
 import pytest
 from cryptography.fernet import Fernet
 
+from src.config import AuthConfig
 from src.persistence.models import RunRecord, UserRecord
+from src.web import auth
 from src.web.auth import (
     USERNAME_PATTERN,
     create_jwt,
@@ -14,6 +21,8 @@ from src.web.auth import (
     decrypt_key,
     encrypt_key,
     generate_pkce_pair,
+    session_payload,
+    session_user,
 )
 
 # === PKCE tests ===
@@ -57,6 +66,13 @@ class TestJWT:
         assert payload is not None
         assert payload["sub"] == "42"
 
+    def test_create_uses_integer_timestamps(self):
+        before = int(time.time())
+        payload = decode_jwt(create_jwt(42, self.SECRET, expiry_days=2), self.SECRET)
+        assert isinstance(payload["iat"], int)
+        assert before <= payload["iat"] <= time.time()
+        assert payload["exp"] - payload["iat"] == 2 * 86400
+
     def test_decode_bad_secret(self):
         token = create_jwt(42, self.SECRET)
         payload = decode_jwt(token, "wrong-secret")
@@ -70,6 +86,70 @@ class TestJWT:
         payload = decode_jwt(token, self.SECRET)
         assert payload is None
 
+    def test_decode_matches_pyjwt(self):
+        token = create_jwt(42, self.SECRET)
+        assert decode_jwt(token, self.SECRET) == jwt.decode(
+            token, self.SECRET, algorithms=["HS256"]
+        )
+
+    def test_decode_rejects_tampered_payload(self):
+        header, _, signature = create_jwt(42, self.SECRET).split(".")
+        forged = jwt.encode(
+            {"sub": "1", "exp": time.time() + 3600}, "other", algorithm="HS256"
+        ).split(".")[1]
+        assert decode_jwt(f"{header}.{forged}.{signature}", self.SECRET) is None
+
+    def test_decode_rejects_alg_none(self):
+        token = jwt.encode({"sub": "42", "exp": time.time() + 3600}, None, algorithm="none")
+        assert decode_jwt(token, self.SECRET) is None
+
+    def test_decode_requires_exp(self):
+        token = jwt.encode({"sub": "42"}, self.SECRET, algorithm="HS256")
+        assert decode_jwt(token, self.SECRET) is None
+
+    def test_decode_rejects_not_yet_valid(self):
+        claims = {"sub": "42", "exp": time.time() + 7200, "nbf": time.time() + 3600}
+        token = jwt.encode(claims, self.SECRET, algorithm="HS256")
+        assert decode_jwt(token, self.SECRET) is None
+
+    def test_decode_rejects_extra_segments(self):
+        token = create_jwt(42, self.SECRET)
+        assert decode_jwt(token + ".extra", self.SECRET) is None
+
+    def test_decode_requires_sub(self):
+        token = jwt.encode({"exp": time.time() + 3600}, self.SECRET, algorithm="HS256")
+        assert decode_jwt(token, self.SECRET) is None
+
+    def test_decode_rejects_non_numeric_sub(self):
+        claims = {"sub": "admin", "exp": time.time() + 3600}
+        token = jwt.encode(claims, self.SECRET, algorithm="HS256")
+        assert decode_jwt(token, self.SECRET) is None
+
+    def test_decode_rejects_stray_signature_characters(self):
+        header, payload, signature = create_jwt(42, self.SECRET).split(".")
+        token = f"{header}.{payload}.{signature[:10]}!{signature[10:]}"
+        assert decode_jwt(token, self.SECRET) is None
+
+    def test_decode_rejects_non_canonical_signature(self):
+        alphabet = string.ascii_uppercase + string.ascii_lowercase + string.digits + "-_"
+        token = create_jwt(42, self.SECRET)
+        # Flipping the lowest (unused) bit of the last character keeps the
+        # decoded signature bytes the same
+        last = alphabet[alphabet.index(token[-1]) ^ 1]
+        assert decode_jwt(token[:-1] + last, self.SECRET) is None
+
+    def test_decoded_payload_cached(self, monkeypatch):
+        token = create_jwt(42, self.SECRET)
+        first = decode_jwt(token, self.SECRET)
+
+        monkeypatch.setattr(auth.jwt, "decode", None)  # would fail if called again
+        assert decode_jwt(token, self.SECRET) is first
+
+    def test_cached_payload_expires_with_token(self):
+        token = create_jwt(43, self.SECRET)
+        auth._decoded_jwts.set((token, self.SECRET), {"sub": "43", "exp": time.time() - 1})
+        assert decode_jwt(token, self.SECRET) is None
+
 
 # === Fernet encryption tests ===
 
@@ -90,6 +170,93 @@ class TestFernetEncryption:
         with pytest.raises(Exception):
             decrypt_key(encrypted, wrong_key)
 
+    def test_fernet_instance_reused(self):
+        assert auth._fernet(self.KEY) is auth._fernet(self.KEY)
+
+    def test_decrypted_key_cached(self, monkeypatch):
+        encrypted = encrypt_key("sk-cached", self.KEY)
+        assert decrypt_key(encrypted, self.KEY) == "sk-cached"
+
+        monkeypatch.setattr(auth, "_fernet", None)  # would fail if called again
+        assert decrypt_key(encrypted, self.KEY) == "sk-cached"
+
+
+# === Session resolution tests ===
+
+
+class TestSessionUser:
+    SECRET = "test-session-secret"
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        auth._session_users.clear()
+        yield
+        auth._session_users.clear()
+
+    @pytest.fixture
+    def auth_config(self):
+        return AuthConfig(session_secret=self.SECRET)
+
+    def _request(self, repo, token=None):
+        cookies = {"session": token} if token else {}
+        return SimpleNamespace(
+            cookies=cookies,
+            state=SimpleNamespace(),
+            app=SimpleNamespace(state=SimpleNamespace(repo=repo)),
+        )
+
+    def _repo(self, user_id=1):
+        user = UserRecord(id=user_id, openrouter_id="or-1", display_name="alice")
+        return AsyncMock(get_user=AsyncMock(return_value=user)), user
+
+    def test_payload_memoized_per_request(self, auth_config):
+        request = self._request(None, create_jwt(1, self.SECRET))
+        first = session_payload(request, auth_config)
+        request.cookies["session"] = "garbage"
+        assert session_payload(request, auth_config) is first
+        assert first["sub"] == "1"
+
+    async def test_no_cookie_returns_none(self, auth_config):
+        repo, _ = self._repo()
+        assert await session_user(self._request(repo), auth_config) is None
+        repo.get_user.assert_not_awaited()
+
+    async def test_invalid_token_returns_none(self, auth_config):
+        repo, _ = self._repo()
+        assert await session_user(self._request(repo, "garbage"), auth_config) is None
+        repo.get_user.assert_not_awaited()
+
+    async def test_user_memoized_per_request(self, auth_config):
+        repo, user = self._repo()
+        request = self._request(repo, create_jwt(1, self.SECRET))
+        assert await session_user(request, auth_config) is user
+        assert await session_user(request, auth_config) is user
+        repo.get_user.assert_awaited_once_with(1)
+
+    async def test_user_cached_across_requests(self, auth_config):
+        repo, user = self._repo()
+        token = create_jwt(1, self.SECRET)
+        await session_user(self._request(repo, token), auth_config)
+        assert await session_user(self._request(repo, token), auth_config) is user
+        repo.get_user.assert_awaited_once()
+
+    async def test_cache_entry_expires(self, auth_config, monkeypatch):
+        monkeypatch.setattr(auth._session_users, "ttl", 0.0)
+        repo, _ = self._repo()
+        token = create_jwt(1, self.SECRET)
+        await session_user(self._request(repo, token), auth_config)
+        await session_user(self._request(repo, token), auth_config)
+        assert repo.get_user.await_count == 2
+
+    async def test_cache_is_bounded(self, auth_config, monkeypatch):
+        monkeypatch.setattr(auth._session_users, "maxsize", 2)
+        repo, _ = self._repo()
+        tokens = [create_jwt(i, self.SECRET) for i in (1, 2, 3)]
+        for token in tokens:
+            await session_user(self._request(repo, token), auth_config)
+        assert len(auth._session_users) == 2
+        assert auth._session_users.get(tokens[0]) is None
+
 
 # === UserRecord tests ===
 
@@ -116,11 +283,11 @@ class TestUserRecord:
 class TestUsernameValidation:
     def test_valid_usernames(self):
         for name in ["abc", "user-123", "my_name", "A-B_c", "a" * 30]:
-            assert USERNAME_PATTERN.match(name), f"{name} should be valid"
+            assert USERNAME_PATTERN.fullmatch(name), f"{name} should be valid"
 
     def test_invalid_usernames(self):
         for name in ["ab", "a" * 31, "user name", "user@name", "user.name", ""]:
-            assert not USERNAME_PATTERN.match(name), f"{name} should be invalid"
+            assert not USERNAME_PATTERN.fullmatch(name), f"{name} should be invalid"
 
 
 # === RunRecord tests ===
@@ -369,6 +536,7 @@ class TestLeaderboard:
                     status="stopped",
                 )
             )
+        await repo.refresh_model_leaderboard()
         entries = await repo.get_model_leaderboard(sort_by="best_score")
         assert entries[0]["model"] == "model-b"
         assert entries[0]["best_score"] == 500
@@ -390,6 +558,7 @@ class TestLeaderboard:
                     status="stopped",
                 )
             )
+        await repo.refresh_model_leaderboard()
         entries = await repo.get_model_leaderboard(sort_by="best_depth")
         assert entries[0]["model"] == "model-b"
         assert entries[0]["best_depth"] == 8
@@ -413,6 +582,7 @@ class TestLeaderboard:
                 status="stopped",
             )
         )
+        await repo.refresh_model_leaderboard()
         entries = await repo.get_model_leaderboard()
         assert len(entries) == 1
         assert entries[0]["model"] == "test"
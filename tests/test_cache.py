@@ -0,0 +1,37 @@
+"""Tests for the bounded TTL cache."""
+
+from src.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_returns_set_value(self):
+        cache = TTLCache(ttl=60.0, maxsize=4)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_expired_entry_is_dropped(self):
+        cache = TTLCache(ttl=0.0, maxsize=4)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(ttl=60.0, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear(self):
+        cache = TTLCache(ttl=60.0, maxsize=4)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
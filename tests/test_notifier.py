@@ -0,0 +1,135 @@
+"""Tests for live turn notifications and the SSE turn stream."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+import pytest
+
+from src.persistence.models import RunRecord
+from src.web import notifier as notifier_module
+from src.web.notifier import RunNotifier, follow_run
+from src.web.routes import _turn_event_stream
+
+
+class TestRunNotifier:
+    def test_routes_notifications_to_run_subscribers(self):
+        notifier = RunNotifier()
+        queue = notifier.subscribe("run-1")
+        other = notifier.subscribe("run-2")
+
+        notifier._on_turn(None, 0, "turn_inserted", "run-1:7")
+        notifier._on_status(None, 0, "run_status", "run-1:stopped")
+
+        assert queue.get_nowait() == ("turn", 7)
+        assert queue.get_nowait() == ("status", "stopped")
+        assert other.empty()
+
+    def test_unsubscribe(self):
+        notifier = RunNotifier()
+        queue = notifier.subscribe("run-1")
+        notifier.unsubscribe("run-1", queue)
+
+        notifier._on_turn(None, 0, "turn_inserted", "run-1:1")
+        assert queue.empty()
+        assert notifier._subscribers == {}
+
+    def test_not_listening_until_started(self):
+        assert not RunNotifier().listening
+
+    def test_status_listeners(self):
+        notifier = RunNotifier()
+        listener = MagicMock()
+        notifier.add_status_listener(listener)
+
+        notifier._on_status(None, 0, "run_status", "run-1:completed")
+        notifier.remove_status_listener(listener)
+        notifier._on_status(None, 0, "run_status", "run-2:stopped")
+
+        listener.assert_called_once_with("run-1", "completed")
+
+    async def test_reconnects_after_connection_drops(self, monkeypatch):
+        monkeypatch.setattr(notifier_module, "RECONNECT_DELAY", 0)
+        first, second = MagicMock(), MagicMock()
+        for conn in (first, second):
+            conn.add_listener = AsyncMock()
+            conn.is_closed.return_value = False
+        connect = AsyncMock(side_effect=[first, second])
+        notifier = RunNotifier()
+        queue = notifier.subscribe("run-1")
+
+        with patch("src.web.notifier.asyncpg.connect", connect):
+            await notifier.start("postgresql://x")
+            first.add_termination_listener.assert_called_once_with(notifier._on_terminated)
+
+            notifier._on_terminated(first)
+            assert not notifier.listening
+            await notifier._reconnect_task
+
+        assert notifier._conn is second
+        assert queue.get_nowait() == ("reconnected", "")
+
+    async def test_stop_logs_close_failure(self, caplog):
+        notifier = RunNotifier()
+        notifier._conn = MagicMock(close=AsyncMock(side_effect=OSError("gone")))
+
+        await notifier.stop()
+
+        assert notifier._conn is None
+        assert "Error closing run notification listener" in caplog.text
+
+
+def _turn(n: int) -> dict:
+    return {"run_id": "run-1", "turn_number": n}
+
+
+class TestTurnEventStream:
+    @pytest.fixture
+    def repo(self):
+        repo = MagicMock()
+        repo.get_run = AsyncMock(
+            return_value=RunRecord(run_id="run-1", started_at=None, status="stopped")
+        )
+        repo.get_run_statuses = AsyncMock(return_value={"run-1": "running"})
+        return repo
+
+    async def test_finished_run_replays_then_ends(self, repo):
+        repo.get_turns_page = AsyncMock(return_value=([_turn(1), _turn(2)], 2))
+
+        frames = [f async for f in _turn_event_stream("run-1", 0, repo, None, ended=True)]
+
+        assert frames[0].startswith(b"event: turn\ndata: ")
+        assert b'"turn_number":2' in frames[1]
+        assert frames[2].startswith(b"event: run_ended\n")
+        assert len(frames) == 3
+
+    async def test_pushed_turns_and_end(self, repo, monkeypatch):
+        monkeypatch.setattr(RunNotifier, "listening", PropertyMock(return_value=True))
+        notifier = RunNotifier()
+        pages = [([], 0), ([_turn(1)], 1), ([], 1)]
+        repo.get_turns_page = AsyncMock(side_effect=pages)
+
+        stream = _turn_event_stream("run-1", 0, repo, notifier, ended=False)
+        first = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        notifier._on_turn(None, 0, "turn_inserted", "run-1:1")
+        assert b'"turn_number":1' in await first
+
+        rest = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        notifier._on_status(None, 0, "run_status", "run-1:stopped")
+        assert (await rest).startswith(b"event: run_ended\n")
+        with pytest.raises(StopAsyncIteration):
+            await stream.__anext__()
+        assert notifier._subscribers == {}
+        repo.get_run_statuses.assert_not_awaited()
+
+    async def test_follow_run_events(self, repo):
+        repo.get_turns_page = AsyncMock(return_value=([_turn(1)], 1))
+
+        events = [e async for e in follow_run("run-1", 0, repo, None, ended=True)]
+
+        assert events[0] == ("turn", _turn(1))
+        assert events[1][0] == "run_ended"
+        assert events[1][1]["status"] == "stopped"
@@ -1,13 +1,18 @@
 """Tests for the persistence layer (PostgreSQL implementation)."""
 
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 
+import asyncpg
 import pytest
 from sqlalchemy.ext.asyncio import create_async_engine
 
+from src.persistence import postgres
 from src.persistence.models import RunRecord, TurnRecord
-from src.persistence.postgres import PostgresRepository
+from src.persistence.postgres import RUN_STATUS_CHANNEL, TURN_CHANNEL, PostgresRepository
 from src.persistence.tables import metadata
 
 TEST_DB_URL = os.environ.get(
@@ -105,6 +110,42 @@ class TestRunCRUD:
     async def test_get_run_not_found(self, repo):
         assert await repo.get_run("nonexistent") is None
 
+    async def test_list_runs_by_status(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        await repo.create_run(
+            RunRecord(
+                run_id="test-run-002",
+                started_at=datetime(2026, 1, 15, 11, 0, 0),
+                status="stopped",
+            )
+        )
+        active = await repo.list_runs_by_status(["running", "starting"])
+        assert [r.run_id for r in active] == ["test-run-001"]
+        assert active[0].config_snapshot is None
+
+    async def test_get_run_statuses(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        statuses = await repo.get_run_statuses(["test-run-001", "nonexistent"])
+        assert statuses == {"test-run-001": "running"}
+
+    async def test_count_active_runs(self, repo):
+        for run_id, user_id, status in [
+            ("a", None, "running"),
+            ("b", None, "starting"),
+            ("c", None, "stopped"),
+        ]:
+            await repo.create_run(
+                RunRecord(run_id=run_id, started_at=datetime(2026, 1, 15), status=status)
+            )
+        user = await repo.upsert_user("or-1", display_name="one")
+        await repo.create_run(
+            RunRecord(run_id="d", started_at=datetime(2026, 1, 15), user_id=user.id)
+        )
+        assert await repo.count_active_runs(user.id) == (1, 3)
+
+    async def test_get_run_statuses_empty(self, repo):
+        assert await repo.get_run_statuses([]) == {}
+
     async def test_update_run(self, repo, sample_run):
         await repo.create_run(sample_run)
         sample_run.ended_at = datetime(2026, 1, 15, 10, 30, 0)
@@ -112,7 +153,6 @@ class TestRunCRUD:
         sample_run.final_score = 1234
         sample_run.final_game_turns = 500
         sample_run.final_depth = 5
-        sample_run.total_agent_turns = 42
         sample_run.status = "stopped"
         await repo.update_run(sample_run)
 
@@ -121,9 +161,52 @@ class TestRunCRUD:
         assert fetched.final_score == 1234
         assert fetched.final_game_turns == 500
         assert fetched.final_depth == 5
-        assert fetched.total_agent_turns == 42
         assert fetched.status == "stopped"
 
+    async def test_update_run_notifies_terminal_status(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        received: asyncio.Queue[str] = asyncio.Queue()
+        conn = await asyncpg.connect(TEST_DB_URL.replace("+asyncpg", ""))
+        try:
+            await conn.add_listener(RUN_STATUS_CHANNEL, lambda *args: received.put_nowait(args[-1]))
+            await repo.update_run(sample_run)  # still running: no notification
+            sample_run.status = "stopped"
+            await repo.update_run(sample_run)
+            payload = await asyncio.wait_for(received.get(), timeout=5)
+        finally:
+            await conn.close()
+        assert payload == "test-run-001:stopped"
+        assert received.empty()
+
+    async def test_upsert_run_inserts(self, repo, sample_run):
+        result = await repo.upsert_run(sample_run)
+        assert result.id is not None
+        fetched = await repo.get_run("test-run-001")
+        assert fetched.status == "running"
+        assert fetched.config_snapshot == {"max_turns": 100, "temperature": 0.1}
+
+    async def test_upsert_run_updates_placeholder(self, repo, sample_run):
+        sample_run.status = "starting"
+        sample_run.user_id = None
+        created = await repo.create_run(sample_run)
+
+        upserted = await repo.upsert_run(
+            RunRecord(
+                run_id="test-run-001",
+                started_at=datetime(2026, 1, 15, 11, 0, 0),
+                model="other/model",
+                provider="openrouter",
+                config_snapshot=None,
+                status="running",
+            )
+        )
+        assert upserted.id == created.id
+        assert upserted.status == "running"
+        assert upserted.model == "other/model"
+        # Insert-only and NULL-coalesced columns keep the stored values
+        assert upserted.started_at.replace(tzinfo=None) == datetime(2026, 1, 15, 10, 0, 0)
+        assert upserted.config_snapshot == {"max_turns": 100, "temperature": 0.1}
+
     async def test_list_runs(self, repo):
         for i in range(5):
             await repo.create_run(
@@ -141,7 +224,7 @@ class TestRunCRUD:
         assert runs[1].run_id == "run-003"
         assert runs[2].run_id == "run-002"
 
-    async def test_list_runs_offset(self, repo):
+    async def test_list_runs_cursor(self, repo):
         for i in range(5):
             await repo.create_run(
                 RunRecord(
@@ -151,11 +234,95 @@ class TestRunCRUD:
                     provider="test",
                 )
             )
-        runs = await repo.list_runs(limit=2, offset=3)
+        page = await repo.list_runs(limit=3)
+        last = page[-1]
+        runs = await repo.list_runs(limit=3, cursor_started_at=last.started_at, cursor_id=last.id)
         assert len(runs) == 2
         assert runs[0].run_id == "run-001"
         assert runs[1].run_id == "run-000"
 
+    async def test_list_runs_cursor_requires_recent_sort(self, repo):
+        with pytest.raises(ValueError):
+            await repo.list_runs(
+                sort_by="score", cursor_started_at=datetime(2026, 1, 15), cursor_id=1
+            )
+
+    async def test_model_leaderboard_is_plain_json(self, repo):
+        for i, score in enumerate([10, 25]):
+            await repo.create_run(
+                RunRecord(
+                    run_id=f"run-{i}",
+                    started_at=datetime(2026, 1, 15),
+                    model="m",
+                    final_score=score,
+                    status="stopped",
+                )
+            )
+        await repo.refresh_model_leaderboard()
+        rows = await repo.get_model_leaderboard()
+        assert rows == [
+            {"model": "m", "best_score": 25, "avg_score": 18, "best_depth": 0, "run_count": 2}
+        ]
+        assert type(rows[0]["avg_score"]) is int
+
+    async def test_list_runs_as_dicts(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        records = await repo.list_runs()
+        assert await repo.list_runs(as_dicts=True) == [r.to_dict() for r in records]
+
+    async def test_model_leaderboard_is_materialized(self, repo, sample_run):
+        sample_run.status = "stopped"
+        await repo.create_run(sample_run)
+        assert await repo.get_model_leaderboard() == []
+
+        repo.schedule_leaderboard_refresh(delay=0)
+        repo.schedule_leaderboard_refresh(delay=0)  # coalesced
+        await repo._leaderboard_refresh
+        assert [row["model"] for row in await repo.get_model_leaderboard()] == [sample_run.model]
+
+    async def test_get_run_cached(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        first = await repo.get_run_cached("test-run-001")
+        assert await repo.get_run_cached("test-run-001") is first
+
+        sample_run.status = "stopped"
+        await repo.update_run(sample_run)
+        refreshed = await repo.get_run_cached("test-run-001")
+        assert refreshed is not first
+        assert refreshed.status == "stopped"
+
+    async def test_get_run_cached_missing(self, repo):
+        assert await repo.get_run_cached("no-such-run") is None
+
+    async def test_list_runs_score_cursor(self, repo):
+        for i, score in enumerate([50, 10, 50, 30, 20]):
+            await repo.create_run(
+                RunRecord(
+                    run_id=f"run-{i:03d}",
+                    started_at=datetime(2026, 1, 15, 10 + i, 0, 0),
+                    final_score=score,
+                )
+            )
+        page = await repo.list_runs(limit=2, sort_by="score")
+        assert [r.run_id for r in page] == ["run-002", "run-000"]
+        last = page[-1]
+        rest = await repo.list_runs(
+            limit=10, sort_by="score", cursor_value=last.final_score, cursor_id=last.id
+        )
+        assert [r.run_id for r in rest] == ["run-003", "run-004", "run-001"]
+
+    async def test_list_runs_cursor_value_requires_ranked_sort(self, repo):
+        with pytest.raises(ValueError):
+            await repo.list_runs(sort_by="recent", cursor_value=10, cursor_id=1)
+
+    async def test_list_runs_omits_config_snapshot(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        runs = await repo.list_runs()
+        assert len(runs) == 1
+        assert runs[0].config_snapshot is None
+        fetched = await repo.get_run("test-run-001")
+        assert fetched.config_snapshot == {"max_turns": 100, "temperature": 0.1}
+
     async def test_user_id_and_visibility(self, repo):
         run = RunRecord(
             run_id="user-run-001",
@@ -230,6 +397,38 @@ class TestTurnCRUD:
         await repo.create_run(sample_run)
         assert await repo.get_turn("test-run-001", 999) is None
 
+    async def test_save_turn_notifies(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        received: asyncio.Queue[str] = asyncio.Queue()
+        conn = await asyncpg.connect(TEST_DB_URL.replace("+asyncpg", ""))
+        try:
+            await conn.add_listener(TURN_CHANNEL, lambda *args: received.put_nowait(args[-1]))
+            await repo.save_turn(_make_turn("test-run-001", 4))
+            payload = await asyncio.wait_for(received.get(), timeout=5)
+        finally:
+            await conn.close()
+        assert payload == "test-run-001:4"
+
+    async def test_save_turns_batch(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        received: asyncio.Queue[str] = asyncio.Queue()
+        conn = await asyncpg.connect(TEST_DB_URL.replace("+asyncpg", ""))
+        try:
+            await conn.add_listener(TURN_CHANNEL, lambda *args: received.put_nowait(args[-1]))
+            saved = await repo.save_turns_batch([_make_turn("test-run-001", i) for i in (1, 2, 3)])
+            payload = await asyncio.wait_for(received.get(), timeout=5)
+        finally:
+            await conn.close()
+        assert payload == "test-run-001:3"
+        assert len({t.id for t in saved}) == 3
+
+        turns, total = await repo.get_turns_page("test-run-001")
+        assert [t.id for t in turns] == [t.id for t in saved]
+        assert total == 3
+
+    async def test_save_turns_batch_empty(self, repo):
+        assert await repo.save_turns_batch([]) == []
+
     async def test_get_turns(self, repo, sample_run):
         await repo.create_run(sample_run)
         for i in range(1, 6):
@@ -258,6 +457,85 @@ class TestTurnCRUD:
         turns = await repo.get_turns("test-run-001", limit=3)
         assert len(turns) == 3
 
+    async def test_get_turns_page(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        for i in range(1, 6):
+            await repo.save_turn(_make_turn("test-run-001", i))
+
+        turns, total = await repo.get_turns_page("test-run-001", after_turn=2, limit=2)
+        assert [t.turn_number for t in turns] == [3, 4]
+        assert total == 5
+
+    async def test_get_turns_page_no_new_turns(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        for i in range(1, 4):
+            await repo.save_turn(_make_turn("test-run-001", i))
+
+        turns, total = await repo.get_turns_page("test-run-001", after_turn=3)
+        assert turns == []
+        assert total == 3
+
+    async def test_get_turns_page_as_dicts(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        for i in range(1, 3):
+            await repo.save_turn(_make_turn("test-run-001", i))
+
+        records, _ = await repo.get_turns_page("test-run-001")
+        dicts, total = await repo.get_turns_page("test-run-001", as_dicts=True)
+        assert dicts == [t.to_dict() for t in records]
+        assert total == 2
+
+    async def test_get_turns_page_missing_run(self, repo):
+        assert await repo.get_turns_page("no-such-run") is None
+
+    async def test_stream_turns_page(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        for i in range(1, 6):
+            await repo.save_turn(_make_turn("test-run-001", i))
+
+        expected, _ = await repo.get_turns_page("test-run-001", after_turn=1, as_dicts=True)
+        turns, total = await repo.stream_turns_page("test-run-001", after_turn=1)
+        assert [t async for t in turns] == expected
+        assert total == 5
+
+    async def test_stream_turns_page_in_chunks(self, repo, sample_run, monkeypatch):
+        monkeypatch.setattr(postgres, "TURN_STREAM_CHUNK", 2)
+        await repo.create_run(sample_run)
+        for i in range(1, 8):
+            await repo.save_turn(_make_turn("test-run-001", i))
+
+        turns, total = await repo.stream_turns_page("test-run-001", after_turn=1, limit=5)
+        assert [t["turn_number"] async for t in turns] == [2, 3, 4, 5, 6]
+        assert total == 7
+
+    async def test_stream_turns_page_holds_no_connection(self, repo, sample_run, engine):
+        await repo.create_run(sample_run)
+        await repo.save_turn(_make_turn("test-run-001", 1))
+
+        turns, _ = await repo.stream_turns_page("test-run-001")
+        assert engine.sync_engine.pool.checkedout() == 0
+        await turns.aclose()
+
+    async def test_stream_turns_page_empty_and_missing(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        turns, total = await repo.stream_turns_page("test-run-001")
+        assert [t async for t in turns] == []
+        assert total == 0
+        assert await repo.stream_turns_page("no-such-run") is None
+
+    async def test_get_turn_of_run(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        assert await repo.get_turn_of_run("test-run-001") == (True, None)
+
+        for i in range(1, 4):
+            await repo.save_turn(_make_turn("test-run-001", i))
+        exists, latest = await repo.get_turn_of_run("test-run-001")
+        assert exists and latest.turn_number == 3
+        exists, turn = await repo.get_turn_of_run("test-run-001", 2)
+        assert exists and turn.turn_number == 2
+        assert await repo.get_turn_of_run("test-run-001", 99) == (True, None)
+        assert await repo.get_turn_of_run("no-such-run") == (False, None)
+
     async def test_get_latest_turn(self, repo, sample_run):
         await repo.create_run(sample_run)
         for i in range(1, 4):
@@ -279,6 +557,14 @@ class TestTurnCRUD:
             await repo.save_turn(_make_turn("test-run-001", i))
 
         assert await repo.count_turns("test-run-001") == 3
+        assert (await repo.get_run("test-run-001")).total_agent_turns == 3
+
+    async def test_update_run_keeps_turn_counter(self, repo, sample_run):
+        await repo.create_run(sample_run)
+        await repo.save_turn(_make_turn("test-run-001", 1))
+        sample_run.total_agent_turns = 99
+        await repo.update_run(sample_run)
+        assert await repo.count_turns("test-run-001") == 1
 
     async def test_duplicate_turn_rejected(self, repo, sample_run, sample_turn):
         await repo.create_run(sample_run)
@@ -287,6 +573,40 @@ class TestTurnCRUD:
             await repo.save_turn(sample_turn)
 
 
+class TestWarmUp:
+    async def test_warm_up_fills_pool(self, engine):
+        repo = PostgresRepository(engine)
+        await engine.dispose()
+        await repo.warm_up(3)
+        assert engine.sync_engine.pool.checkedin() == 3
+
+    @staticmethod
+    def _fake_engine(pool_size: int, fail_on: int | None = None):
+        """Engine whose connect() fails on the ``fail_on``-th call."""
+        attempts = []
+
+        @asynccontextmanager
+        async def connect():
+            attempts.append(1)
+            if len(attempts) == fail_on:
+                raise OSError("connection refused")
+            yield MagicMock(execute=AsyncMock())
+
+        engine = MagicMock(connect=connect)
+        engine.sync_engine.pool.size.return_value = pool_size
+        return engine, attempts
+
+    async def test_warm_up_survives_failed_connect(self):
+        engine, attempts = self._fake_engine(pool_size=5, fail_on=2)
+        await asyncio.wait_for(PostgresRepository(engine).warm_up(3), timeout=1)
+        assert len(attempts) == 3
+
+    async def test_warm_up_capped_at_pool_size(self):
+        engine, attempts = self._fake_engine(pool_size=2)
+        await asyncio.wait_for(PostgresRepository(engine).warm_up(5), timeout=1)
+        assert len(attempts) == 2
+
+
 # === Serialization tests ===
 
 
@@ -295,19 +615,28 @@ class TestSerialization:
         d = sample_turn.to_dict()
         assert d["run_id"] == "test-run-001"
         assert d["turn_number"] == 1
-        assert d["timestamp"] == "2026-01-15T10:00:05"
+        assert d["timestamp"] == datetime(2026, 1, 15, 10, 0, 5)
         assert d["game_messages"] == ["You see a door."]
         assert d["api_calls"] == [{"method": "move", "args": ["E"], "success": True}]
 
     def test_run_to_dict(self, sample_run):
         d = sample_run.to_dict()
         assert d["run_id"] == "test-run-001"
-        assert d["started_at"] == "2026-01-15T10:00:00"
+        assert d["started_at"] == datetime(2026, 1, 15, 10, 0, 0)
         assert d["ended_at"] is None
         assert d["config_snapshot"] == {"max_turns": 100, "temperature": 0.1}
         assert d["user_id"] is None
         assert d["visibility"] == "public"
 
+    def test_to_dict_serializes_datetimes_as_iso(self, sample_turn):
+        from src.web.responses import dumps
+
+        assert '"timestamp":"2026-01-15T10:00:05"' in dumps(sample_turn.to_dict())
+
+    def test_records_are_slotted(self, sample_run, sample_turn):
+        assert not hasattr(sample_turn, "__dict__")
+        assert not hasattr(sample_run, "__dict__")
+
     async def test_nullable_fields_round_trip(self, repo, sample_run):
         await repo.create_run(sample_run)
         turn = TurnRecord(
@@ -339,3 +668,28 @@ class TestSerialization:
         assert fetched.llm_prompt_tokens is None
         assert fetched.game_messages == []
         assert fetched.api_calls == []
+
+
+class TestLeaderboardView:
+    def test_migration_matches_model_leaderboard_sql(self):
+        """Migration 010 and create_all must build the same view."""
+        import importlib.util
+        import re
+        from pathlib import Path
+
+        from src.persistence.tables import MODEL_LEADERBOARD_SQL
+
+        path = Path(__file__).parent.parent / "alembic/versions/010_model_leaderboard_view.py"
+        spec = importlib.util.spec_from_file_location("migration_010", path)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+
+        executed = []
+        migration.op = type("Op", (), {"execute": staticmethod(executed.append)})
+        migration.upgrade()
+
+        def normalize(sql: str) -> str:
+            return " ".join(sql.split())
+
+        view_sql = re.sub(r"^\s*CREATE MATERIALIZED VIEW model_leaderboard AS", "", executed[0])
+        assert normalize(view_sql) == normalize(MODEL_LEADERBOARD_SQL)
@@ -1,5 +1,6 @@
 """Tests for ProcrastinateBackend."""
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -38,6 +39,7 @@ class TestProcrastinateBackend:
         repo.create_run = AsyncMock()
         repo.get_run = AsyncMock(return_value=None)
         repo.update_run = AsyncMock()
+        repo.schedule_leaderboard_refresh = MagicMock()
         return repo
 
     @pytest.fixture
@@ -92,6 +94,7 @@ class TestProcrastinateBackend:
 
         assert backend.is_running("run-abc")
         assert "run-abc" in backend.get_active_run_ids()
+        assert backend._has_runs.is_set()
 
     @pytest.mark.asyncio
     async def test_stop_run_updates_status(self, backend, mock_repo):
@@ -106,12 +109,14 @@ class TestProcrastinateBackend:
         assert run.end_reason == "stopped by user"
         assert run.ended_at is not None
         assert not backend.is_running("run-abc")
+        mock_repo.schedule_leaderboard_refresh.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_stop_run_noop_for_unknown(self, backend, mock_repo):
         mock_repo.get_run = AsyncMock(return_value=None)
         await backend.stop_run("nonexistent")
         mock_repo.update_run.assert_not_awaited()
+        mock_repo.schedule_leaderboard_refresh.assert_not_called()
 
     def test_is_running_false_for_unknown(self, backend):
         assert not backend.is_running("nonexistent")
@@ -124,17 +129,61 @@ class TestProcrastinateBackend:
         backend._active_runs.add("run-done")
         backend._active_runs.add("run-still-going")
 
-        async def fake_get_run(run_id):
-            if run_id == "run-done":
-                return _make_run_record("run-done", status="stopped")
-            return _make_run_record("run-still-going", status="running")
-
-        mock_repo.get_run = AsyncMock(side_effect=fake_get_run)
+        mock_repo.get_run_statuses = AsyncMock(
+            return_value={"run-done": "stopped", "run-still-going": "running"}
+        )
 
         await backend._check_completed_runs()
 
+        mock_repo.get_run_statuses.assert_awaited_once()
         assert not backend.is_running("run-done")
         assert backend.is_running("run-still-going")
+        mock_repo.schedule_leaderboard_refresh.assert_called_once()
+
+    def test_on_run_status_finishes_tracked_run(self, backend):
+        callback = MagicMock()
+        backend.set_on_finished_callback(callback)
+        backend._active_runs.add("run-1")
+
+        backend._on_run_status("run-1", "stopped")
+
+        assert not backend.is_running("run-1")
+        callback.assert_called_once_with("run-1")
+
+    def test_on_run_status_ignores_untracked_run(self, backend):
+        callback = MagicMock()
+        backend.set_on_finished_callback(callback)
+
+        backend._on_run_status("other-run", "completed")
+
+        callback.assert_not_called()
+
+    def test_on_run_status_ignores_non_terminal_status(self, backend):
+        backend._active_runs.add("run-1")
+
+        backend._on_run_status("run-1", "running")
+
+        assert backend.is_running("run-1")
+
+    @pytest.mark.asyncio
+    async def test_start_monitoring_subscribes_to_notifier(self, backend):
+        notifier = MagicMock(listening=True)
+        await backend.start_monitoring(interval=10.0, notifier=notifier)
+        try:
+            notifier.add_status_listener.assert_called_once_with(backend._on_run_status)
+            assert backend._poll_interval() == 60.0
+        finally:
+            await backend.stop_monitoring()
+        notifier.remove_status_listener.assert_called_once_with(backend._on_run_status)
+
+    @pytest.mark.asyncio
+    async def test_poll_tightens_while_notifier_down(self, backend):
+        notifier = MagicMock(listening=False)
+        await backend.start_monitoring(interval=10.0, notifier=notifier)
+        try:
+            assert backend._poll_interval() == 10.0
+        finally:
+            await backend.stop_monitoring()
 
     @pytest.mark.asyncio
     async def test_recover_state(self, backend):
@@ -147,6 +196,33 @@ class TestProcrastinateBackend:
         assert backend.is_running("run-1")
         assert backend.is_running("run-2")
         assert len(backend.get_active_run_ids()) == 2
+        assert backend.active_count == 2
+
+    @pytest.mark.asyncio
+    async def test_monitor_idles_without_runs(self, backend, mock_repo):
+        mock_repo.get_run_statuses = AsyncMock(return_value={})
+        await backend.start_monitoring(interval=0.01)
+        try:
+            await asyncio.sleep(0.05)
+            mock_repo.get_run_statuses.assert_not_awaited()
+        finally:
+            await backend.stop_monitoring()
+
+    @pytest.mark.asyncio
+    async def test_monitor_goes_idle_when_runs_finish(self, backend, mock_repo):
+        mock_repo.get_run_statuses = AsyncMock(return_value={"run-1": "stopped"})
+        await backend.recover_state([_make_run_record("run-1")])
+        assert backend._has_runs.is_set()
+
+        await backend.start_monitoring(interval=0.01)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            await backend.stop_monitoring()
+
+        assert not backend.is_running("run-1")
+        assert not backend._has_runs.is_set()
+        mock_repo.get_run_statuses.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_recover_state_clears_previous(self, backend):
@@ -1,6 +1,7 @@
 """Tests for RunManager concurrency limits and ownership tracking."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
 from fastapi import HTTPException
@@ -37,6 +38,7 @@ def _make_mock_backend():
     backend.stop_run = AsyncMock(side_effect=stop_run)
     backend.is_running = MagicMock(side_effect=lambda rid: rid in active)
     backend.get_active_run_ids = MagicMock(side_effect=lambda: list(active))
+    type(backend).active_count = PropertyMock(side_effect=lambda: len(active))
     backend.remove = MagicMock(side_effect=lambda rid: active.discard(rid))
     return backend
 
@@ -84,6 +86,49 @@ class TestRunManager:
         assert exc_info.value.status_code == 429
         assert "per user" in str(exc_info.value.detail)
 
+    @pytest.mark.asyncio
+    async def test_concurrent_starts_respect_per_user_limit(self, manager, backend):
+        started = asyncio.Event()
+
+        async def slow_start(run_id, config):
+            started.set()
+            await asyncio.sleep(0.01)
+
+        backend.start_run = AsyncMock(side_effect=slow_start)
+        first = asyncio.create_task(manager.create_and_start_run(10, _make_config()))
+        await started.wait()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await manager.create_and_start_run(10, _make_config())
+        assert exc_info.value.status_code == 429
+        await first
+        backend.start_run.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_start_releases_reservation(self, manager, backend):
+        backend.start_run = AsyncMock(side_effect=RuntimeError("boom"))
+        with pytest.raises(RuntimeError):
+            await manager.create_and_start_run(10, _make_config())
+        assert manager.get_user_active_runs(10) == []
+        assert manager._starting == {}
+
+    @pytest.mark.asyncio
+    async def test_db_counts_enforce_limits(self, backend):
+        repo = MagicMock()
+        repo.count_active_runs = AsyncMock(return_value=(0, 3))
+        manager = RunManager(backend, max_runs_per_user=1, max_total_runs=3, repo=repo)
+
+        # Another process already runs 3: the DB count wins over local state
+        with pytest.raises(HTTPException) as exc_info:
+            await manager.create_and_start_run(10, _make_config())
+        assert "total" in str(exc_info.value.detail)
+
+        repo.count_active_runs = AsyncMock(return_value=(1, 1))
+        with pytest.raises(HTTPException) as exc_info:
+            await manager.create_and_start_run(10, _make_config())
+        assert "per user" in str(exc_info.value.detail)
+        backend.start_run.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_different_users_not_limited(self, manager):
         c1 = _make_config()
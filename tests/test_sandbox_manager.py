@@ -2,9 +2,17 @@
 
 import pytest
 import asyncio
+import threading
 
 from src.sandbox.manager import (
+    APICallTracker,
+    BASE_NAMESPACE,
+    SAFE_BUILTINS,
     SkillSandbox,
+    await_with_timeout,
+    compile_adhoc,
+    compile_cached,
+    validate_adhoc_code_cached,
     SandboxConfig,
     ExecutionResult,
 )
@@ -268,3 +276,279 @@ class TestSkillSandboxLifecycle:
         config = SandboxConfig(timeout_seconds=60.0)
         sandbox = SkillSandbox(config)
         assert sandbox.config.timeout_seconds == 60.0
+
+
+class TestBaseNamespace:
+    """Tests for the shared execution namespace template."""
+
+    @pytest.mark.asyncio
+    async def test_executions_do_not_leak_into_template(self):
+        """Test names defined by a skill stay in that execution's namespace."""
+        sandbox = SkillSandbox(SandboxConfig(timeout_seconds=5.0))
+        code = '''
+async def leaky_skill(nh, **params):
+    """Defines a module-level name."""
+    return SkillResult.stopped("done", success=True)
+'''
+        result = await sandbox.execute_local(code, "leaky_skill", {}, api=_FakeAPI())
+
+        assert result.success is True
+        assert "leaky_skill" not in BASE_NAMESPACE
+        assert "nh" not in BASE_NAMESPACE
+        assert BASE_NAMESPACE["__builtins__"] is SAFE_BUILTINS
+
+
+class TestSafeBuiltins:
+    """Tests for the shared restricted builtins mapping."""
+
+    def test_is_plain_dict(self):
+        """Test the builtins are a real dict, the only mapping CPython supports."""
+        assert type(SAFE_BUILTINS) is dict
+
+    @pytest.mark.asyncio
+    async def test_execution_gets_own_copy(self):
+        """Test code altering its builtins leaves the shared dict intact."""
+        sandbox = SkillSandbox(SandboxConfig(timeout_seconds=5.0))
+        result = await sandbox.execute_code("del __builtins__['len']", api=_FakeAPI())
+
+        assert result.success is True
+        assert SAFE_BUILTINS["len"] is len
+
+    @pytest.mark.asyncio
+    async def test_indented_import_raises_import_error(self):
+        """Test an import the line filter misses fails with ImportError."""
+        sandbox = SkillSandbox(SandboxConfig(timeout_seconds=5.0))
+        code = '''
+async def import_skill(nh, **params):
+    """Imports inside the function body."""
+    import math
+    return SkillResult.stopped("done", success=True)
+'''
+        result = await sandbox.execute_local(code, "import_skill", {}, api=_FakeAPI())
+
+        assert result.success is False
+        assert result.error == "__import__ not found"
+
+    def test_excludes_dangerous_builtins(self):
+        """Test file, import and eval builtins are not exposed."""
+        for name in ("open", "__import__", "eval", "exec", "compile"):
+            assert name not in SAFE_BUILTINS
+
+
+class TestAwaitWithTimeout:
+    """Tests for the coroutine timeout helper."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result(self):
+        """Test a coroutine finishing in time returns its value."""
+
+        async def quick():
+            return 7
+
+        assert await await_with_timeout(quick(), 1.0) == 7
+
+    @pytest.mark.asyncio
+    async def test_raises_on_expiry(self):
+        """Test a slow coroutine raises asyncio.TimeoutError."""
+        with pytest.raises(asyncio.TimeoutError):
+            await await_with_timeout(asyncio.sleep(10), 0.01)
+
+
+class TestCompileCached:
+    """Tests for the compiled code cache."""
+
+    def test_same_source_reuses_code_object(self):
+        """Test identical sources compile once."""
+        source = "x = 1 + 1\n"
+        assert compile_cached(source, "<test>") is compile_cached(source, "<test>")
+
+    def test_filename_is_part_of_key(self):
+        """Test the same source under another filename compiles separately."""
+        source = "y = 2\n"
+        assert compile_cached(source, "<a>").co_filename == "<a>"
+        assert compile_cached(source, "<b>").co_filename == "<b>"
+
+    def test_syntax_error_propagates(self):
+        """Test invalid sources still raise SyntaxError."""
+        with pytest.raises(SyntaxError):
+            compile_cached("def (:\n", "<bad>")
+
+
+class TestValidationCache:
+    """Tests for memoized validation."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_code_validated_once(self):
+        """Test a second identical execute_code call hits the cache."""
+        sandbox = SkillSandbox(SandboxConfig(timeout_seconds=5.0))
+        code = "return 'validation-cache-probe'"
+        await sandbox.execute_code(code, api=_FakeAPI())
+        hits = validate_adhoc_code_cached.cache_info().hits
+        result = await sandbox.execute_code(code, api=_FakeAPI())
+
+        assert result.result["return_value"] == "validation-cache-probe"
+        assert validate_adhoc_code_cached.cache_info().hits == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_cached_rejection_still_rejects(self):
+        """Test invalid code keeps failing validation on repeat."""
+        sandbox = SkillSandbox(SandboxConfig(timeout_seconds=5.0))
+        for _ in range(2):
+            result = await sandbox.execute_code("import os", api=_FakeAPI())
+            assert result.success is False
+            assert "Validation failed" in result.error
+
+
+class TestCompileAdhoc:
+    """Tests for compiling ad-hoc code into an async wrapper."""
+
+    def _run(self, code):
+        namespace = {}
+        exec(compile_adhoc(code), namespace)
+        return asyncio.run(namespace["__adhoc__"]())
+
+    def test_return_value(self):
+        """Test top-level return becomes the coroutine's result."""
+        assert self._run("x = 2\nreturn x * 3") == 6
+
+    def test_multiline_string_not_reindented(self):
+        """Test string literals spanning lines keep their exact content."""
+        assert self._run('return """a\nb"""') == "a\nb"
+
+    def test_line_numbers_match_source(self):
+        """Test errors point at the line in the submitted code."""
+        with pytest.raises(ZeroDivisionError) as exc_info:
+            self._run("x = 1\ny = x / 0")
+        assert exc_info.traceback[-1].lineno + 1 == 2
+
+    def test_empty_code(self):
+        """Test empty code compiles to a no-op."""
+        assert self._run("") is None
+
+
+class _FakeResult:
+    def __init__(self, success=True, error=None):
+        self.success = success
+        self.error = error
+
+
+class _FakeAPI:
+    turn = 42
+
+    def move(self, direction):
+        return _FakeResult()
+
+    def eat(self, item_letter=None):
+        return _FakeResult(success=False, error="ord() expected a character")
+
+
+class TestAPICallTracker:
+    """Tests for the API call tracking wrapper."""
+
+    def test_wrapper_is_cached_on_instance(self):
+        """Test method wrappers are built once and then read from the instance."""
+        tracker = APICallTracker(_FakeAPI())
+        first = tracker.move
+        assert "move" in vars(tracker)
+        assert tracker.move is first
+        assert first.__name__ == "move"
+
+    def test_cached_wrapper_still_tracks_calls(self):
+        """Test repeated calls through the cached wrapper are all recorded."""
+        tracker = APICallTracker(_FakeAPI())
+        tracker.move("E")
+        tracker.move("W")
+        assert [c["method"] for c in tracker.get_calls()] == ["move", "move"]
+
+    def test_non_callable_attributes_not_cached(self):
+        """Test plain attributes are proxied without being stored."""
+        tracker = APICallTracker(_FakeAPI())
+        assert tracker.turn == 42
+        assert "turn" not in vars(tracker)
+
+    def test_error_translation_includes_method(self):
+        """Test translated errors name the failing method."""
+        tracker = APICallTracker(_FakeAPI())
+        tracker.eat("apple")
+        [call] = tracker.get_failed_calls()
+        assert call["error"].startswith("Invalid item letter for eat().")
+
+    def test_error_translation_matches_anywhere(self):
+        """Test patterns match mid-message and unknown errors pass through."""
+        tracker = APICallTracker(_FakeAPI())
+        assert tracker._translate_error("Position (3, 4) is not walkable", "move_to") == (
+            "Target position is blocked (wall, boulder, closed door, or monster)."
+        )
+        assert tracker._translate_error("something odd", "move") == "something odd"
+
+
+class _ChattyAPI:
+    """Fake API whose only action floods the message history."""
+
+    def __init__(self):
+        self._message_history = ["old message"]
+
+    def chatter(self):
+        self._message_history.extend(["You hit the newt.", "You hit the newt."])
+
+    def flood(self):
+        self._message_history.append("You kill the newt!")
+        for i in range(250):
+            self._message_history.append(f"message {i % 50}")
+        self._message_history.append("What do you want to eat?")
+
+
+class TestExecuteCodeMessages:
+    """Tests for game message capture in execute_code."""
+
+    @pytest.mark.asyncio
+    async def test_long_history_keeps_early_kills_and_dedups(self):
+        """Test >200 new messages keep earlier kills, dedup, and drop prompts."""
+        sandbox = SkillSandbox(SandboxConfig(timeout_seconds=5.0))
+        result = await sandbox.execute_code("nh.flood()", api=_ChattyAPI())
+
+        messages = result.result["game_messages"]
+        assert messages[0] == "You kill the newt!"
+        assert sorted(messages[1:]) == sorted(f"message {i}" for i in range(50))
+        assert "old message" not in messages
+
+    @pytest.mark.asyncio
+    async def test_short_history_kept_verbatim(self):
+        """Test up to 200 new messages are returned as-is, repeats included."""
+        sandbox = SkillSandbox(SandboxConfig(timeout_seconds=5.0))
+        result = await sandbox.execute_code("nh.chatter()", api=_ChattyAPI())
+
+        assert result.result["game_messages"] == ["You hit the newt.", "You hit the newt."]
+
+    @pytest.mark.asyncio
+    async def test_print_is_captured(self, capsys):
+        """Test print output goes to the result, not the process stdout."""
+        sandbox = SkillSandbox(SandboxConfig(timeout_seconds=5.0))
+        code = "def show(x):\n    print('value', x, sep='=')\nshow(3)\nprint('done')"
+        result = await sandbox.execute_code(code, api=_FakeAPI())
+
+        assert result.success is True
+        assert result.stdout == "value=3\ndone\n"
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.asyncio
+    async def test_subsecond_timeout_stops_busy_loop(self):
+        """Test the signal timer interrupts a tight loop under a 1s timeout."""
+        sandbox = SkillSandbox(SandboxConfig(timeout_seconds=5.0))
+        with pytest.raises(SkillTimeoutError):
+            await sandbox.execute_code("while True:\n    pass", api=_FakeAPI(), timeout=0.2)
+
+    def test_runs_off_main_thread(self):
+        """Test execution from a worker thread skips the signal timer."""
+        sandbox = SkillSandbox(SandboxConfig(timeout_seconds=5.0))
+        results = []
+
+        def run():
+            results.append(asyncio.run(sandbox.execute_code("print('hi')", api=_FakeAPI())))
+
+        worker = threading.Thread(target=run)
+        worker.start()
+        worker.join()
+
+        assert results[0].success is True
+        assert results[0].stdout == "hi\n"
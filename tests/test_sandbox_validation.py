@@ -10,7 +10,7 @@ from src.sandbox.validation import (
     extract_skill_metadata,
     ValidationResult,
 )
-from src.sandbox.exceptions import SkillSyntaxError, SkillSecurityError
+from src.sandbox.exceptions import SkillExecutionError, SkillSyntaxError, SkillSecurityError
 
 
 class TestValidateSyntax:
@@ -52,6 +52,26 @@ def bar(:  # Invalid syntax on line 5
         assert exc_info.value.line > 0
 
 
+class TestSandboxExceptions:
+    """Tests for the slotted sandbox exception classes."""
+
+    def test_attributes_stored_in_slots(self):
+        """Exception attributes should not populate an instance __dict__."""
+        err = SkillSyntaxError("bad", skill_name="s", line=3, column=7)
+        assert vars(err) == {}
+        assert (err.skill_name, err.line, err.column) == ("s", 3, 7)
+        assert vars(SkillExecutionError("x")) == {}
+
+    def test_pickle_round_trip(self):
+        """Slot values should survive pickling."""
+        import pickle
+
+        err = pickle.loads(pickle.dumps(SkillSyntaxError("bad", skill_name="s", line=3)))
+        assert str(err) == "bad"
+        assert err.skill_name == "s"
+        assert err.line == 3
+
+
 class TestValidateSecurity:
     """Tests for security validation."""
 
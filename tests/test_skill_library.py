@@ -330,6 +330,29 @@ class TestSkillLibraryAddFromCode:
             library.add_from_code("invalid", "not valid python", persist=False)
 
 
+class TestSkillLibraryCopy:
+    """Tests for copying a loaded library."""
+
+    def test_copy_shares_skills(self, library, sample_skill_code):
+        """Test the copy sees the same skill objects."""
+        library.add_from_code("test_skill", sample_skill_code, persist=False)
+
+        clone = library.copy()
+
+        assert clone.skills_dir == library.skills_dir
+        assert clone.get("test_skill") is library.get("test_skill")
+        assert clone.list_names() == library.list_names()
+
+    def test_copy_is_independent(self, library, sample_skill_code):
+        """Test skills added to the copy do not leak into the original."""
+        clone = library.copy()
+        clone.add_from_code("test_skill", sample_skill_code, persist=False)
+
+        assert clone.exists("test_skill")
+        assert not library.exists("test_skill")
+        assert library.list_names() == []
+
+
 class TestSkillLibraryMetadata:
     """Tests for skill metadata handling."""
 
@@ -4,6 +4,7 @@ import pytest
 import time
 
 from src.tui.events import (
+    CODE_PREVIEW_CHARS,
     DecisionMade,
     SkillExecuted,
     GameStateUpdated,
@@ -48,6 +49,28 @@ class TestDecisionMade:
 
         assert event.decision.code is not None
         assert event.decision.action == ActionType.WRITE_SKILL
+        assert event.code_preview == "async def flee(nh): pass"
+
+    def test_code_preview_truncated(self):
+        """Test long code is truncated once when the event is built."""
+        code = "x = 1\n" * 1000
+        decision = AgentDecision(
+            action=ActionType.EXECUTE_CODE,
+            code=code,
+            reasoning="Long script",
+        )
+        event = DecisionMade(decision=decision, turn=1, timestamp=time.time())
+
+        assert event.code_preview.startswith(code[:CODE_PREVIEW_CHARS])
+        assert event.code_preview.endswith("# ... (truncated)")
+        assert event.decision.code == code
+
+    def test_code_preview_empty_without_code(self):
+        """Test decisions without code get an empty preview."""
+        decision = AgentDecision(action=ActionType.INVOKE_SKILL, skill_name="explore")
+        event = DecisionMade(decision=decision, turn=1, timestamp=time.time())
+
+        assert event.code_preview == ""
 
 
 class TestSkillExecuted:
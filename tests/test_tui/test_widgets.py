@@ -19,6 +19,24 @@ from src.tui.events import (
 from src.agent.parser import ActionType, AgentDecision
 
 
+def _state_event(**overrides) -> GameStateUpdated:
+    """Build a GameStateUpdated with defaults for widget tests."""
+    fields = dict(
+        screen="",
+        hp=10,
+        max_hp=20,
+        turn=50,
+        dungeon_level=2,
+        depth=2,
+        xp_level=1,
+        score=100,
+        message="Test",
+        hunger="Not Hungry",
+    )
+    fields.update(overrides)
+    return GameStateUpdated(**fields)
+
+
 class TestStatsBar:
     """Tests for StatsBar widget."""
 
@@ -36,6 +54,40 @@ class TestStatsBar:
         assert widget._score == 0
         assert widget._hunger == "Not Hungry"
 
+    def test_unchanged_stats_skip_rerender(self):
+        """Test repeating the same state does not rebuild the display."""
+        widget = StatsBar()
+        event = _state_event()
+        with patch.object(widget, "update") as mock_update:
+            widget.on_game_state_updated(event)
+            widget.on_game_state_updated(event)
+        mock_update.assert_called_once()
+
+    def test_rendered_text(self):
+        """Test the status line text and segment styles."""
+        widget = StatsBar()
+        with patch.object(widget, "update") as mock_update:
+            widget.on_game_state_updated(_state_event(hp=4, message="You feel hungry."))
+        text = mock_update.call_args.args[0]
+        pct = f"{widget._progress.progression_percent:.2f}%"
+
+        assert text.plain == (
+            f"HP: 4/20 | Turn: 50 | DL:2 | XL:1 | BALROG: {pct} | Not Hungry\nYou feel hungry."
+        )
+        styles = {text.plain[span.start : span.end]: str(span.style) for span in text.spans}
+        assert styles["HP: "] == "bold"
+        assert styles["4/20"] == "red bold"
+        assert styles["Not Hungry"] == "green"
+        assert styles["\nYou feel hungry."] == "italic"
+
+    def test_changed_stats_rerender(self):
+        """Test a changed value rebuilds the display."""
+        widget = StatsBar()
+        with patch.object(widget, "update") as mock_update:
+            widget.on_game_state_updated(_state_event(turn=1))
+            widget.on_game_state_updated(_state_event(turn=2))
+        assert mock_update.call_count == 2
+
 
 class TestGameScreenWidget:
     """Tests for GameScreenWidget."""
@@ -53,6 +105,23 @@ class TestGameScreenWidget:
         assert len(lines) == 24
         assert all(len(line) == 80 for line in lines)
 
+    def test_identical_frame_skips_update(self):
+        """Test an unchanged screen does not trigger a re-render."""
+        widget = GameScreenWidget()
+        event = _state_event(screen=widget.EMPTY_SCREEN)
+        with patch.object(widget, "update") as mock_update:
+            widget.on_game_state_updated(event)
+        mock_update.assert_not_called()
+
+    def test_changed_frame_updates(self):
+        """Test a new screen is stored and rendered."""
+        widget = GameScreenWidget()
+        event = _state_event(screen="@" + " " * 79)
+        with patch.object(widget, "update") as mock_update:
+            widget.on_game_state_updated(event)
+        mock_update.assert_called_once_with(event.screen)
+        assert widget._screen == event.screen
+
 
 class TestDecisionLogWidget:
     """Tests for DecisionLogWidget."""
@@ -0,0 +1,196 @@
+"""Tests for the FastAPI application factory."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.cache import TTLCache
+from src.web import app as app_module
+from src.web.responses import OrjsonResponse
+
+
+@pytest.fixture
+def frontend_dist(tmp_path, monkeypatch):
+    (tmp_path / "index.html").write_text("<html>spa</html>")
+    (tmp_path / "app.js").write_text("console.log('hi')")
+    monkeypatch.setattr(app_module, "FRONTEND_DIST", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def client(frontend_dist):
+    # Not used as a context manager, so the DB-backed lifespan never runs
+    return TestClient(app_module.create_app())
+
+
+class TestLifespan:
+    def test_cli_preset_repo_is_warmed_and_refreshed(self, frontend_dist, monkeypatch):
+        """``serve`` sets app.state.repo before the lifespan runs."""
+        from src.config import Config
+
+        monkeypatch.setattr("src.config.load_config", Config)
+        engine = AsyncMock()
+        repo = MagicMock(warm_up=AsyncMock())
+        app = app_module.create_app(engine=engine)
+        app.state.repo = repo
+        app.state.http_client = AsyncMock()
+        app.state.notifier = AsyncMock()
+        app.state.run_manager = AsyncMock()
+
+        with TestClient(app):
+            repo.warm_up.assert_awaited_once_with(Config().database.pool_min_size)
+            repo.schedule_leaderboard_refresh.assert_called_once_with(delay=0)
+        engine.dispose.assert_awaited_once()
+
+
+class TestSpaFallback:
+    def test_serves_static_file(self, client):
+        resp = client.get("/app.js")
+        assert resp.status_code == 200
+        assert "console.log" in resp.text
+
+    def test_unknown_frontend_path_serves_index(self, client):
+        resp = client.get("/runs/abc123")
+        assert resp.status_code == 200
+        assert resp.text == "<html>spa</html>"
+
+    def test_unknown_api_path_stays_404(self, client):
+        resp = client.get("/api/does-not-exist")
+        assert resp.status_code == 404
+        assert resp.json() == {"detail": "Not Found"}
+
+    def test_index_served_from_memory(self, client, frontend_dist):
+        (frontend_dist / "index.html").write_text("<html>changed</html>")
+        resp = client.get("/somewhere")
+        assert resp.text == "<html>spa</html>"
+        assert resp.headers["content-type"].startswith("text/html")
+
+    def test_index_not_modified(self, client):
+        etag = client.get("/somewhere").headers["etag"]
+        resp = client.get("/elsewhere", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+
+class TestAuthErrors:
+    def test_error_body_and_headers(self, client):
+        for _ in range(2):
+            resp = client.get("/api/auth/me", headers={"Origin": "http://example.com"})
+            assert resp.status_code == 501
+            assert resp.json() == {"error": "Authentication is not configured"}
+            assert resp.headers["content-type"] == "application/json"
+            assert resp.headers.get_list("access-control-allow-origin") == ["http://example.com"]
+
+    def test_logout_ok(self, client):
+        resp = client.post("/api/auth/logout")
+        assert resp.status_code == 200
+        assert resp.json() == {"ok": True}
+
+
+def test_default_response_class_is_orjson(client):
+    assert client.app.router.default_response_class is OrjsonResponse
+
+
+class TestModelsCache:
+    @pytest.fixture
+    def models_client(self, client, monkeypatch):
+        from cryptography.fernet import Fernet
+
+        from src.config import AuthConfig
+        from src.persistence.models import UserRecord
+        from src.web import routes
+        from src.web.auth import encrypt_key
+        from src.web.deps import get_current_user, get_http_client
+
+        key = Fernet.generate_key().decode()
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"data": [{"id": "m/1", "name": "One"}]})
+
+        outbound = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        user = UserRecord(openrouter_id="u1", id=1, encrypted_openrouter_key=encrypt_key("sk", key))
+        client.app.state.auth_config = AuthConfig(session_secret="s", encryption_key=key)
+        client.app.dependency_overrides[get_current_user] = lambda: user
+        client.app.dependency_overrides[get_http_client] = lambda: outbound
+        monkeypatch.setattr(routes, "_models_cache", TTLCache(routes.MODELS_CACHE_TTL, 1))
+        client.calls = calls
+        return client
+
+    def test_second_request_served_from_cache(self, models_client):
+        first = models_client.get("/api/models")
+        second = models_client.get("/api/models")
+        assert first.status_code == second.status_code == 200
+        assert second.json() == [
+            {
+                "id": "m/1",
+                "name": "One",
+                "context_length": 0,
+                "pricing": {"prompt": "0", "completion": "0"},
+            }
+        ]
+        assert len(models_client.calls) == 1
+
+    def test_not_modified(self, models_client):
+        etag = models_client.get("/api/models").headers["etag"]
+        resp = models_client.get("/api/models", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+
+class TestRunModelsCache:
+    def test_second_request_served_from_cache(self, client, monkeypatch):
+        from src.web import routes
+        from src.web.deps import get_repo
+
+        calls = []
+
+        class FakeRepo:
+            async def list_distinct_models(self):
+                calls.append(1)
+                return ["a/model", "b/model"]
+
+        client.app.dependency_overrides[get_repo] = lambda: FakeRepo()
+        monkeypatch.setattr(routes, "_run_models_cache", TTLCache(routes.RUN_MODELS_CACHE_TTL, 1))
+
+        first = client.get("/api/runs/models")
+        second = client.get("/api/runs/models")
+        assert first.status_code == second.status_code == 200
+        assert second.json() == ["a/model", "b/model"]
+        assert len(calls) == 1
+
+
+class TestStreamedTurns:
+    @pytest.fixture
+    def turns_client(self, client):
+        from src.web.deps import get_repo
+
+        class FakeRepo:
+            async def stream_turns_page(self, run_id, after_turn=0, limit=100):
+                if run_id != "run-1":
+                    return None
+
+                async def turns():
+                    for n in range(after_turn + 1, after_turn + 4):
+                        yield {"turn_number": n}
+
+                return turns(), 7
+
+        client.app.dependency_overrides[get_repo] = lambda: FakeRepo()
+        return client
+
+    def test_large_page_is_streamed(self, turns_client):
+        resp = turns_client.get("/api/runs/run-1/turns", params={"after": 2, "limit": 200})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == {
+            "run_id": "run-1",
+            "turns": [{"turn_number": 3}, {"turn_number": 4}, {"turn_number": 5}],
+            "total": 7,
+        }
+
+    def test_streamed_missing_run(self, turns_client):
+        resp = turns_client.get("/api/runs/nope/turns", params={"limit": 200})
+        assert resp.status_code == 404